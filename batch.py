@@ -0,0 +1,144 @@
+"""Refresh the badges of many Credly users / repositories in one process.
+
+The config is a JSON file:
+
+    {
+      "concurrency": 4,
+      "targets": [
+        {"credly_user": "alice", "repository": "alice/alice", "credly_api_token_env": "ALICE_CREDLY_TOKEN"},
+        {"credly_user": "bob", "repository": "team/site", "credly_api_token_env": "BOB_CREDLY_TOKEN",
+         "commit_message": "Update Bob's badges"}
+      ]
+    }
+
+Targets run on a bounded thread pool and share the HTTP connection pool,
+the organization registry and the on-disk caches. Tokens are read from the
+environment variables named in the config, never from the file itself;
+every target needs its own, since the Credly API answers for whoever owns
+the token. Incremental state and badge store paths are per target: set
+`incremental_state` / `badge_store` on the target, or the global
+INCREMENTAL_STATE / BADGE_STORE path gets the Credly user appended.
+"""
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from settings import (
+    GH_API_URL,
+    GH_TOKEN,
+    GH_PUBLISHER,
+    BATCH_CONCURRENCY,
+    BATCH_REPORT,
+    INCREMENTAL_STATE,
+    BADGE_STORE,
+)
+from services.credly import Credly
+from main import update_readme, default_repo
+
+
+def load_targets(path):
+    with open(path, "r", encoding="utf-8") as fh:
+        config = json.load(fh)
+    return config.get("targets", []), int(config.get("concurrency", BATCH_CONCURRENCY))
+
+
+def target_path(target, key, default):
+    """The target's own `key` path, or `default` with the Credly user appended, e.g. state-alice.json."""
+    if target.get(key):
+        return target[key]
+    if not default:
+        return ""
+    root, ext = os.path.splitext(default)
+    return f"{root}-{target.get('credly_user')}{ext}"
+
+
+def shared_paths(targets):
+    """State and store paths that more than one target would write to."""
+    seen = {}
+    for target in targets:
+        for key, default in (("incremental_state", INCREMENTAL_STATE), ("badge_store", BADGE_STORE)):
+            path = target_path(target, key, default)
+            if path:
+                seen.setdefault(os.path.abspath(path), []).append(target)
+    return {path for path, users in seen.items() if len(users) > 1}
+
+
+def run_target(target, github=None, shared=frozenset()):
+    """Update one target, returns its entry of the report."""
+    result = {
+        "credly_user": target.get("credly_user"),
+        "repository": target.get("repository"),
+        "status": None,
+        "badges": 0,
+        "seconds": 0.0,
+    }
+    start = time.perf_counter()
+    try:
+        token_env = target.get("credly_api_token_env")
+        api_token = os.getenv(token_env) if token_env else None
+        if not api_token:
+            # Never fall back to the action's token: its owner's badges would land in this repository
+            raise ValueError("no Credly token, set credly_api_token_env to a non-empty environment variable")
+        incremental_state = target_path(target, "incremental_state", INCREMENTAL_STATE)
+        badge_store = target_path(target, "badge_store", BADGE_STORE)
+        for path in (incremental_state, badge_store):
+            if path and os.path.abspath(path) in shared:
+                raise ValueError(f"{path} is used by more than one target")
+        credly = Credly(
+            user=target.get("credly_user"),
+            api_token=api_token,
+            incremental_state=incremental_state,
+            badge_store=badge_store,
+        )
+        credly.metrics.start()
+        try:
+            result["status"] = update_readme(
+                credly,
+                lambda: default_repo(target["repository"], target.get("commit_message"), github),
+                target["repository"],
+            )
+        finally:
+            credly.metrics.stop()
+        result["badges"] = credly.badge_count
+        result["metrics"] = credly.metrics_report(result["status"])
+    except (Exception, SystemExit) as e:
+        # GithubRepo exits on authentication errors; in a batch that only fails this target
+        result["status"] = "error"
+        result["error"] = f"{e.__class__.__name__}: {e}"
+    result["seconds"] = round(time.perf_counter() - start, 3)
+    return result
+
+
+def run_batch(config_path, report_path=BATCH_REPORT):
+    """Run every target of the config, write the report and return the process exit code."""
+    targets, concurrency = load_targets(config_path)
+
+    github = None
+    if GH_PUBLISHER != "git-data":
+        from github import Github
+        github = Github(base_url=GH_API_URL, login_or_token=GH_TOKEN)
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        shared = shared_paths(targets)
+        results = list(executor.map(lambda target: run_target(target, github, shared), targets))
+
+    report = {
+        "targets": len(results),
+        "failed": sum(result["status"] == "error" for result in results),
+        "results": results,
+    }
+    with open(report_path, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+
+    for result in results:
+        print(f"{result['credly_user']} -> {result['repository']}: {result['status']} ({result['seconds']} s)")
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python batch.py <config.json> [report.json]")
+        sys.exit(2)
+    sys.exit(run_batch(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else BATCH_REPORT))
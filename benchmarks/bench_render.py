@@ -0,0 +1,57 @@
+"""Render benchmark for the streaming markdown renderer.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_render 10000 50000
+"""
+import io
+import os
+import sys
+import time
+import contextlib
+
+from services.credly import Credly
+
+ISSUERS = ["Amazon Web Services Training and Certification", "Cisco", "IBM", "Google Cloud",
+           "The Linux Foundation", "Red Hat", "Unknown Issuer"]
+
+
+def synthetic_badges(count, issuers=ISSUERS):
+    words = "cloud native security data platform skills design operate automate".split()
+    return [
+        {
+            "title": f"Badge {i}",
+            "href": f"https://www.credly.com/org/badge/badge-{i}",
+            "img": f"https://images.credly.com/size/110x110/images/{i}/blob.png",
+            "issuer": issuers[i % len(issuers)],
+            "description": " ".join(words[(i + j) % len(words)] for j in range(30)),
+            "time_to_earn": "Hours",
+            "skills": words[: i % 8],
+            "criteria": " ".join(words[(i + j) % len(words)] for j in range(25)),
+            "level": "Foundational",
+        }
+        for i in range(count)
+    ]
+
+
+def bench(count):
+    badges = synthetic_badges(count)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        credly = Credly()
+        start = time.perf_counter()
+        markdown = credly.generate_md_format(badges)
+        rendered = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with open(os.devnull, "w", encoding="utf-8") as sink:
+        credly.write_md_format(badges, sink)
+    streamed = time.perf_counter() - start
+
+    print(f"{count:>8} badges  {len(markdown) / 1e6:8.2f} MB  "
+          f"generate_md_format {rendered * 1000:8.1f} ms  write_md_format {streamed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    for count in (int(arg) for arg in sys.argv[1:] or ["10000"]):
+        bench(count)
@@ -0,0 +1,91 @@
+"""Synthetic Credly API payloads for the benchmarks and the local servers."""
+import json
+from datetime import datetime, timedelta
+
+from benchmarks.bench_render import ISSUERS
+
+NEWEST = datetime(2025, 1, 1)
+WORDS = "cloud native security data platform skills design operate automate".split()
+
+
+def issuer_names(count):
+    """`count` issuer names, the known organizations first, then generated ones."""
+    names = ISSUERS[:count]
+    return names + [f"Synthetic Issuer {i:04d}" for i in range(len(names), count)]
+
+
+def api_badges(count, issuers=10, templates=None):
+    """`count` badges shaped like `/users/self/badges` entries, newest first.
+
+    Badges cycle over `issuers` issuers and `templates` badge templates
+    (one template per badge by default), with the nested fields the API
+    returns and the renderer never reads, so decoding costs look real.
+    """
+    names = issuer_names(max(1, issuers))
+    templates = templates or count
+    badges = []
+    for i in range(count):
+        t = i % templates
+        issuer = names[t % len(names)]
+        issued = (NEWEST - timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        badges.append({
+            "id": f"badge-{i:06d}",
+            "state": "accepted",
+            "issued_at": issued,
+            "state_updated_at": issued,
+            "public": True,
+            "image": {"id": f"image-{t}", "url": f"https://images.credly.com/images/{t}/image.png"},
+            "issued_to": "Benchmark User",
+            "issuer": {
+                "summary": f"issued by {issuer}",
+                "entities": [{
+                    "label": "Issued by",
+                    "primary": True,
+                    "entity": {"type": "Organization", "id": f"org-{t % len(names)}", "name": issuer,
+                               "url": "https://www.credly.com/api/v1/organizations/x", "vanity_url": "https://www.credly.com/org/x"},
+                }],
+            },
+            "badge_template": {
+                "id": f"template-{t:06d}",
+                "name": f"Badge {t}",
+                "url": f"https://www.credly.com/org/badge/badge-{t}",
+                "image_url": f"https://images.credly.com/images/{t}/blob.png",
+                "description": " ".join(WORDS[(t + j) % len(WORDS)] for j in range(30)),
+                "time_to_earn": "Hours",
+                "level": "Foundational",
+                "skills": WORDS[: t % 8],
+                "type_category": "Learning",
+                "global_activity_url": f"https://www.credly.com/org/badge/badge-{t}",
+                "earn_this_badge_url": None,
+                "enable_earn_this_badge": False,
+                "enable_detail_attribute_visibility": True,
+                "badge_template_activities": [
+                    {"id": f"activity-{t}-{k}", "activity_type": "Assessment", "required_badge_template_id": None,
+                     "title": " ".join(WORDS[(t + k + j) % len(WORDS)] for j in range(8)), "url": None}
+                    for k in range(3)
+                ],
+                "owner": {"type": "Organization", "id": f"org-{t % len(names)}", "name": issuer, "vanity_slug": "x"},
+            },
+            "evidence": [],
+            "recipient_email": "user@example.com",
+        })
+    return badges
+
+
+def page_body(badges, page, per_page, base_url):
+    """JSON text of one page of `badges`, with the API's pagination metadata."""
+    total_pages = max(1, -(-len(badges) // per_page))
+    next_page = f"{base_url}?page={page + 1}" if page < total_pages else None
+    previous_page = f"{base_url}?page={page - 1}" if page > 1 else None
+    return json.dumps({
+        "data": badges[(page - 1) * per_page:page * per_page],
+        "metadata": {
+            "count": len(badges),
+            "current_page": page,
+            "total_count": len(badges),
+            "total_pages": total_pages,
+            "per": per_page,
+            "previous_page_url": previous_page,
+            "next_page_url": next_page,
+        },
+    })
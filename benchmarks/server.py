@@ -0,0 +1,172 @@
+"""A local stand-in for the Credly `/users/self/badges` API.
+
+Serves a synthetic payload with the API's pagination shape
+(`metadata.next_page_url`), with optional latency, jitter, 429 / 5xx
+injection and ETag revalidation. Point any fetcher at it through
+CREDLY_BASE_URL:
+
+    python -m benchmarks.server --badges 5000 --issuers 50 --latency 0.2 --error-rate 0.05
+    INPUT_CREDLY_BASE_URL=http://127.0.0.1:8123/v1/users/self/badges python main.py
+"""
+import argparse
+import hashlib
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.payload import api_badges, page_body
+
+BADGES_PATH = "/users/self/badges"
+
+
+class BadgeServer:
+    """Serves `badges` `per_page` at a time; page bodies and ETags are built once, up front.
+
+    `latency` and `jitter` (seconds) delay every answer. `rate_limit_rate`
+    and `error_rate` answer that share of requests with 429 (with a
+    `Retry-After` of `retry_after` seconds) or 503 instead; `seed` makes the
+    injected faults reproducible. With `token`, requests without that bearer
+    token get 401. Counters: `requests`, `statuses` and `peak_in_flight`.
+    """
+
+    def __init__(self, badges, per_page=50, latency=0.0, jitter=0.0, rate_limit_rate=0.0,
+                 error_rate=0.0, retry_after=1, etag=True, token=None, host="127.0.0.1", port=0, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_rate = rate_limit_rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.etag = etag
+        self.token = token
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.statuses = Counter()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server.handle(self)
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://{host}:{self.server.server_port}/v1{BADGES_PATH}"
+        total_pages = max(1, -(-len(badges) // per_page))
+        self.pages = [page_body(badges, page, per_page, self.url).encode("utf-8") for page in range(1, total_pages + 1)]
+        self.etags = [f'"{hashlib.sha1(body).hexdigest()}"' for body in self.pages]
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def fault(self):
+        """429, 503 or None for the next request, drawn from the seeded generator."""
+        with self.lock:
+            draw = self.random.random()
+            delay = self.latency + (self.random.uniform(-self.jitter, self.jitter) if self.jitter else 0.0)
+        if draw < self.rate_limit_rate:
+            return 429, delay
+        if draw < self.rate_limit_rate + self.error_rate:
+            return 503, delay
+        return None, delay
+
+    def handle(self, request):
+        with self.lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        status = 500
+        try:
+            status, headers, body = self.answer(request)
+            request.send_response(status)
+            for name, value in headers.items():
+                request.send_header(name, value)
+            request.send_header("Content-Length", str(len(body)))
+            request.end_headers()
+            request.wfile.write(body)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+                self.statuses[status] += 1
+
+    def answer(self, request):
+        """(status, headers, body) for one request."""
+        status, delay = self.fault()
+        if delay > 0:
+            time.sleep(delay)
+
+        url = urlparse(request.path)
+        if not url.path.endswith(BADGES_PATH):
+            return 404, {}, b'{"message": "Not Found"}'
+        if self.token and request.headers.get("Authorization") != f"Bearer {self.token}":
+            return 401, {}, b'{"message": "Unauthorized"}'
+        if status == 429:
+            return 429, {"Retry-After": str(self.retry_after)}, b'{"message": "Too Many Requests"}'
+        if status == 503:
+            return 503, {}, b'{"message": "Service Unavailable"}'
+
+        try:
+            page = int(parse_qs(url.query).get("page", ["1"])[0])
+        except ValueError:
+            page = 0
+        if not 0 < page <= len(self.pages):
+            return 404, {}, b'{"message": "Not Found"}'
+
+        headers = {"Content-Type": "application/json"}
+        if self.etag:
+            headers["ETag"] = self.etags[page - 1]
+            if request.headers.get("If-None-Match") == self.etags[page - 1]:
+                return 304, headers, b""
+        return 200, headers, self.pages[page - 1]
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local stand-in for the Credly badges API.")
+    parser.add_argument("--badges", type=int, default=1000, help="number of badges served")
+    parser.add_argument("--issuers", type=int, default=10, help="number of distinct issuers")
+    parser.add_argument("--per-page", type=int, default=50, help="badges per page")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every answer")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random +/- seconds around the latency")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="share of requests answered 429")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered 503")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429")
+    parser.add_argument("--no-etag", action="store_true", help="do not send ETags nor answer 304")
+    parser.add_argument("--token", help="only accept this bearer token")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8123)
+    parser.add_argument("--seed", type=int, default=0, help="seed of the injected faults and jitter")
+    options = parser.parse_args(argv)
+
+    server = BadgeServer(
+        api_badges(options.badges, options.issuers), options.per_page, options.latency, options.jitter,
+        options.rate_limit_rate, options.error_rate, options.retry_after, not options.no_etag,
+        options.token, options.host, options.port, options.seed,
+    )
+    print(f"Serving {options.badges} badges in {len(server.pages)} pages at {server.url}")
+    print(f"Use it with INPUT_CREDLY_BASE_URL={server.url}")
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server.server_close()
+        print(f"{server.requests} requests, statuses {dict(server.statuses)}, peak in flight {server.peak_in_flight}")
+
+
+if __name__ == "__main__":
+    main()
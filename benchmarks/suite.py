@@ -0,0 +1,228 @@
+"""Stage-by-stage benchmark of the badge pipeline, with a regression check for CI.
+
+Run from the repository root:
+
+    python -m benchmarks.suite --badges 100,1000,10000 --issuers 10 --output bench.json
+    python -m benchmarks.suite --baseline bench.json --threshold 0.25   # exits 1 on regressions
+
+Every stage gets its input prepared beforehand and is measured on its own:
+the best wall time over `--repeat` runs, then the peak memory of one more
+run under tracemalloc (tracing slows code down, so it is never timed).
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from unittest.mock import patch
+
+from benchmarks.payload import api_badges
+from benchmarks.server import BadgeServer
+
+STAGES = ("fetch", "convert", "group", "render", "splice", "recent")
+
+README = (
+    "# Badges\n\nSome text about me.\n\n"
+    "<!--START_SECTION:badges-->\n<!--END_SECTION:badges-->\n\n"
+    "More text after the badges.\n"
+)
+
+
+def new_credly():
+    from services.credly import Credly
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        return Credly()
+
+
+def reset_templates():
+    # Badge templates are shared process-wide; start every convert run cold
+    import services.badge
+
+    services.badge._TEMPLATES.clear()
+
+
+def converted(raw):
+    reset_templates()
+    credly = new_credly()
+    return credly, [credly.convert_to_dict(badge) for badge in raw]
+
+
+def setup_fetch(raw, options):
+    credly = new_credly()
+    credly.CONCURRENCY = options.concurrency
+    server = BadgeServer(raw, options.per_page)
+    credly.BASE_URL = server.url
+
+    @contextlib.contextmanager
+    def running():
+        with server, patch("services.credly.CREDLY_RATE_LIMIT", new=0):
+            yield lambda: credly.fetch_badges()
+
+    return running()
+
+
+def setup_convert(raw, options):
+    credly = new_credly()
+
+    def run():
+        reset_templates()
+        return [credly.convert_to_dict(badge) for badge in raw]
+
+    return contextlib.nullcontext(run)
+
+
+def setup_group(raw, options):
+    credly, badges = converted(raw)
+    return contextlib.nullcontext(lambda: credly.group_badges(badges))
+
+
+def setup_render(raw, options):
+    credly, badges = converted(raw)
+    grouped = credly.group_badges(badges)
+    return contextlib.nullcontext(lambda: "".join(credly.iter_grouped_md_format(grouped)))
+
+
+def setup_splice(raw, options):
+    from main import generate_new_readme
+
+    credly, badges = converted(raw)
+    markdown = "".join(credly.iter_md_format(badges))
+    return contextlib.nullcontext(lambda: generate_new_readme(markdown, README))
+
+
+def setup_recent(raw, options):
+    from main import generate_new_readme
+    from services.recent import CredlyUpdater
+
+    credly, badges = converted(raw)
+    # The newest tenth of the badges are new; the README already lists the rest
+    split = max(1, len(badges) // 10)
+    readme = generate_new_readme("".join(credly.iter_md_format(badges[split:])), README)
+    updater = CredlyUpdater("benchmark-token")
+    return contextlib.nullcontext(lambda: updater.update_readme_with_new_badges(readme, badges[:split]))
+
+
+SETUPS = {
+    "fetch": setup_fetch,
+    "convert": setup_convert,
+    "group": setup_group,
+    "render": setup_render,
+    "splice": setup_splice,
+    "recent": setup_recent,
+}
+
+
+def measure(stage, raw, options):
+    """(best seconds, peak traced bytes) for one stage on one payload."""
+    with SETUPS[stage](raw, options) as run, contextlib.redirect_stdout(io.StringIO()):
+        best = None
+        for _ in range(options.repeat):
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        tracemalloc.start()
+        try:
+            run()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return best, peak
+
+
+def run_suite(options):
+    results = []
+    for issuers in options.issuers:
+        for count in options.badges:
+            raw = api_badges(count, issuers)
+            for stage in options.stages:
+                seconds, peak = measure(stage, raw, options)
+                results.append({
+                    "stage": stage,
+                    "badges": count,
+                    "issuers": issuers,
+                    "seconds": round(seconds, 6),
+                    "peak_bytes": peak,
+                })
+                print(f"{stage:>8} {count:>7} badges {issuers:>5} issuers "
+                      f"{seconds * 1000:10.2f} ms {peak / 1024:12.1f} KiB")
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def regressions(report, baseline, threshold, min_seconds=0.002, min_bytes=64 * 1024):
+    """Results slower or larger than the matching baseline result by more than `threshold`.
+
+    Differences below `min_seconds` / `min_bytes` are noise and never count.
+    """
+    previous = {(r["stage"], r["badges"], r["issuers"]): r for r in baseline.get("results", [])}
+    found = []
+    for result in report["results"]:
+        base = previous.get((result["stage"], result["badges"], result["issuers"]))
+        if base is None:
+            continue
+        for field, floor in (("seconds", min_seconds), ("peak_bytes", min_bytes)):
+            before, after = base[field], result[field]
+            if after > before * (1 + threshold) and after - before > floor:
+                found.append(f"{result['stage']} ({result['badges']} badges, {result['issuers']} issuers): "
+                             f"{field} {before} -> {after}")
+    return found
+
+
+def parse_args(argv):
+    sizes = lambda value: [int(part) for part in value.split(",") if part]
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--badges", type=sizes, default=[100, 1000, 10000], help="badge counts, e.g. 100,1000,100000")
+    parser.add_argument("--issuers", type=sizes, default=[10], help="issuer counts, e.g. 1,10,1000")
+    parser.add_argument("--stages", type=lambda value: value.split(","), default=list(STAGES),
+                        help=f"comma separated subset of {','.join(STAGES)}")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per stage, the best one is kept")
+    parser.add_argument("--per-page", type=int, default=50, help="badges per page served to the fetch stage")
+    parser.add_argument("--concurrency", type=int, default=4, help="CREDLY_CONCURRENCY used by the fetch stage")
+    parser.add_argument("--output", default="benchmark-results.json", help="where to write the JSON report")
+    parser.add_argument("--baseline", help="JSON report to compare with; regressions make the exit status 1")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed relative slowdown / growth")
+    options = parser.parse_args(argv)
+    unknown = set(options.stages) - set(STAGES)
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(sorted(unknown))}")
+    return options
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    baseline = None
+    if options.baseline:
+        # Read first: the baseline may be the file this run writes
+        with open(options.baseline, "r", encoding="utf-8") as fh:
+            baseline = json.load(fh)
+
+    report = run_suite(options)
+    directory = os.path.dirname(options.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(options.output, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+    print(f"Results written to {options.output}")
+
+    if baseline is not None:
+        found = regressions(report, baseline, options.threshold)
+        for line in found:
+            print(f"Regression: {line}")
+        if found:
+            return 1
+        print(f"No regression beyond {options.threshold:.0%} against {options.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,23 +1,171 @@
-import re
-from settings import START_COMMENT, END_COMMENT, LIST_REGEX
+import os
+import sys
+from settings import (
+    BATCH_CONFIG,
+    BATCH_REPORT,
+    GH_PUBLISHER,
+    CACHE_DIR,
+    REPOSITORY,
+    MIRROR_IMAGES,
+    ASSETS_DIR,
+    BADGE_SIZE,
+    SITE_DIR,
+    SITE_SHARD_SIZE,
+    METRICS_FILE,
+    METRICS_SUMMARY,
+    PROFILE,
+    PROFILE_OUTPUT,
+)
+from services.readme_splice import splice, splice_sections, find_sections, git_blob_sha
+from services.render_state import RenderState, bodies_hash
+from services.assets import ImageMirror, cache_path
+from services.static_site import StaticSite
+from services.metrics import profiled, write_json, write_step_summary
+from services.views import render_view
 from services.credly import Credly
-from services.githubRepo import GithubRepo
 
 
 def generate_new_readme(md_badges, readme):
     """Generate a new Readme.md"""
     if not md_badges:
         return readme
-    badges_in_readme = f"{START_COMMENT}\n{md_badges}\n{END_COMMENT}"
 
-    return re.sub(LIST_REGEX, badges_in_readme, readme)
+    return splice(readme, md_badges)
+
+
+def render_sections(credly, badges, names, bodies=None, mirror=None):
+    """Render the named sections not already in `bodies`, pointing images to `mirror` when given."""
+    bodies = dict(bodies or {})
+    for name in names:
+        if name not in bodies:
+            bodies[name] = render_view(credly, name, badges)
+            if mirror:
+                bodies[name] = mirror.rewrite(bodies[name])
+    return bodies
+
+
+def generate_new_readme_sections(credly, badges, readme, bodies=None):
+    """Render every badge section of the README from one list of badges and splice them in one pass."""
+    sections = find_sections(readme)
+    bodies = render_sections(credly, badges, [name for name, _, _ in sections], bodies)
+    return splice_sections(readme, bodies, sections)
+
+
+def default_repo(repository=None, commit_message=None, github=None):
+    """The publisher selected by GH_PUBLISHER, imported only when a run publishes."""
+    if GH_PUBLISHER == "git-data":
+        from services.githubPublisher import GithubPublisher
+        return GithubPublisher(repository, commit_message=commit_message)
+    from services.githubRepo import GithubRepo
+    return GithubRepo(repository, github, commit_message)
+
+
+def remote_readme_sha(repository=None):
+    """Blob sha of the README on GitHub, or None when it cannot be read.
+
+    Read through the contents API like the git-data publisher does, so with
+    CACHE_DIR an unchanged README is a 304 answer without a body. A failed
+    check only means the run publishes as usual.
+    """
+    import requests
+    from services.githubPublisher import GithubPublisher
+    try:
+        return GithubPublisher(repository).sha
+    except (SystemExit, requests.RequestException) as e:
+        print(f"Cannot read the README sha ({e.__class__.__name__}), publishing as usual")
+        return None
+
+
+def update_readme(credly, repo_factory=default_repo, repository=None, readme_sha=remote_readme_sha):
+    """Fetch, render and publish for one Credly user, returns what happened.
+
+    `repo_factory` builds the GitHub repository wrapper; it is only called
+    when there is something to render. With CACHE_DIR, the hash of the
+    sections rendered last time and the blob sha of the README are kept: a
+    run rendering the same sections (and, with SITE_DIR, the same static
+    site) only asks `readme_sha` for the README's current sha, and stops
+    there when nobody edited the README since.
+    """
+    badges = credly.get_badges()
+    if not badges:
+        # Nothing to write: no badges, or every page came back 304 Not Modified.
+        return "not_modified" if credly.not_modified() else "no_badges"
+
+    mirror = ImageMirror(cache_path("images"), BADGE_SIZE, ASSETS_DIR) if MIRROR_IMAGES else None
+    credly.mirror = mirror
+    state = RenderState(os.path.join(CACHE_DIR, "state"), f"{repository or REPOSITORY}|{credly.USER}") if CACHE_DIR else None
+    last = state.load() if state else {}
+    metrics = credly.metrics
+    with metrics.stage("render"):
+        static_site = StaticSite(SITE_DIR, SITE_SHARD_SIZE) if SITE_DIR else None
+        site = static_site.build(badges) if static_site else {}
+    site_hash = bodies_hash(site)
+    bodies = None
+    if last.get("sections"):
+        with metrics.stage("render"):
+            bodies = render_sections(credly, badges, last["sections"], mirror=mirror)
+        if bodies_hash(bodies) == last.get("bodies_hash") and site_hash == last.get("site_hash", bodies_hash({})):
+            with metrics.stage("publish"):
+                current_sha = readme_sha(repository)
+            if current_sha is not None and current_sha == last.get("readme_sha"):
+                print("Rendered sections and README unchanged since the last run")
+                credly.persist()
+                return "unchanged"
+            print("README changed since the last run, splicing the sections again")
+
+    with metrics.stage("publish"):
+        git = repo_factory()
+        readme = git.get_readme()
+
+    with metrics.stage("splice"):
+        sections = find_sections(readme)
+        names = list(dict.fromkeys(name for name, _, _ in sections))
+    with metrics.stage("render"):
+        bodies = render_sections(credly, badges, names, bodies, mirror)
+        bodies = {name: bodies[name] for name in names}
+    with metrics.stage("splice"):
+        new_readme = splice_sections(readme, bodies, sections)
+    new_sha = git_blob_sha(new_readme)
+    site_changed = site_hash != last.get("site_hash", bodies_hash({}))
+    if (new_readme is readme or new_sha == git.sha) and not site_changed:
+        status = "unchanged"
+    else:
+        assets = {**credly.assets, **(mirror.assets if mirror else {}), **site}
+        prune = credly.prune | (static_site.prune_patterns() if static_site else set())
+        with metrics.stage("publish"):
+            if assets or prune:
+                git.save_readme(new_readme, assets, prune)
+            else:
+                git.save_readme(new_readme)
+        status = "updated"
+
+    if state:
+        state.save(names, bodies_hash(bodies), new_sha, site_hash)
+    # Only now may the next run treat these pages and badges as already published
+    credly.persist()
+    return status
+
+
+def publish_metrics(report):
+    """Print the run metrics, write them to METRICS_FILE and to the job summary."""
+    stages = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in report["stages"].items())
+    print(f"Run {report['status']} in {report['seconds']:.2f}s ({stages}), {report['counters']}")
+    if METRICS_FILE:
+        write_json(report, METRICS_FILE)
+    if METRICS_SUMMARY:
+        write_step_summary(report)
 
 
 if __name__ == "__main__":
-    git = GithubRepo()
-    credly_badges = Credly()
-    readme = git.get_readme()
+    with profiled(PROFILE, PROFILE_OUTPUT):
+        if BATCH_CONFIG:
+            from batch import run_batch
+            sys.exit(run_batch(BATCH_CONFIG, BATCH_REPORT))
 
-    new_readme = generate_new_readme(credly_badges.get_markdown(), readme)
-    if new_readme != readme:
-        git.save_readme(new_readme)
+        credly = Credly()
+        credly.metrics.start()
+        try:
+            status = update_readme(credly)
+        finally:
+            credly.metrics.stop()
+    publish_metrics(credly.metrics_report(status))
@@ -0,0 +1,150 @@
+import hashlib
+import io
+import json
+import os
+import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from settings import HTTP_POOL_SIZE, CACHE_DIR
+from services import http_client
+
+# Image URLs in the rendered markdown: badge images and organization logos
+IMAGE_SRC = re.compile(r"""(src=["'])(https://images\.credly\.com/[^"']+)(["'])""")
+
+
+def cache_path(name):
+    """`name` under CACHE_DIR, or under the system temp directory when no cache is kept between runs."""
+    return os.path.join(CACHE_DIR or os.path.join(tempfile.gettempdir(), "credly-cache"), name)
+
+
+def resize(data, size):
+    """PNG thumbnail of at most size x size, or the original bytes when Pillow is not installed or cannot decode them (e.g. SVG)."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return data, False
+
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image.thumbnail((size, size))
+            out = io.BytesIO()
+            image.save(out, format="PNG", optimize=True)
+    except Exception as e:
+        # UnidentifiedImageError, truncated files, decompression bombs...
+        print(f"Cannot resize image: {e.__class__.__name__}, keeping the original")
+        return data, False
+    return out.getvalue(), True
+
+
+class ImageMirror:
+    """Content-addressed local copies of the remote badge images and organization logos.
+
+    Downloads are kept in `cache_dir` with an index of URL -> content hash,
+    so an image is downloaded once across runs. Images are resized to
+    `size` pixels and published under `target_dir` in the repository.
+    """
+
+    def __init__(self, cache_dir, size, target_dir="badges/images"):
+        self.cache_dir = cache_dir
+        self.size = int(size)
+        self.target_dir = target_dir.strip("/")
+        os.makedirs(cache_dir, exist_ok=True)
+        self.index_path = os.path.join(cache_dir, "index.json")
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as fh:
+                self.index = json.load(fh)
+        except (OSError, ValueError):
+            self.index = {}
+        self.lock = threading.Lock()
+        self.downloads = 0
+        # repository path -> bytes of every image used by the last rewrite
+        self.assets = {}
+
+    def save_index(self):
+        tmp = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(self.index, fh)
+        os.replace(tmp, self.index_path)
+
+    def resized_path(self, digest):
+        return os.path.join(self.cache_dir, f"{digest}-{self.size}.png")
+
+    def download(self, url):
+        import requests
+
+        try:
+            response = http_client.get(url)
+        except requests.RequestException as e:
+            # An image that cannot be downloaded keeps its remote URL, the run goes on
+            print(f"Cannot mirror {url}: {e.__class__.__name__}")
+            return
+        if response.status_code != 200:
+            print(f"Cannot mirror {url}: status code {response.status_code}")
+            return
+        data = response.content
+        digest = hashlib.sha256(data).hexdigest()
+        with open(os.path.join(self.cache_dir, digest), "wb") as fh:
+            fh.write(data)
+        with self.lock:
+            self.index[url] = digest
+            self.downloads += 1
+
+    def local(self, url):
+        """Repository path and resized bytes of a mirrored image, or None when it is unavailable.
+
+        Images that are not resized (no Pillow, or a format it cannot
+        decode) are published as downloaded, with the extension of their URL.
+        """
+        digest = self.index.get(url)
+        if not digest:
+            return None
+        resized = self.resized_path(digest)
+        if os.path.exists(resized):
+            with open(resized, "rb") as fh:
+                return f"{self.target_dir}/{digest[:16]}-{self.size}.png", fh.read()
+        try:
+            with open(os.path.join(self.cache_dir, digest), "rb") as fh:
+                original = fh.read()
+        except OSError:
+            return None
+        data, done = resize(original, self.size)
+        if not done:
+            extension = os.path.splitext(urlparse(url).path)[1].lower()
+            return f"{self.target_dir}/{digest[:16]}{extension}", original
+        with open(resized, "wb") as fh:
+            fh.write(data)
+        return f"{self.target_dir}/{digest[:16]}-{self.size}.png", data
+
+    def download_missing(self, urls):
+        """Download the URLs not mirrored yet, in parallel."""
+        missing = sorted({url for url in urls if url not in self.index})
+        if missing:
+            with ThreadPoolExecutor(
+                max_workers=HTTP_POOL_SIZE, initializer=http_client.track, initargs=http_client.tracked(),
+            ) as executor:
+                list(executor.map(self.download, missing))
+            self.save_index()
+
+    def mirror(self, urls):
+        """Download the URLs not mirrored yet and publish them. Returns {url: repository path}."""
+        self.download_missing(urls)
+        paths = {}
+        for url in set(urls):
+            found = self.local(url)
+            if found:
+                paths[url] = found[0]
+                self.assets[found[0]] = found[1]
+        return paths
+
+    def rewrite(self, markdown):
+        """Point every Credly image of the markdown to its mirrored copy, in one pass."""
+        if not markdown:
+            return markdown
+        paths = self.mirror([match.group(2) for match in IMAGE_SRC.finditer(markdown)])
+        return IMAGE_SRC.sub(
+            lambda match: f"{match.group(1)}{paths.get(match.group(2), match.group(2))}{match.group(3)}",
+            markdown,
+        )
@@ -0,0 +1,158 @@
+import sys
+import threading
+from collections.abc import Mapping
+
+from services.layouts import word_limit
+
+CREDLY_IMAGES = "https://images.credly.com/"
+
+
+class BadgeTemplate:
+    """The fields every badge earned from one Credly badge template shares.
+
+    Templates are kept in a registry (see `get_template`), so the badges of
+    every user holding the same template point to one object, and the
+    values derived for rendering are computed once per template.
+    """
+
+    __slots__ = ("fields", "_row", "_hidden_row")
+
+    def __init__(self, id, title, href, img, description, time_to_earn, skills, criteria, level):
+        self.fields = {
+            "title": title,
+            "href": href,
+            "img": img,
+            "description": description,
+            "time_to_earn": time_to_earn,
+            "skills": skills,
+            "criteria": criteria,
+            "level": level,
+            "template_id": id,
+        }
+        self._row = None
+        self._hidden_row = None
+
+    def same(self, title, href, description, time_to_earn, skills, criteria, level):
+        fields = self.fields
+        return (
+            fields["title"] == title and fields["href"] == href and fields["description"] == description
+            and fields["time_to_earn"] == time_to_earn and fields["skills"] == skills
+            and fields["criteria"] == criteria and fields["level"] == level
+        )
+
+    def row_fields(self):
+        """Layout fields without the issuer: texts truncated to 20 words and the first 5 skills."""
+        if self._row is None:
+            fields = self.fields
+            self._row = {
+                "href": fields["href"],
+                "img": fields["img"],
+                "title": fields["title"],
+                "description": word_limit(fields["description"]),
+                "criteria": word_limit(fields["criteria"]),
+                "skills": ", ".join(fields["skills"][:5] if fields["skills"] else []),
+                "time_to_earn": fields["time_to_earn"],
+                "level": fields["level"],
+            }
+        return self._row
+
+    def hidden_row_fields(self):
+        if self._hidden_row is None:
+            fields = self.fields
+            self._hidden_row = {"href": fields["href"], "img": fields["img"], "title": fields["title"]}
+        return self._hidden_row
+
+
+_TEMPLATES = {}
+_LOCK = threading.Lock()
+
+
+def get_template(key, image, title, href, description, time_to_earn, skills, criteria, level, size=None):
+    """The registered template for `key`, `image` and `size`, replaced when its content changed.
+
+    With a `size`, `image` is a raw Credly image URL, sized once when the
+    template is registered.
+    """
+    template = _TEMPLATES.get((key, image, size))
+    if template is None or not template.same(title, href, description, time_to_earn, skills, criteria, level):
+        img = image.replace(CREDLY_IMAGES, f"{CREDLY_IMAGES}size/{size}x{size}/") if size else image
+        template = BadgeTemplate(key, title, href, img, description, time_to_earn, skills, criteria, level)
+        with _LOCK:
+            _TEMPLATES[(key, image, size)] = template
+    return template
+
+
+BADGE_KEYS = ("issuer", "id", "state_updated_at", "issued_at")
+KEYS = ("title", "href", "img", "issuer", "description", "time_to_earn", "skills", "criteria", "level",
+        "id", "template_id", "state_updated_at", "issued_at")
+
+
+class Badge(Mapping):
+    """A normalized badge: the per-badge fields plus a shared `BadgeTemplate`.
+
+    Reads like the badge dicts used before (`badge["title"]`, `badge.get`,
+    `dict(badge)`), so renderers, the store and the caches take either.
+    """
+
+    __slots__ = ("template", "issuer", "id", "state_updated_at", "issued_at")
+
+    def __init__(self, template, issuer, id=None, state_updated_at=None, issued_at=None):
+        self.template = template
+        self.issuer = sys.intern(issuer)
+        self.id = id
+        self.state_updated_at = state_updated_at
+        self.issued_at = issued_at
+
+    def __getitem__(self, key):
+        if key == "issuer":
+            return self.issuer
+        try:
+            return self.template.fields[key]
+        except KeyError:
+            if key in BADGE_KEYS:
+                return getattr(self, key)
+            raise
+
+    def __iter__(self):
+        return iter(KEYS)
+
+    def __len__(self):
+        return len(KEYS)
+
+    def __repr__(self):
+        return f"Badge({dict(self)!r})"
+
+    def row_fields(self):
+        return {**self.template.row_fields(), "issuer": self.issuer}
+
+    def hidden_row_fields(self):
+        return {**self.template.hidden_row_fields(), "issuer": self.issuer}
+
+
+def badge_from_api(badge, size):
+    """A `Badge` from one entry of the Credly badges API."""
+    badge_template = badge["badge_template"]
+    issuer = badge["issuer"]["entities"][0]["entity"]["name"] if badge["issuer"]["entities"] else "Unknown Issuer"
+
+    activities = badge_template.get("badge_template_activities", [])
+    criteria = " ".join(activity.get("title", "No criteria provided") for activity in activities if isinstance(activity, dict))
+
+    template = get_template(
+        badge_template.get("id") or badge_template["url"], badge_template["image_url"],
+        badge_template["name"], badge_template["url"], badge_template["description"],
+        badge_template["time_to_earn"], badge_template["skills"], criteria,
+        badge_template.get("level", "N/A"), size=size,
+    )
+    return Badge(template, issuer, badge.get("id"), badge.get("state_updated_at"), badge.get("issued_at"))
+
+
+def badge_from_fields(fields):
+    """A `Badge` from a badge dict, e.g. one read back from the store or a state file."""
+    if isinstance(fields, Badge):
+        return fields
+    template = get_template(
+        fields.get("template_id") or fields["href"], fields["img"],
+        fields["title"], fields["href"], fields["description"], fields.get("time_to_earn", "N/A"),
+        fields.get("skills"), fields.get("criteria"), fields.get("level", "N/A"),
+    )
+    return Badge(template, fields["issuer"], fields.get("id"), fields.get("state_updated_at"), fields.get("issued_at"))
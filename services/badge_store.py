@@ -0,0 +1,174 @@
+import json
+import os
+import sqlite3
+import threading
+
+from services.badge import Badge, get_template
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issuers (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    name_key TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS badge_templates (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    url TEXT,
+    image_url TEXT,
+    description TEXT,
+    time_to_earn TEXT,
+    skills TEXT,
+    criteria TEXT,
+    level TEXT
+);
+CREATE TABLE IF NOT EXISTS badges (
+    id TEXT PRIMARY KEY,
+    template_id TEXT NOT NULL REFERENCES badge_templates(id),
+    issuer_id INTEGER NOT NULL REFERENCES issuers(id),
+    state_updated_at TEXT,
+    issued_at TEXT,
+    position INTEGER NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_badges_id ON badges(id);
+CREATE INDEX IF NOT EXISTS idx_badges_issuer ON badges(issuer_id, position);
+CREATE INDEX IF NOT EXISTS idx_badges_state_updated_at ON badges(state_updated_at);
+CREATE INDEX IF NOT EXISTS idx_issuers_name_key ON issuers(name_key);
+"""
+
+SELECT_BADGES = """
+SELECT b.id, b.template_id, b.state_updated_at, b.issued_at, i.name,
+       t.name, t.url, t.image_url, t.description, t.time_to_earn, t.skills, t.criteria, t.level
+FROM badges b
+JOIN issuers i ON i.id = b.issuer_id
+JOIN badge_templates t ON t.id = b.template_id
+"""
+
+
+def badge_key(badge):
+    """The primary key of a badge: its Credly id, or for badges without one, the template,
+    issuer and issue date together, so two badges earned from the same template stay apart."""
+    if badge.get("id"):
+        return badge["id"]
+    template_id = badge.get("template_id") or badge["href"]
+    return "|".join((template_id, badge["issuer"], badge.get("issued_at") or badge.get("state_updated_at") or ""))
+
+
+class BadgeStore:
+    """SQLite store of normalized badges, issuers and badge templates.
+
+    Badges go in as the records produced by `Credly.convert_to_dict` (or
+    plain dicts) and come back as `Badge` records, so renderers can read
+    them without the network.
+    """
+
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def _issuer_id(self, name):
+        self.db.execute(
+            "INSERT INTO issuers (name, name_key) VALUES (?, ?) ON CONFLICT(name) DO NOTHING",
+            (name, name.lower()),
+        )
+        return self.db.execute("SELECT id FROM issuers WHERE name = ?", (name,)).fetchone()[0]
+
+    def upsert(self, badges, start=0):
+        """Insert or update badges; `position` keeps the order the API returned them in."""
+        with self.lock, self.db:
+            issuers = {}
+            for position, badge in enumerate(badges, start):
+                issuer = badge["issuer"]
+                if issuer not in issuers:
+                    issuers[issuer] = self._issuer_id(issuer)
+                template_id = badge.get("template_id") or badge["href"]
+                self.db.execute(
+                    """INSERT INTO badge_templates
+                       (id, name, url, image_url, description, time_to_earn, skills, criteria, level)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                       ON CONFLICT(id) DO UPDATE SET
+                         name = excluded.name, url = excluded.url, image_url = excluded.image_url,
+                         description = excluded.description, time_to_earn = excluded.time_to_earn,
+                         skills = excluded.skills, criteria = excluded.criteria, level = excluded.level""",
+                    (
+                        template_id, badge["title"], badge["href"], badge["img"], badge["description"],
+                        badge.get("time_to_earn"), json.dumps(badge.get("skills") or []),
+                        badge.get("criteria"), badge.get("level"),
+                    ),
+                )
+                self.db.execute(
+                    """INSERT INTO badges (id, template_id, issuer_id, state_updated_at, issued_at, position)
+                       VALUES (?, ?, ?, ?, ?, ?)
+                       ON CONFLICT(id) DO UPDATE SET
+                         template_id = excluded.template_id, issuer_id = excluded.issuer_id,
+                         state_updated_at = excluded.state_updated_at, issued_at = excluded.issued_at,
+                         position = excluded.position""",
+                    (
+                        badge_key(badge), template_id, issuers[issuer],
+                        badge.get("state_updated_at"), badge.get("issued_at"), position,
+                    ),
+                )
+
+    def prepend(self, badges):
+        """Upsert badges ahead of every stored one, e.g. new badges from a newest-first fetch."""
+        first = self.db.execute("SELECT MIN(position) FROM badges").fetchone()[0] or 0
+        self.upsert(badges, start=first - len(badges))
+
+    def sync(self, badges):
+        """Make the store hold exactly `badges`, e.g. after a complete fetch."""
+        self.upsert(badges)
+        ids = [badge_key(badge) for badge in badges]
+        with self.lock, self.db:
+            self.db.execute("CREATE TEMP TABLE IF NOT EXISTS keep_ids (id TEXT PRIMARY KEY)")
+            self.db.execute("DELETE FROM keep_ids")
+            self.db.executemany("INSERT OR IGNORE INTO keep_ids (id) VALUES (?)", ((i,) for i in ids))
+            self.db.execute("DELETE FROM badges WHERE id NOT IN (SELECT id FROM keep_ids)")
+            self.db.execute("DELETE FROM issuers WHERE id NOT IN (SELECT issuer_id FROM badges)")
+            self.db.execute("DELETE FROM badge_templates WHERE id NOT IN (SELECT template_id FROM badges)")
+
+    def _row_to_badge(self, row):
+        (id, template_id, state_updated_at, issued_at, issuer,
+         title, href, img, description, time_to_earn, skills, criteria, level) = row
+        template = get_template(
+            template_id, img, title, href, description, time_to_earn,
+            json.loads(skills) if skills else [], criteria, level,
+        )
+        return Badge(template, issuer, id, state_updated_at, issued_at)
+
+    def count(self):
+        return self.db.execute("SELECT COUNT(*) FROM badges").fetchone()[0]
+
+    def ids(self):
+        return {row[0] for row in self.db.execute("SELECT id FROM badges")}
+
+    def grouped(self, ids=None):
+        """Badges grouped by issuer, issuers sorted case-insensitively, badges in API order.
+
+        Matches the grouping `Credly.generate_md_format` does in Python.
+        """
+        query = SELECT_BADGES
+        params = ()
+        if ids is not None:
+            ids = list(ids)
+            query += f" WHERE b.id IN ({', '.join('?' for _ in ids)})"
+            params = ids
+        query += " ORDER BY i.name_key, b.position"
+
+        grouped_badges = {}
+        for row in self.db.execute(query, params):
+            badge = self._row_to_badge(row)
+            grouped_badges.setdefault(badge["issuer"], []).append(badge)
+        return grouped_badges
+
+    def latest(self, limit):
+        """The `limit` most recently updated badges, newest first."""
+        query = SELECT_BADGES + " ORDER BY b.state_updated_at DESC LIMIT ?"
+        return [self._row_to_badge(row) for row in self.db.execute(query, (limit,))]
@@ -0,0 +1,158 @@
+import base64
+import hashlib
+import html
+import io
+import json
+import os
+
+
+TILE_PADDING = 10
+
+
+class BadgeWall:
+    """A single SVG or PNG mosaic of badges, with one link region per badge in the SVG.
+
+    Tiles are cached by a hash of their link, title and image content, so a
+    new run only re-encodes (SVG) or repaints (PNG) the tiles that changed.
+    """
+
+    def __init__(self, directory, mirror, columns=10, name="wall"):
+        """Tiles are drawn from the images of `mirror` (a `services.assets.ImageMirror`), at its size.
+
+        `name` names the PNG kept between runs and its manifest; walls
+        sharing `directory` (other targets, other section options) need
+        different names.
+        """
+        self.directory = directory
+        self.mirror = mirror
+        self.size = mirror.size
+        self.columns = max(1, int(columns))
+        self.cell = self.size + TILE_PADDING
+        self.name = name
+        os.makedirs(os.path.join(directory, "tiles"), exist_ok=True)
+        self.repainted = 0
+
+    def tiles(self, badges):
+        """[(key, badge, image bytes)] for the badges whose image is available."""
+        self.mirror.download_missing([badge["img"] for badge in badges])
+        tiles = []
+        for badge in badges:
+            found = self.mirror.local(badge["img"])
+            # Images the mirror could not turn into PNG cannot be tiles
+            if not found or not found[0].endswith(".png"):
+                continue
+            data = found[1]
+            key = hashlib.sha256(
+                json.dumps([badge["href"], badge["title"], badge["issuer"]]).encode("utf-8") + data
+            ).hexdigest()
+            tiles.append((key, badge, data))
+        return tiles
+
+    def dimensions(self, count):
+        columns = min(self.columns, count) or 1
+        rows = -(-count // columns)
+        return columns, rows
+
+    def svg_tile(self, key, badge, data):
+        path = os.path.join(self.directory, "tiles", f"{key}.svg")
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                return fh.read()
+        except OSError:
+            pass
+        self.repainted += 1
+        title = html.escape(f'{badge["title"]} - {badge["issuer"]}')
+        fragment = (
+            f'<a href="{html.escape(badge["href"])}" target="_blank"><title>{title}</title>'
+            f'<image width="{self.size}" height="{self.size}" '
+            f'href="data:image/png;base64,{base64.b64encode(data).decode("ascii")}"/></a>'
+        )
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(fragment)
+        return fragment
+
+    def render_svg(self, badges):
+        tiles = self.tiles(badges)
+        columns, rows = self.dimensions(len(tiles))
+        parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{columns * self.cell}" '
+            f'height="{rows * self.cell}" viewBox="0 0 {columns * self.cell} {rows * self.cell}">'
+        ]
+        for position, (key, badge, data) in enumerate(tiles):
+            x = (position % columns) * self.cell + TILE_PADDING // 2
+            y = (position // columns) * self.cell + TILE_PADDING // 2
+            parts.append(f'<g transform="translate({x},{y})">{self.svg_tile(key, badge, data)}</g>')
+        parts.append("</svg>\n")
+        return "".join(parts).encode("utf-8")
+
+    def render_png(self, badges):
+        """PNG mosaic, repainting only the slots whose tile changed since the previous run."""
+        from PIL import Image
+
+        tiles = self.tiles(badges)
+        columns, rows = self.dimensions(len(tiles))
+        size = (columns * self.cell, rows * self.cell)
+        manifest_path = os.path.join(self.directory, f"{self.name}.json")
+        png_path = os.path.join(self.directory, f"{self.name}.png")
+
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as fh:
+                manifest = json.load(fh)
+            canvas = None
+            if manifest["size"] == list(size):
+                with Image.open(png_path) as previous_png:
+                    canvas = previous_png.convert("RGBA")
+        except (OSError, ValueError, KeyError):
+            manifest, canvas = {}, None
+        previous = manifest.get("slots", []) if canvas else []
+        if canvas is None:
+            canvas = Image.new("RGBA", size, (0, 0, 0, 0))
+
+        slots = []
+        for position, (key, badge, data) in enumerate(tiles):
+            slots.append(key)
+            if position < len(previous) and previous[position] == key:
+                continue
+            self.repainted += 1
+            x = (position % columns) * self.cell + TILE_PADDING // 2
+            y = (position // columns) * self.cell + TILE_PADDING // 2
+            canvas.paste((0, 0, 0, 0), (x, y, x + self.size, y + self.size))
+            with Image.open(io.BytesIO(data)) as tile:
+                tile = tile.convert("RGBA")
+                canvas.paste(tile, (x, y), tile)
+        for position in range(len(tiles), len(previous)):
+            x = (position % columns) * self.cell
+            y = (position // columns) * self.cell
+            canvas.paste((0, 0, 0, 0), (x, y, x + self.cell, y + self.cell))
+
+        out = io.BytesIO()
+        canvas.save(out, format="PNG", optimize=True)
+        with open(png_path, "wb") as fh:
+            fh.write(out.getvalue())
+        with open(manifest_path, "w", encoding="utf-8") as fh:
+            json.dump({"size": list(size), "slots": slots}, fh)
+        return out.getvalue()
+
+    def render(self, badges, path, fmt="svg", link=None):
+        """Returns the markdown snippet embedding the wall and {filename: bytes} of the file to publish."""
+        if fmt == "png":
+            try:
+                data = self.render_png(badges)
+            except ImportError:
+                print("Pillow is not installed, rendering the badge wall as SVG")
+                fmt = "svg"
+        if fmt != "png":
+            data = self.render_svg(badges)
+
+        # Content-addressed name: the README changes with the wall, and no stale copy is served from caches;
+        # the walls of earlier runs match `prune_patterns(path)` and are deleted when this one is published
+        filename = f"{path}-{hashlib.sha256(data).hexdigest()[:12]}.{fmt}"
+        snippet = f"![Credly badges]({filename})"
+        if link:
+            snippet = f"[{snippet}]({link})"
+        return snippet, {filename: data}
+
+
+def prune_patterns(path):
+    """Patterns of the wall files published under `path`, by this run or earlier ones."""
+    return {f"{path}-*.svg", f"{path}-*.png"}
@@ -1,7 +1,10 @@
-from bs4 import BeautifulSoup
-import lxml, requests
+import hashlib
+import json
+import os
 import time
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from settings import (
     CREDLY_SORT,
@@ -10,43 +13,290 @@ from settings import (
     BADGE_SIZE,
     NUMBER_LAST_BADGES,
     CREDLY_API_TOKEN,
+    CREDLY_CONCURRENCY,
+    CREDLY_RATE_LIMIT,
+    CREDLY_RATE_BURST,
+    CACHE_DIR,
+    INCREMENTAL_STATE,
+    BADGE_STORE,
+    CREDLY_OFFLINE,
+    BADGE_LAYOUT,
+    CREDLY_STREAM_PARSE,
+    CREDLY_PIPELINE,
+    CREDLY_SOURCE,
+    CREDLY_PROFILE_URL,
 )
-from services.org_info import org_logos, org_links, org_descriptions
+from services.rate_limiter import TokenBucket
+from services import http_client
+from services.response_cache import ResponseCache
+from services.badge_store import BadgeStore
+from services.section_cache import SectionCache
+from services.badge import badge_from_api
+from services.page_parser import parse_page
+from services.profile_parser import parse_profile, read_chunks, CHUNK_SIZE
+from services.pipeline import Pipeline
+from services.metrics import RunMetrics
+from services.org_info import lookup as org_lookup
+from services.layouts import get_layout, visible_badges, word_limit
 
 class Credly:
-    def __init__(self, f=None):
+    def __init__(self, f=None, user=None, api_token=None, incremental_state=None, badge_store=None):
+        """Settings come from the action inputs; the keyword arguments override them per user (batch mode).
+
+        An explicit empty `incremental_state` or `badge_store` turns them off
+        instead of falling back to the action's INCREMENTAL_STATE / BADGE_STORE.
+        """
         self.FILE = f
         self.BASE_URL = CREDLY_BASE_URL
-        self.USER = CREDLY_USER
+        self.USER = user or CREDLY_USER
         self.SORT = CREDLY_SORT
-        self.API_TOKEN = CREDLY_API_TOKEN
+        self.API_TOKEN = api_token or CREDLY_API_TOKEN
+        self.CONCURRENCY = CREDLY_CONCURRENCY
+        self.PIPELINE = CREDLY_PIPELINE
+        # A saved profile page (`f`) or CREDLY_SOURCE=profile reads the public profile, no token needed
+        self.SOURCE = "profile" if f else CREDLY_SOURCE
+        self.PROFILE_URL = CREDLY_PROFILE_URL.format(user=self.USER)
+        # (badges, grouped badges) of this run, so renders do not group them again
+        self.grouped = None
+        self.metrics = RunMetrics()
+        # Pages of different tokens share the same URL, so the response cache is scoped per token;
+        # the render settings are part of the scope too, a change of size or layout must render again
+        scope = hashlib.sha256(f"{self.USER}|{self.API_TOKEN}|{BADGE_SIZE}|{BADGE_LAYOUT}".encode("utf-8")).hexdigest()
+        self.cache = ResponseCache(CACHE_DIR, scope) if CACHE_DIR else None
+        self.section_cache = SectionCache(os.path.join(CACHE_DIR, "sections")) if CACHE_DIR else None
+        self.INCREMENTAL_STATE = INCREMENTAL_STATE if incremental_state is None else incremental_state
+        self.OFFLINE = CREDLY_OFFLINE
+        badge_store = BADGE_STORE if badge_store is None else badge_store
+        self.store = BadgeStore(badge_store) if badge_store else None
+        self.layout = get_layout(BADGE_LAYOUT)
+        self.pages_fetched = 0
+        self.pages_not_modified = 0
+        self.lock = threading.Lock()
+        # Cache entries and incremental state of this run, saved by `persist` once it is published
+        self.pending_pages = []
+        self.pending_state = None
+        self.badge_count = 0
+        # Generated files to publish with the README ({path: bytes}), and patterns of the
+        # repository paths they replace: files matching them that this run did not generate are deleted
+        self.assets = {}
+        self.prune = set()
+        # ImageMirror of the run, shared by the renderers that need local images
+        self.mirror = None
         print(self.BASE_URL, self.USER, self.SORT)
 
-    def fetch_badges(self):
-        all_badges = []
-        page = 1
-
-        headers = {
+    def headers(self):
+        return {
             "Authorization": f"Bearer {self.API_TOKEN}",
             "User-Agent": "Credly/1.28.0/2025041702 (iOS; 18.4.1; iPhone14,4)",
             "Accept": "application/json",
         }
 
+    def fetch_page(self, page, sort=None):
+        """Fetch a single page of badges, returns the decoded payload or None on error.
+
+        With a response cache the request is conditional, and a 304 answer is
+        served from the cached body.
+        """
+        url = f"{self.BASE_URL}?page={page}&state=accepted,pending"
+        if sort:
+            url += f"&sort={sort}"
+        headers = self.headers()
+        if self.cache:
+            headers.update(self.cache.validators(url, page))
+        # With CREDLY_STREAM_PARSE the body is decoded while it downloads, never buffered whole
+        response = http_client.get(url, headers=headers, stream=CREDLY_STREAM_PARSE)
+        with self.lock:
+            self.pages_fetched += 1
+
+        if response.status_code == 304 and self.cache:
+            response.close()
+            cached = self.cache.get(url, page)
+            if cached:
+                print(f"Page {page} - Not Modified")
+                with self.lock:
+                    self.pages_not_modified += 1
+                return self.decode_page(cached["body"])
+
+        if response.status_code != 200:
+            print(f"Error: Received status code {response.status_code}")
+            print(response.text)
+            return None
+
+        print(f"Page {page} - Status Code: {response.status_code}")
+        if CREDLY_STREAM_PARSE:
+            data = parse_page(http_client.iter_content(response, CHUNK_SIZE))
+            # The cache keeps the slimmed page, which decodes to the same badges
+            body = json.dumps(data, separators=(",", ":")) if self.cache else None
+        else:
+            data = json.loads(response.text)
+            body = None
+        if self.cache:
+            entry = self.cache.entry(response, body)
+            if entry:
+                with self.lock:
+                    self.pending_pages.append((url, page, entry))
+        return data
+
+    def decode_page(self, text):
+        """A decoded badges page; with CREDLY_STREAM_PARSE its badges only keep the fields we render."""
+        return parse_page(text) if CREDLY_STREAM_PARSE else json.loads(text)
+
+    def not_modified(self):
+        """True when every page fetched in this run was answered with 304 Not Modified."""
+        return self.pages_fetched > 0 and self.pages_not_modified == self.pages_fetched
+
+    def total_pages(self, metadata):
+        """Number of pages announced by the API, or None when it is not reported."""
+        if metadata.get("total_pages"):
+            return int(metadata["total_pages"])
+        if metadata.get("total_count") and metadata.get("per"):
+            return -(-int(metadata["total_count"]) // int(metadata["per"]))
+        return None
+
+    def fetch_badges(self):
+        if self.INCREMENTAL_STATE:
+            return self.fetch_badges_incremental()
+        return [badge for data in self.iter_pages() for badge in data["data"]]
+
+    def iter_pages(self):
+        """Yield the decoded pages in page order, stopping at the first page that failed."""
+        if self.CONCURRENCY > 1:
+            yield from self.iter_pages_concurrent()
+            return
+
+        page = 1
         while True:
-            url = f"{self.BASE_URL}?page={page}&state=accepted,pending"
-            response = requests.get(url, headers=headers)
+            data = self.fetch_page(page)
+            if data is None:
+                break
+
+            yield data
+
+            # Check if there is a next page
+            if not data["metadata"]["next_page_url"]:
+                break
+
+            page += 1
+            delay = random.uniform(2, 6)
+            print(f"Delaying next request by {delay:.2f} seconds...")
+            time.sleep(delay)  # Avoid hitting rate limits
+
+    def iter_pages_concurrent(self):
+        """Fetch the first page, then the remaining ones in parallel behind the rate limiter.
+
+        Pages are yielded in page order, and stop at the first page that
+        failed, like the sequential crawl does.
+        """
+        limiter = TokenBucket(CREDLY_RATE_LIMIT, CREDLY_RATE_BURST)
+
+        limiter.acquire()
+        first = self.fetch_page(1)
+        if first is None:
+            return
 
+        yield first
+        if not first["metadata"].get("next_page_url"):
+            return
+
+        pages = self.total_pages(first["metadata"])
+        if pages is None:
+            print("Page count not reported, falling back to sequential fetch")
+            page = 2
+            data = first
+            while data["metadata"].get("next_page_url"):
+                limiter.acquire()
+                data = self.fetch_page(page)
+                if data is None:
+                    break
+                yield data
+                page += 1
+            return
+
+        def fetch(page):
+            limiter.acquire()
+            return self.fetch_page(page)
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.CONCURRENCY, initializer=http_client.track, initargs=http_client.tracked(),
+        )
+        try:
+            # map() yields results in submission order, which keeps the output deterministic
+            for data in executor.map(fetch, range(2, pages + 1)):
+                if data is None:
+                    break
+                yield data
+        finally:
+            # A failed page or a closed generator drops the pages not started yet
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def fetch_profile_badges(self):
+        """Badge records of the public profile page, read from `self.FILE` or PROFILE_URL."""
+        if self.FILE:
+            return parse_profile(read_chunks(self.FILE), BADGE_SIZE)
+
+        response = http_client.get(self.PROFILE_URL, headers={"Accept": "text/html"}, stream=True)
+        with self.lock:
+            self.pages_fetched += 1
+        try:
             if response.status_code != 200:
                 print(f"Error: Received status code {response.status_code}")
-                print(response.text)
+                return []
+            return parse_profile(http_client.iter_content(response, CHUNK_SIZE), BADGE_SIZE)
+        finally:
+            response.close()
+
+    def load_state(self):
+        try:
+            with open(self.INCREMENTAL_STATE, "r", encoding="utf-8") as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return {"badges": []}
+
+    def save_state(self, badges):
+        state = {"badges": badges}
+        directory = os.path.dirname(self.INCREMENTAL_STATE)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = f"{self.INCREMENTAL_STATE}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(state, fh)
+        os.replace(tmp, self.INCREMENTAL_STATE)
+
+    def fetch_badges_incremental(self):
+        """Fetch newest-first and stop at the first page reaching an already known badge.
+
+        A badge is known when the previous run saw its id with the same or a
+        newer `state_updated_at`. New and updated badges are merged in front
+        of the previously known set, which is saved back for the next run.
+        Badges removed from Credly stay in the set until the state file is
+        deleted, which forces a full crawl. The merged set is only saved by
+        `persist`, after the run published it.
+        """
+        state = self.load_state()
+        known = {badge["id"]: badge.get("state_updated_at") or "" for badge in state["badges"]}
+        print(f"Incremental fetch: {len(known)} known badges")
+
+        fresh = []
+        complete = True
+        page = 1
+        while True:
+            data = self.fetch_page(page, sort="-state_updated_at")
+            if data is None:
+                if page == 1:
+                    return []
+                complete = False
                 break
 
-            print(f"Page {page} - Status Code: {response.status_code}")
-            data = response.json()
-            all_badges.extend(data["data"])
+            # Pages are sorted newest-first, so everything after the first known,
+            # unchanged badge was already seen by the previous run.
+            reached_known = False
+            for badge in data["data"]:
+                if badge["id"] in known and (badge.get("state_updated_at") or "") <= known[badge["id"]]:
+                    reached_known = True
+                    break
+                fresh.append(badge)
 
-            # Check if there is a next page
-            if not data["metadata"]["next_page_url"]:
+            if reached_known or not data["metadata"]["next_page_url"]:
                 break
 
             page += 1
@@ -54,87 +304,60 @@ class Credly:
             print(f"Delaying next request by {delay:.2f} seconds...")
             time.sleep(delay)  # Avoid hitting rate limits
 
+        print(f"Incremental fetch: {len(fresh)} new or updated badges in {page} page(s)")
+        fresh_ids = {badge["id"] for badge in fresh}
+        all_badges = fresh + [badge for badge in state["badges"] if badge["id"] not in fresh_ids]
+        if complete:
+            self.pending_state = all_badges
         return all_badges
 
-    def convert_to_dict(self, badge):
-        badge_template = badge["badge_template"]
-        issuer = badge["issuer"]["entities"][0]["entity"]["name"] if badge["issuer"]["entities"] else "Unknown Issuer"
+    def persist(self):
+        """Save this run's response cache entries and incremental state, and prune the section cache.
 
-        activities = badge_template.get("badge_template_activities", [])
-        criteria = " ".join(activity.get("title", "No criteria provided") for activity in activities if isinstance(activity, dict))
+        Called once the README is published (or found up to date): until
+        then the next run must not see these pages as 304 Not Modified or
+        these badges as known, or a failed publish would never be retried.
+        """
+        if self.cache:
+            for url, page, entry in self.pending_pages:
+                self.cache.put(url, page, entry)
+        self.pending_pages = []
+        if self.pending_state is not None:
+            self.save_state(self.pending_state)
+            self.pending_state = None
+        if self.section_cache:
+            self.section_cache.prune()
 
-        return {
-            "title": badge_template["name"],
-            "href": badge_template["url"],
-            "img": badge_template["image_url"].replace("https://images.credly.com/", f"https://images.credly.com/size/{BADGE_SIZE}x{BADGE_SIZE}/"),
-            "issuer": issuer,
-            "description": badge_template["description"],
-            "time_to_earn": badge_template["time_to_earn"],
-            "skills": badge_template["skills"],
-            "criteria": criteria,
-            "level": badge_template["level"],
-        }
+    def convert_to_dict(self, badge):
+        """The normalized `Badge` record for one API badge (reads like a dict)."""
+        return badge_from_api(badge, BADGE_SIZE)
 
     def return_badges_html(self):
         badges = self.fetch_badges()
         return [self.convert_to_dict(badge) for badge in badges]
 
     def twenty_word_limit(self, text):
-        words = text.split()
-        return " ".join(words[:20]) + ("..." if len(words) > 20 else "")
+        return word_limit(text, 20)
+
+    def iter_badge_rows(self, badges):
+        """Yield one row per badge in the configured layout."""
+        return self.layout.iter_rows(badges)
 
     def generate_badge_rows(self, badges):
-        rows = ""
-        for badge in badges:
-            desc = self.twenty_word_limit(badge["description"])
-            criteria = self.twenty_word_limit(badge["criteria"])
-            rows += '  <tr>\n'
-            rows += f'    <td align="center" width="20%" style="padding:10px">\n'
-            rows += f'      <a href="{badge["href"]}">\n'
-            rows += f'        <img src="{badge["img"]}" width="100">\n'
-            rows += f'      </a><br/>\n'
-            rows += f'      <a href="{badge["href"]}">{badge["title"]} - {badge["issuer"]}</a>\n'
-            rows += '    </td>\n'
-            rows += f'    <td width="80%" style="padding:10px">\n'
-            rows += f'      <strong>Description:</strong> {desc} <a href="{badge["href"]}">Read more here</a><br/>\n'
-            # Only first 5 skills
-            skills = badge["skills"][:5] if badge["skills"] else []
-            rows += f'      <strong>Skills:</strong> {", ".join(skills)}<br/>\n'
-            rows += f'      <strong>Criteria:</strong> {criteria} <a href="{badge["href"]}">Read more here</a><br/>\n'
-            rows += f'      <strong>Time to Earn:</strong> {badge.get("time_to_earn", "N/A")}<br/>\n'
-            rows += f'      <strong>Level:</strong> {badge.get("level", "N/A")}\n'
-            rows += '    </td>\n'
-            rows += '  </tr>\n'
-        return rows
+        return "".join(self.iter_badge_rows(badges))
+
+    def iter_hidden_badge_rows(self, badges):
+        """Yield hidden rows for a list of badges, filtering out paid training badges."""
+        return self.layout.iter_hidden_rows(visible_badges(badges))
 
     def generate_hidden_badge_rows(self, badges):
         """Helper function to generate hidden table rows for a list of badges, filtering out paid training badges."""
-        rows = ""
-        for badge in badges:
-            # Filter out paid training badges by title and issuer
-            if (
-                (badge["title"].strip() == "LFS256: DevOps and Workflow Management with Argo" and badge["issuer"].strip() == "The Linux Foundation") or
-                (badge["title"].strip() == "CAPA: Certified Argo Project Associate" and badge["issuer"].strip() == "The Linux Foundation")
-            ):
-                continue
-            rows += '  <tr>\n'
-            rows += f'    <td align="center" width="20%" style="padding:10px">\n'
-            rows += f'      <a href="{badge["href"]}">\n'
-            rows += f'        <img src="{badge["img"]}" width="100"/>\n'
-            rows += f'      </a><br/>\n'
-            rows += f'      <a href="{badge["href"]}">{badge["title"]} - {badge["issuer"]}</a>\n'
-            rows += f'    </td>\n'
-            rows += f'    <td width="80%" style="padding:10px">\n'
-            rows += f'      <strong>Read more:</strong> <a href="{badge["href"]}">here</a><br/>\n'
-            rows += f'    </td>\n'
-            rows += '  </tr>\n'
-        return rows
+        return "".join(self.iter_hidden_badge_rows(badges))
 
-    def generate_md_format(self, badges):
-        if not badges:
-            return None
-    
-        # Group badges by issuer
+    def group_badges(self, badges):
+        """Group badges by issuer, issuers sorted case-insensitively."""
+        if self.grouped and badges is self.grouped[0]:
+            return self.grouped[1]
         sorted_badges = sorted(badges, key=lambda x: x["issuer"].lower())
         grouped_badges = {}
         for badge in sorted_badges:
@@ -142,76 +365,155 @@ class Credly:
             if issuer not in grouped_badges:
                 grouped_badges[issuer] = []
             grouped_badges[issuer].append(badge)
-    
+        return grouped_badges
+
+    def generate_md_format(self, badges):
+        if not badges:
+            return None
+        return self.generate_grouped_md_format(self.group_badges(badges))
+
+    def iter_md_format(self, badges):
+        """Stream the markdown for a list of badges, see `iter_grouped_md_format`."""
+        if badges:
+            yield from self.iter_grouped_md_format(self.group_badges(badges))
+
+    def write_md_format(self, badges, sink):
+        """Write the markdown to any file-like `sink`, returns the number of characters written."""
+        written = 0
+        for chunk in self.iter_md_format(badges):
+            sink.write(chunk)
+            written += len(chunk)
+        return written
+
+    def generate_grouped_md_format(self, grouped_badges):
+        if not grouped_badges:
+            return None
+        markdown = "".join(self.iter_grouped_md_format(grouped_badges))
+
+        # Print tail of the markdown
+        print(markdown.rsplit("\n", 100)[-100:])
+        return markdown
+
+    def iter_grouped_md_format(self, grouped_badges):
+        """Yield the markdown chunk by chunk, without building the whole document."""
+        total = sum(len(badges) for badges in grouped_badges.values())
+
         # --- Issuer summary table ---
-        markdown = f"## Total Badges: ({len(badges)})\n\n"
-        markdown += f"## Issuing Organizations: ({len(grouped_badges)})\n\n"
+        yield f"## Total Badges: ({total})\n\n"
+        yield f"## Issuing Organizations: ({len(grouped_badges)})\n\n"
         unique_issuers = list(grouped_badges.keys())
         unique_issuers.sort(key=lambda x: x.lower())
-        markdown += "<table width='100%' border='1' cellspacing='0' cellpadding='4'>\n"
+        yield "<table width='100%' border='1' cellspacing='0' cellpadding='4'>\n"
         cell_count = 0
         for issuer in unique_issuers:
             if cell_count == 0:
-                markdown += "<tr>\n"
-            logo = org_logos(issuer)
-            link = org_links(issuer)
-            anchor = issuer.lower().replace(" ", "-").replace(".", "").replace("-training-and-certification", "")
+                yield "<tr>\n"
+            org = org_lookup(issuer)
             badge_count = len(grouped_badges[issuer])
-            markdown += f'  <td align="center" width="20%" style="padding:10px">\n'
-            if logo and link:
-                markdown += f'    <a href="{link}">\n'
-                markdown += f'      <img src="{logo}" width="100">\n'
-                markdown += f'    </a><br/>\n'
-                markdown += f'    <a href="#{anchor}-{badge_count}">{issuer}</a>\n'
+            if org.logo and org.link:
+                yield (
+                    '  <td align="center" width="20%" style="padding:10px">\n'
+                    f'    <a href="{org.link}">\n'
+                    f'      <img src="{org.logo}" width="100">\n'
+                    '    </a><br/>\n'
+                    f'    <a href="#{org.anchor}-{badge_count}">{issuer}</a>\n'
+                    '  </td>\n'
+                )
             else:
-                markdown += f'    {issuer}\n'
-            markdown += '  </td>\n'
+                yield f'  <td align="center" width="20%" style="padding:10px">\n    {issuer}\n  </td>\n'
             cell_count += 1
             if cell_count == 5:
-                markdown += "</tr>\n"
+                yield "</tr>\n"
                 cell_count = 0
         if cell_count > 0:
-            for _ in range(5 - cell_count):
-                markdown += '  <td></td>\n'
-            markdown += "</tr>\n"
-        markdown += "</table>\n\n\n"  # <-- make sure summary table is fully closed
-    
+            yield '  <td></td>\n' * (5 - cell_count)
+            yield "</tr>\n"
+        yield "</table>\n\n\n"  # <-- make sure summary table is fully closed
+
         # --- Link list to issuers ---
-        for issuer in unique_issuers:
-            markdown += f"[{issuer}](#{issuer.lower().replace(' ', '-').replace('.', '')}-{len(grouped_badges.get(issuer, []))}), "
-        markdown = markdown.rstrip(", ")
-        markdown += "\n\n"
-    
+        yield ", ".join(
+            f"[{issuer}](#{org_lookup(issuer).slug}-{len(grouped_badges.get(issuer, []))})"
+            for issuer in unique_issuers
+        )
+        yield "\n\n"
+
         # --- Badge tables ---
         for issuer, badges in grouped_badges.items():
-            anchor = issuer.lower().replace(" ", "-").replace(".", "").replace("-training-and-certification", "")
-            markdown += f"\n\n### {issuer} ({len(badges)})\n\n"
-            markdown += f'<strong><a href="#user-content-free-credly-badges">Back to Top ⬆️</a></strong>\n\n'
-    
-            # Header table for issuer info
-            markdown += "| Issuing Organization | Description | Credly Badges | Verified | Organization Link |\n"
-            markdown += "|        :---:         |-------------|     :---:     |   :---:  |       :---:       |\n"
-            markdown += f"| <img src='{org_logos(issuer)}' height='100' /><br/>[{issuer}](#{anchor}-{len(badges)}) | {org_descriptions(issuer)} | {len(badges)} | ✅ | [{issuer}]({org_links(issuer)}) |\n\n"
-    
-            # --- First 3 badges ---
-            markdown += '<table width="100%" border="1" cellspacing="0" cellpadding="4">\n'
-            markdown += '  <tr>\n    <th width="20%">Badge</th>\n    <th width="80%">Description</th>\n  </tr>\n'
-            markdown += self.generate_badge_rows(badges[:3])
-            markdown += '</table>\n\n\n'  # <-- ensure table is fully closed
-    
-            # --- Remaining badges in <details> ---
-            if len(badges) > 3:
-                markdown += f'\n\n<details><summary>More {issuer} ({len(badges) - 3})</summary>\n\n'
-                markdown += '<table width="100%" border="1" cellspacing="0" cellpadding="4">\n'
-                markdown += '  <tr>\n    <th width="20%">Badge</th>\n    <th width="80%">Description</th>\n  </tr>\n'
-                markdown += self.generate_hidden_badge_rows(badges[3:])
-                markdown += '</table>\n\n\n'
-                markdown += '</details>\n\n'  # <-- make sure <details> is closed
+            if not self.section_cache:
+                yield from self.iter_issuer_section(issuer, badges)
+                continue
 
-        # Print tail of the markdown
-        print(markdown.split("\n")[-100:])
-        return markdown
+            key = self.section_cache.key(issuer, badges, self.layout.name, org_lookup(issuer))
+            section = self.section_cache.get(key)
+            if section is None:
+                section = "".join(self.iter_issuer_section(issuer, badges))
+                self.section_cache.put(key, section)
+            yield section
+
+    def iter_issuer_section(self, issuer, badges):
+        """Yield the section of one issuer: heading, organization table and badge tables."""
+        return self.layout.iter_issuer_section(issuer, badges)
+
+    def get_badges(self):
+        """Converted badges for this run, or None when there is nothing new to render.
+
+        Offline runs read them from the badge store, grouped by issuer.
+        """
+        if self.OFFLINE:
+            if not self.store:
+                print("Offline mode needs a badge store (BADGE_STORE)")
+                return None
+            print(f"Rendering {self.store.count()} badges from {self.store.path}")
+            with self.metrics.stage("fetch"):
+                grouped = self.store.grouped()
+                badges = [badge for group in grouped.values() for badge in group]
+            self.grouped = (badges, grouped)
+            self.badge_count = len(badges)
+            return badges
+
+        badges = grouped = None
+        if self.SOURCE == "profile":
+            # Profile entries are parsed straight into badge records, all of it counts as fetch
+            with self.metrics.stage("fetch"):
+                badges = self.fetch_profile_badges()
+        elif self.PIPELINE and not self.INCREMENTAL_STATE:
+            # Conversion and grouping overlap the downloads, all of it counts as fetch
+            with self.metrics.stage("fetch"):
+                badges, grouped = Pipeline(self.iter_pages(), self.convert_to_dict).run()
+        else:
+            with self.metrics.stage("fetch"):
+                raw_badges = self.fetch_badges()
+        if self.not_modified():
+            print("No page changed since the last run, skipping render")
+            return None
+        if badges is None:
+            with self.metrics.stage("convert"):
+                badges = [self.convert_to_dict(badge) for badge in raw_badges]
+        if grouped is None:
+            with self.metrics.stage("group"):
+                grouped = self.group_badges(badges)
+        self.grouped = (badges, grouped)
+        self.badge_count = len(badges)
+        if self.store and badges:
+            with self.metrics.stage("store"):
+                self.store.sync(badges)
+        return badges
+
+    def metrics_report(self, status=None):
+        """The run metrics, see `services.metrics.RunMetrics.report`."""
+        self.metrics.count("pages", self.pages_fetched)
+        self.metrics.count("pages_not_modified", self.pages_not_modified)
+        if self.section_cache:
+            self.metrics.count("section_cache_hits", self.section_cache.hits)
+            self.metrics.count("section_cache_misses", self.section_cache.misses)
+        self.metrics.count("badges", self.badge_count)
+        self.metrics.count("issuers", len(self.grouped[1]) if self.grouped else 0)
+        return self.metrics.report(status)
 
     def get_markdown(self):
-        badges = self.return_badges_html()
+        badges = self.get_badges()
+        if not badges:
+            return None
+        if self.store:
+            return self.generate_grouped_md_format(self.store.grouped())
         return self.generate_md_format(badges)
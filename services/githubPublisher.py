@@ -0,0 +1,206 @@
+import base64
+import fnmatch
+import json
+import os
+import sys
+from urllib.parse import urlparse, parse_qs
+
+from settings import REPOSITORY, GH_TOKEN, GH_API_URL, COMMIT_MESSAGE, GH_BRANCH, CACHE_DIR
+from services import http_client
+from services.response_cache import ResponseCache
+from services.readme_splice import git_blob_sha
+
+
+class GithubPublisher:
+    """Publishes through the GitHub REST API directly, with the same interface as GithubRepo.
+
+    The README is read without a repository lookup, conditionally when a
+    cache is configured, and `save_readme` writes the README and any extra
+    files in a single commit through the Git Data API (blobs, tree, commit,
+    ref).
+    """
+
+    def __init__(self, repository=None, token=None, api_url=None, commit_message=None, branch=None):
+        self.COMMIT_MESSAGE = commit_message or COMMIT_MESSAGE
+        self.repository = repository or REPOSITORY
+        self.api_url = (api_url or GH_API_URL or "https://api.github.com").rstrip("/")
+        self.token = token or GH_TOKEN
+        self.branch = branch or GH_BRANCH
+        self.cache = ResponseCache(os.path.join(CACHE_DIR, "github"), self.repository) if CACHE_DIR else None
+
+        readme = self.fetch_readme()
+        self.path = readme["path"]
+        self.sha = readme["sha"]
+        self.content = readme["content"]
+        if not self.branch:
+            # The contents API reports the ref it read from in the `url` field
+            self.branch = parse_qs(urlparse(readme.get("url", "")).query).get("ref", [None])[0]
+
+    def headers(self):
+        headers = {"Accept": "application/vnd.github+json"}
+        if self.token:
+            headers["Authorization"] = f"token {self.token}"
+        return headers
+
+    def api(self, method, path, payload=None, headers=None):
+        headers = {**self.headers(), **(headers or {})}
+        if payload is not None:
+            headers["Content-Type"] = "application/json"
+        return http_client.request(
+            method, f"{self.api_url}/repos/{self.repository}{path}",
+            headers=headers,
+            data=json.dumps(payload) if payload is not None else None,
+        )
+
+    def fail(self, message, response):
+        print(f"{message} ({response.status_code}): {response.text}")
+        sys.exit(1)
+
+    def fetch_readme(self):
+        path = "/readme" + (f"?ref={self.branch}" if self.branch else "")
+        url = f"{self.api_url}/repos/{self.repository}{path}"
+        response = self.api("GET", path, headers=self.cache.validators(url, 0) if self.cache else None)
+
+        if response.status_code == 304 and self.cache:
+            cached = self.cache.get(url, 0)
+            if cached:
+                return json.loads(cached["body"])
+        if response.status_code != 200:
+            self.fail("The readme cannot be obtained!", response)
+        if self.cache:
+            self.cache.store(url, 0, response)
+        return response.json()
+
+    def get_readme(self):
+        return str(base64.b64decode(self.content), "utf-8")
+
+    def default_branch(self):
+        response = self.api("GET", "")
+        if response.status_code != 200:
+            self.fail("Authentication Error. Try saving a GitHub Token in your Repo Secrets or Use the GitHub Actions Token, which is automatically used by the action.", response)
+        return response.json()["default_branch"]
+
+    def tree_entry(self, path, content):
+        """Text goes inline in the tree; binary content is uploaded as a blob first."""
+        if isinstance(content, str):
+            return {"path": path, "mode": "100644", "type": "blob", "content": content}
+
+        response = self.api("POST", "/git/blobs", {
+            "content": base64.b64encode(content).decode("ascii"),
+            "encoding": "base64",
+        })
+        if response.status_code != 201:
+            self.fail(f"Cannot upload {path}", response)
+        return {"path": path, "mode": "100644", "type": "blob", "sha": response.json()["sha"]}
+
+    def tree_blobs(self, base_tree, directories=()):
+        """{path: blob sha} of every file in the tree.
+
+        GitHub truncates the recursive listing of very large trees; the files
+        of `directories` are then read one folder at a time instead.
+        """
+        response = self.api("GET", f"/git/trees/{base_tree}?recursive=1")
+        if response.status_code != 200:
+            self.fail(f"Cannot read tree {base_tree}", response)
+        listing = response.json()
+        if not listing.get("truncated"):
+            return {entry["path"]: entry["sha"] for entry in listing.get("tree", []) if entry.get("type", "blob") == "blob"}
+
+        print(f"The tree of {self.repository} is too large to list at once, reading {len(set(directories))} folder(s)")
+        blobs = {}
+        for directory in sorted(set(directories)):
+            blobs.update(self.folder_blobs(base_tree, directory))
+        return blobs
+
+    def tree_entries(self, tree):
+        response = self.api("GET", f"/git/trees/{tree}")
+        if response.status_code != 200:
+            self.fail(f"Cannot read tree {tree}", response)
+        return response.json().get("tree", [])
+
+    def folder_blobs(self, tree, directory):
+        """{path: blob sha} of the files directly in `directory` ("" for the root folder)."""
+        prefix = ""
+        for name in [part for part in directory.split("/") if part]:
+            tree = next(
+                (entry["sha"] for entry in self.tree_entries(tree) if entry["path"] == name and entry["type"] == "tree"),
+                None,
+            )
+            if tree is None:
+                return {}
+            prefix += f"{name}/"
+        return {
+            prefix + entry["path"]: entry["sha"]
+            for entry in self.tree_entries(tree) if entry.get("type", "blob") == "blob"
+        }
+
+    def changed_assets(self, existing, assets):
+        """Drop the assets already in the tree with the same content, so their blobs are not uploaded again."""
+        return {
+            path: content for path, content in assets.items()
+            if existing.get(path) != git_blob_sha(content)
+        }
+
+    def stale_paths(self, existing, assets, prune):
+        """The files of the tree matching a `prune` pattern that are not part of `assets`."""
+        return sorted(
+            path for path in existing
+            if path != self.path and path not in assets and any(fnmatch.fnmatchcase(path, pattern) for pattern in prune)
+        )
+
+    def save_readme(self, new_readme, assets=None, prune=()):
+        """Commit the README and `assets` ({path: str or bytes}) at once, returns the commit sha.
+
+        Files matching a `prune` glob pattern that are not in `assets` are
+        deleted in the same commit. The commit goes on top of the current
+        head of the branch, but only while its README is still the one that
+        was read: a README edited in between is never overwritten.
+        """
+        print(f"Generated Markdown size: {len(new_readme.encode('utf-8'))} bytes")
+        branch = self.branch or self.default_branch()
+
+        response = self.api("GET", f"/git/ref/heads/{branch}")
+        if response.status_code != 200:
+            self.fail(f"Cannot read branch {branch}", response)
+        parent = response.json()["object"]["sha"]
+
+        response = self.api("GET", f"/git/commits/{parent}")
+        if response.status_code != 200:
+            self.fail(f"Cannot read commit {parent}", response)
+        base_tree = response.json()["tree"]["sha"]
+
+        # The folders of every file this commit may touch, for trees too large to list at once
+        folders = {path.rpartition("/")[0] for path in [self.path, *(assets or {}), *prune]}
+        existing = self.tree_blobs(base_tree, folders)
+        if existing.get(self.path) != self.sha:
+            print(f"{self.path} changed in {self.repository}@{branch} since it was read, not overwriting it")
+            sys.exit(1)
+
+        changed = self.changed_assets(existing, assets or {})
+        stale = self.stale_paths(existing, assets or {}, prune)
+        if not changed and not stale and git_blob_sha(new_readme) == self.sha:
+            print(f"Nothing to commit to {self.repository}@{branch}")
+            return parent
+        files = {self.path: new_readme, **changed}
+        response = self.api("POST", "/git/trees", {
+            "base_tree": base_tree,
+            "tree": [self.tree_entry(path, content) for path, content in files.items()]
+            + [{"path": path, "mode": "100644", "type": "blob", "sha": None} for path in stale],
+        })
+        if response.status_code != 201:
+            self.fail("Cannot create tree", response)
+        tree = response.json()["sha"]
+
+        response = self.api("POST", "/git/commits", {
+            "message": self.COMMIT_MESSAGE, "tree": tree, "parents": [parent],
+        })
+        if response.status_code != 201:
+            self.fail("Cannot create commit", response)
+        commit = response.json()["sha"]
+
+        # Not forced: if the branch moved after `parent` was read, the update is rejected
+        response = self.api("PATCH", f"/git/refs/heads/{branch}", {"sha": commit, "force": False})
+        if response.status_code != 200:
+            self.fail(f"Cannot update branch {branch}", response)
+        print(f"Committed {len(files)} file(s), deleted {len(stale)} to {self.repository}@{branch}: {commit}")
+        return commit
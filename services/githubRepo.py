@@ -1,17 +1,19 @@
 from github import Github, GithubException
 
 from settings import REPOSITORY, GH_TOKEN, GH_API_URL, COMMIT_MESSAGE
+from services.readme_splice import git_blob_sha
 import sys, base64
 
 class GithubRepo:
-    def __init__(self):
-        self.COMMIT_MESSAGE=COMMIT_MESSAGE
+    def __init__(self, repository=None, github=None, commit_message=None):
+        """Settings come from the action inputs; batch mode passes a repository and a shared client."""
+        self.COMMIT_MESSAGE = commit_message or COMMIT_MESSAGE
 
         # Automatic GitHub API detection.
-        g = Github(base_url=GH_API_URL, login_or_token=GH_TOKEN)
+        g = github or Github(base_url=GH_API_URL, login_or_token=GH_TOKEN)
 
         try:
-            self.repo = g.get_repo(REPOSITORY)
+            self.repo = g.get_repo(repository or REPOSITORY)
         except GithubException:
             print(
                 "Authentication Error. Try saving a GitHub Token in your Repo Secrets or Use the GitHub Actions Token, which is automatically used by the action."
@@ -19,17 +21,33 @@ class GithubRepo:
             sys.exit(1)
         try:
             self.contents_repo = self.repo.get_readme()
+            self.sha = self.contents_repo.sha
         except Exception:
             print(
                 "The readme cannot be obtained!"
             )
             sys.exit(1)
 
-    def save_readme(self, new_readme):
+    def save_readme(self, new_readme, assets=None, prune=()):
         print(f"Generated Markdown size: {len(new_readme.encode('utf-8'))} bytes")
-        self.repo.update_file(
-            path=self.contents_repo.path, message=self.COMMIT_MESSAGE, content=new_readme, sha=self.contents_repo.sha
-        )
+        if assets or prune:
+            # The contents API makes one commit per file: generated files go with the README
+            # in a single commit through the Git Data API instead
+            return self.save_with_assets(new_readme, assets or {}, prune)
+        if git_blob_sha(new_readme) != self.sha:
+            self.repo.update_file(
+                path=self.contents_repo.path, message=self.COMMIT_MESSAGE, content=new_readme, sha=self.contents_repo.sha
+            )
     
     def get_readme(self):
         return str(base64.b64decode(self.contents_repo.content), "utf-8")
+
+    def save_with_assets(self, new_readme, assets, prune):
+        """Commit the README, `assets` and the deletion of stale `prune` matches at once, see `GithubPublisher.save_readme`."""
+        from services.githubPublisher import GithubPublisher
+
+        publisher = GithubPublisher(self.repo.full_name, commit_message=self.COMMIT_MESSAGE)
+        # Only commit on top of the README this run spliced, not one edited since
+        publisher.path = self.contents_repo.path
+        publisher.sha = self.sha
+        return publisher.save_readme(new_readme, assets, prune)
@@ -0,0 +1,150 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+from settings import (
+    HTTP_RETRIES,
+    HTTP_BACKOFF,
+    HTTP_MAX_RETRY_AFTER,
+    HTTP_POOL_SIZE,
+    HTTP_TIMEOUT,
+    CREDLY_CONCURRENCY,
+)
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+_session = None
+_session_lock = threading.Lock()
+
+# Counters shared by every caller of this module.
+stats = {"requests": 0, "retries": 0, "bytes": 0, "elapsed": 0.0}
+_stats_lock = threading.Lock()
+# Per-run counters the current thread also adds to, see `track`
+_local = threading.local()
+
+
+def get_session():
+    """Return the process-wide session, keeping connections alive and pooled."""
+    global _session
+    if _session is None:
+        # requests is only imported by runs that go to the network
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        with _session_lock:
+            if _session is None:
+                pool_size = max(HTTP_POOL_SIZE, CREDLY_CONCURRENCY)
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({"Accept-Encoding": "gzip, deflate"})
+                _session = session
+    return _session
+
+
+def retry_after(response):
+    """Seconds requested by a Retry-After header, at most HTTP_MAX_RETRY_AFTER, or None if absent or invalid."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = (when - datetime.now(timezone.utc)).total_seconds()
+    return min(max(0.0, seconds), HTTP_MAX_RETRY_AFTER)
+
+
+def backoff(attempt):
+    """Exponential backoff plus a random jitter of up to one base delay."""
+    return HTTP_BACKOFF * (2 ** attempt) + random.uniform(0, HTTP_BACKOFF)
+
+
+def track(*counters):
+    """Make the calling thread also count its requests, retries, bytes and elapsed time in `counters`.
+
+    Worker threads started for the same run pass
+    `initializer=track, initargs=tracked()` to their executor.
+    """
+    _local.counters = counters
+
+
+def tracked():
+    """The counters the calling thread adds to besides `stats`."""
+    return getattr(_local, "counters", ())
+
+
+def _add(name, value):
+    with _stats_lock:
+        stats[name] += value
+        for counters in tracked():
+            counters[name] = counters.get(name, 0) + value
+
+
+def _record(response, elapsed, streamed=False):
+    _add("requests", 1)
+    _add("elapsed", elapsed)
+    # A streamed body is counted while it is read, see `iter_content`
+    if response is not None and not streamed:
+        _add("bytes", len(response.content))
+
+
+def request(method, url, headers=None, **kwargs):
+    """Send a request through the shared session, retrying throttled and failed calls.
+
+    429 and 5xx responses and connection errors are retried up to HTTP_RETRIES
+    times. The last response is returned as is, so callers keep checking
+    `status_code`; a connection error on the last attempt is raised.
+    """
+    import requests
+
+    kwargs.setdefault("timeout", HTTP_TIMEOUT)
+    session = get_session()
+
+    attempt = 0
+    while True:
+        start = time.perf_counter()
+        try:
+            response = session.request(method, url, headers=headers, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            elapsed = time.perf_counter() - start
+            _record(None, elapsed)
+            if attempt >= HTTP_RETRIES:
+                raise
+            delay = backoff(attempt)
+            print(f"{method} {url} - {e.__class__.__name__}, retrying in {delay:.2f} seconds...")
+        else:
+            elapsed = time.perf_counter() - start
+            _record(response, elapsed, kwargs.get("stream", False))
+            print(f"{method} {url} - {response.status_code} in {elapsed * 1000:.0f} ms")
+            if response.status_code not in RETRY_STATUS or attempt >= HTTP_RETRIES:
+                return response
+            delay = retry_after(response)
+            if delay is None:
+                delay = backoff(attempt)
+            print(f"Retrying in {delay:.2f} seconds...")
+            # Hands the connection of an unread streamed body back to the pool
+            response.close()
+
+        _add("retries", 1)
+        time.sleep(delay)
+        attempt += 1
+
+
+def get(url, headers=None, **kwargs):
+    return request("GET", url, headers=headers, **kwargs)
+
+
+def iter_content(response, chunk_size):
+    """Yield the body of a `stream=True` response chunk by chunk, counting its bytes as they arrive."""
+    for chunk in response.iter_content(chunk_size):
+        _add("bytes", len(chunk))
+        yield chunk
@@ -0,0 +1,183 @@
+import re
+from functools import lru_cache
+from string import Formatter
+
+from services.org_info import lookup as org_lookup
+
+TABLE_HEADER = (
+    '<table width="100%" border="1" cellspacing="0" cellpadding="4">\n'
+    '  <tr>\n    <th width="20%">Badge</th>\n    <th width="80%">Description</th>\n  </tr>\n'
+)
+
+TABLE_ROW = (
+    '  <tr>\n'
+    '    <td align="center" width="20%" style="padding:10px">\n'
+    '      <a href="{href}">\n'
+    '        <img src="{img}" width="100">\n'
+    '      </a><br/>\n'
+    '      <a href="{href}">{title} - {issuer}</a>\n'
+    '    </td>\n'
+    '    <td width="80%" style="padding:10px">\n'
+    '      <strong>Description:</strong> {description} <a href="{href}">Read more here</a><br/>\n'
+    '      <strong>Skills:</strong> {skills}<br/>\n'
+    '      <strong>Criteria:</strong> {criteria} <a href="{href}">Read more here</a><br/>\n'
+    '      <strong>Time to Earn:</strong> {time_to_earn}<br/>\n'
+    '      <strong>Level:</strong> {level}\n'
+    '    </td>\n'
+    '  </tr>\n'
+)
+
+TABLE_HIDDEN_ROW = (
+    '  <tr>\n'
+    '    <td align="center" width="20%" style="padding:10px">\n'
+    '      <a href="{href}">\n'
+    '        <img src="{img}" width="100"/>\n'
+    '      </a><br/>\n'
+    '      <a href="{href}">{title} - {issuer}</a>\n'
+    '    </td>\n'
+    '    <td width="80%" style="padding:10px">\n'
+    '      <strong>Read more:</strong> <a href="{href}">here</a><br/>\n'
+    '    </td>\n'
+    '  </tr>\n'
+)
+
+GRID_ROW = '  <a href="{href}" title="{title} - {issuer}"><img src="{img}" width="100"></a>\n'
+
+LIST_ROW = '- [{title}]({href}) - {issuer}\n'
+
+# Paid training badges, never listed among the collapsed badges of their issuer
+PAID_TRAININGS = {
+    ("LFS256: DevOps and Workflow Management with Argo", "The Linux Foundation"),
+    ("CAPA: Certified Argo Project Associate", "The Linux Foundation"),
+}
+
+# name: (header, row, hidden row, footer). Hidden rows only get href, img, title and issuer.
+LAYOUTS = {
+    "table": (TABLE_HEADER, TABLE_ROW, TABLE_HIDDEN_ROW, '</table>\n\n\n'),
+    "grid": ('<p align="left">\n', GRID_ROW, GRID_ROW, '</p>\n\n\n'),
+    "list": ('', LIST_ROW, LIST_ROW, '\n\n'),
+}
+
+
+def word_limit(text, limit=20):
+    words = text.split()
+    return " ".join(words[:limit]) + ("..." if len(words) > limit else "")
+
+
+def visible_badges(badges):
+    """`badges` without the paid training badges."""
+    return [badge for badge in badges if (badge["title"].strip(), badge["issuer"].strip()) not in PAID_TRAININGS]
+
+
+def row_fields(badge):
+    """Template fields for a badge: truncated texts and the first 5 skills."""
+    memoized = getattr(badge, "row_fields", None)
+    if memoized is not None:
+        # `Badge` records keep these per badge template
+        return memoized()
+    return {
+        "href": badge["href"],
+        "img": badge["img"],
+        "title": badge["title"],
+        "issuer": badge["issuer"],
+        "description": word_limit(badge["description"]),
+        "criteria": word_limit(badge["criteria"]),
+        "skills": ", ".join(badge["skills"][:5] if badge["skills"] else []),
+        "time_to_earn": badge.get("time_to_earn", "N/A"),
+        "level": badge.get("level", "N/A"),
+    }
+
+
+def hidden_row_fields(badge):
+    memoized = getattr(badge, "hidden_row_fields", None)
+    if memoized is not None:
+        return memoized()
+    return {"href": badge["href"], "img": badge["img"], "title": badge["title"], "issuer": badge["issuer"]}
+
+
+def row_pattern(template):
+    """A regex matching the rows rendered from `template`, with named groups for its fields.
+
+    The title is greedy so that, like a `rsplit(" - ", 1)`, titles holding
+    " - " keep it and the issuer is the last part.
+    """
+    pattern = []
+    seen = set()
+    for literal, name, _, _ in Formatter().parse(template):
+        pattern.append(re.escape(literal))
+        if name is None:
+            continue
+        if name in seen:
+            pattern.append(f"(?P={name})")
+        else:
+            seen.add(name)
+            pattern.append(f"(?P<{name}>[^\n]*)" if name == "title" else f"(?P<{name}>[^\n]*?)")
+    return re.compile("".join(pattern))
+
+
+class Layout:
+    """A badge table layout, compiled once and rendered for many rows."""
+
+    def __init__(self, name, header, row, hidden_row, footer):
+        self.name = name
+        self.header = header
+        self.footer = footer
+        # Bound format_map methods, looked up once per layout rather than per row
+        self.render_row = row.format_map
+        self.render_hidden_row = hidden_row.format_map
+        self.row_patterns = tuple({row_pattern(template) for template in (row, hidden_row)})
+
+    def iter_rows(self, badges):
+        render = self.render_row
+        for badge in badges:
+            yield render(row_fields(badge))
+
+    def iter_hidden_rows(self, badges):
+        render = self.render_hidden_row
+        for badge in badges:
+            yield render(hidden_row_fields(badge))
+
+    def parse_rows(self, text):
+        """(title, issuer) of every row of this layout found in `text`, in order of appearance."""
+        matches = [match for pattern in self.row_patterns for match in pattern.finditer(text)]
+        matches.sort(key=lambda match: match.start())
+        return [(match["title"].strip(), match["issuer"].strip()) for match in matches]
+
+    def iter_table(self, badges, hidden=False):
+        yield self.header
+        yield from (self.iter_hidden_rows(badges) if hidden else self.iter_rows(badges))
+        yield self.footer
+
+    def iter_issuer_section(self, issuer, badges):
+        """Yield the section of one issuer: heading, organization table and badge tables.
+
+        The README renderer and `CredlyUpdater` both write issuer sections
+        through here, so sections spliced into an existing README match it.
+        """
+        org = org_lookup(issuer)
+        yield (
+            f"\n\n### {issuer} ({len(badges)})\n\n"
+            '<strong><a href="#user-content-free-credly-badges">Back to Top ⬆️</a></strong>\n\n'
+            # Header table for issuer info
+            "| Issuing Organization | Description | Credly Badges | Verified | Organization Link |\n"
+            "|        :---:         |-------------|     :---:     |   :---:  |       :---:       |\n"
+            f"| <img src='{org.logo}' height='100' /><br/>[{issuer}](#{org.anchor}-{len(badges)}) | {org.description} | {len(badges)} | ✅ | [{issuer}]({org.link}) |\n\n"
+        )
+
+        # --- First 3 badges ---
+        yield from self.iter_table(badges[:3])
+
+        # --- Remaining badges in <details> ---
+        if len(badges) > 3:
+            yield f'\n\n<details><summary>More {issuer} ({len(badges) - 3})</summary>\n\n'
+            yield from self.iter_table(visible_badges(badges[3:]), hidden=True)
+            yield '</details>\n\n'  # <-- make sure <details> is closed
+
+
+@lru_cache(maxsize=None)
+def get_layout(name):
+    """The compiled layout called `name`, falling back to the table layout."""
+    if name not in LAYOUTS:
+        print(f"Unknown badge layout '{name}', using 'table'")
+        name = "table"
+    return Layout(name, *LAYOUTS[name])
@@ -0,0 +1,148 @@
+import contextlib
+import io
+import json
+import os
+import threading
+import time
+
+from services import http_client
+
+# Stages in the order a run goes through them.
+STAGES = ("fetch", "convert", "group", "render", "splice", "publish")
+
+
+class RunMetrics:
+    """Wall time per stage and counters for one run (one Credly user).
+
+    `seconds` is the wall time between `start` and `stop`; stages can
+    overlap or leave gaps, so it is not their sum. HTTP requests, bytes and
+    retries are counted for this run only: `start` tracks the calling thread
+    with `http_client.track`, and the worker threads of the run inherit its
+    counters, so parallel batch targets do not see each other's traffic.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.counters = {}
+        self.lock = threading.Lock()
+        self.http = {"requests": 0, "retries": 0, "bytes": 0, "elapsed": 0.0}
+        self.started_at = time.perf_counter()
+        self.stopped_at = None
+
+    def start(self):
+        """Start the wall clock and count the HTTP traffic of the calling thread for this run."""
+        self.started_at = time.perf_counter()
+        self.stopped_at = None
+        http_client.track(self.http)
+
+    def stop(self):
+        self.stopped_at = time.perf_counter()
+        http_client.track()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self.lock:
+                self.stages[name] = self.stages.get(name, 0.0) + elapsed
+
+    def count(self, name, value):
+        self.counters[name] = value
+
+    def report(self, status=None):
+        http = self.http
+        seconds = (self.stopped_at or time.perf_counter()) - self.started_at
+        stages = {name: round(self.stages[name], 4) for name in STAGES if name in self.stages}
+        stages.update({name: round(seconds, 4) for name, seconds in self.stages.items() if name not in STAGES})
+        return {
+            "status": status,
+            "seconds": round(seconds, 4),
+            "stages": stages,
+            "counters": {
+                **self.counters,
+                "requests": http["requests"],
+                "bytes": http["bytes"],
+                "retries": http["retries"],
+            },
+        }
+
+
+def write_json(report, path):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+
+
+def summary_markdown(report, title="Credly badges"):
+    lines = [f"### {title}: {report['status']}", "", "| Stage | Seconds |", "| --- | ---: |"]
+    lines += [f"| {name} | {seconds:.3f} |" for name, seconds in report["stages"].items()]
+    lines += [f"| **total** | **{report['seconds']:.3f}** |", "", "| Counter | Value |", "| --- | ---: |"]
+    lines += [f"| {name} | {value} |" for name, value in report["counters"].items()]
+    return "\n".join(lines) + "\n\n"
+
+
+def write_step_summary(report, path=None, title="Credly badges"):
+    """Append the report as tables to the GitHub Actions job summary, when running in Actions."""
+    path = path or os.getenv("GITHUB_STEP_SUMMARY")
+    if not path:
+        return False
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.write(summary_markdown(report, title))
+    return True
+
+
+@contextlib.contextmanager
+def profiled(mode, output):
+    """Run the block under cProfile or tracemalloc and save what they saw next to `output`.
+
+    cProfile writes `<output>.prof` (for pstats / snakeviz) and the 50 most
+    expensive functions to `<output>.txt`; tracemalloc writes the peak and
+    the 50 largest allocation sites to `<output>.txt`.
+    """
+    if mode not in ("cprofile", "tracemalloc"):
+        if mode:
+            print(f"Unknown PROFILE '{mode}', running without profiler")
+        yield
+        return
+
+    directory = os.path.dirname(output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    if mode == "cprofile":
+        import cProfile
+        import pstats
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            profiler.dump_stats(f"{output}.prof")
+            text = io.StringIO()
+            pstats.Stats(profiler, stream=text).sort_stats("cumulative").print_stats(50)
+            with open(f"{output}.txt", "w", encoding="utf-8") as fh:
+                fh.write(text.getvalue())
+            print(f"Profile saved to {output}.prof and {output}.txt")
+        return
+
+    import tracemalloc
+
+    tracemalloc.start(25)
+    try:
+        yield
+    finally:
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        with open(f"{output}.txt", "w", encoding="utf-8") as fh:
+            fh.write(f"current {current} bytes, peak {peak} bytes\n\n")
+            for stat in snapshot.statistics("lineno")[:50]:
+                fh.write(f"{stat}\n")
+        print(f"Memory profile saved to {output}.txt")
@@ -0,0 +1,135 @@
+import codecs
+import json
+import re
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+DECODER = json.JSONDecoder()
+
+# The parts of an API badge that `services.badge.badge_from_api` and the
+# incremental fetch read; everything else is dropped while parsing.
+BADGE_KEYS = ("id", "state_updated_at", "issued_at")
+TEMPLATE_KEYS = ("id", "name", "url", "image_url", "description", "time_to_earn", "skills", "level")
+
+
+def slim_badge(badge):
+    """A copy of an API badge holding only the fields used to build badge records."""
+    slim = {key: badge[key] for key in BADGE_KEYS if key in badge}
+    issuer = badge.get("issuer")
+    if issuer is not None:
+        slim["issuer"] = {"entities": [
+            {"entity": {"name": entity["entity"]["name"]}} for entity in issuer.get("entities", [])[:1]
+        ]}
+    template = badge.get("badge_template")
+    if template is not None:
+        slim_template = {key: template[key] for key in TEMPLATE_KEYS if key in template}
+        if "badge_template_activities" in template:
+            slim_template["badge_template_activities"] = [
+                {"title": activity["title"]} if isinstance(activity, dict) and "title" in activity else {}
+                for activity in template["badge_template_activities"]
+                if isinstance(activity, dict)
+            ]
+        slim["badge_template"] = slim_template
+    return slim
+
+
+class PageReader:
+    """The text of a page, read from its chunks only as far as the parser needs.
+
+    Chunks are `bytes` (decoded incrementally as UTF-8) or `str`. The parser
+    drops the text it is done with, so only the value being decoded and the
+    rest of the current chunk are held, never the whole body.
+    """
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.done = False
+
+    def more(self):
+        """Append the next chunk to `text`; False once the page is read to the end."""
+        for chunk in self.chunks:
+            text = self.decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+            if text:
+                self.text += text
+                return True
+        if self.done:
+            return False
+        self.done = True
+        # Raises on a body cut in the middle of a character
+        text = self.decoder.decode(b"", final=True)
+        self.text += text
+        return bool(text)
+
+    def skip(self, index, expected=None):
+        """Index of the next non-blank character, checked against `expected` when given."""
+        while True:
+            index = WHITESPACE.match(self.text, index).end()
+            if index < len(self.text) or not self.more():
+                break
+        if expected is not None and self.text[index:index + 1] != expected:
+            raise ValueError(f"Expected {expected!r} in badges page")
+        return index
+
+    def at(self, index):
+        return self.text[index:index + 1]
+
+    def decode(self, index):
+        """The JSON value starting at `index` and the index after it."""
+        while True:
+            try:
+                value, end = DECODER.raw_decode(self.text, index)
+            except json.JSONDecodeError:
+                if self.more():
+                    continue
+                raise
+            # A number ending the text read so far may go on in the next chunk
+            if end < len(self.text) or not self.more():
+                return value, end
+
+    def drop(self, index):
+        """Forget the text before `index`; returns the same position in the remaining text."""
+        self.text = self.text[index:]
+        return 0
+
+
+def parse_page(chunks):
+    """Decode a badges page, slimming every entry of `data` as soon as it is decoded.
+
+    `chunks` is the body as an iterable of chunks, e.g. from
+    `http_client.iter_content`, or a whole page as one `str`. The top-level
+    object is walked with `JSONDecoder.raw_decode`, one value at a time:
+    `metadata` and the other small keys are kept as they are, while the
+    `data` array is decoded badge by badge as its chunks arrive, so only one
+    full API badge exists at any moment next to the slimmed ones.
+    """
+    reader = PageReader([chunks] if isinstance(chunks, str) else chunks)
+    page = {}
+    index = reader.skip(0, "{") + 1
+    index = reader.skip(index)
+    if reader.at(index) == "}":
+        return page
+    while True:
+        key, index = reader.decode(reader.skip(index, '"'))
+        index = reader.skip(index, ":") + 1
+        index = reader.skip(index)
+        if key == "data" and reader.at(index) == "[":
+            badges = page["data"] = []
+            index = reader.skip(index + 1)
+            if reader.at(index) == "]":
+                index += 1
+            else:
+                while True:
+                    badge, index = reader.decode(index)
+                    badges.append(slim_badge(badge))
+                    index = reader.drop(reader.skip(index))
+                    if reader.at(index) == "]":
+                        index += 1
+                        break
+                    index = reader.skip(reader.skip(index, ",") + 1)
+        else:
+            page[key], index = reader.decode(index)
+        index = reader.skip(index)
+        if reader.at(index) == "}":
+            return page
+        index = reader.skip(index, ",") + 1
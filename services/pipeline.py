@@ -0,0 +1,116 @@
+import queue
+import threading
+
+from services import http_client
+
+# Marks the end of a stage's output.
+DONE = object()
+
+
+class Cancelled(Exception):
+    """Raised inside a stage when another stage failed."""
+
+
+class Pipeline:
+    """Fetch -> convert -> group, each stage in its own thread, linked by bounded queues.
+
+    `pages` is an iterable of decoded pages (fetched lazily, in page order)
+    and `convert` turns one API badge into a badge record. While page N+1
+    downloads, page N is converted and its badges grouped by issuer. A full
+    queue blocks the stage feeding it, so at most `depth` pages wait between
+    two stages. The first exception in any stage cancels the others and is
+    raised again by `run`.
+    """
+
+    def __init__(self, pages, convert, depth=4):
+        self.pages = pages
+        self.convert = convert
+        self.fetched = queue.Queue(maxsize=depth)
+        self.converted = queue.Queue(maxsize=depth)
+        self.cancelled = threading.Event()
+        self.error = None
+
+    def put(self, target, item):
+        while True:
+            if self.cancelled.is_set():
+                raise Cancelled()
+            try:
+                target.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def get(self, source):
+        while True:
+            if self.cancelled.is_set():
+                raise Cancelled()
+            try:
+                return source.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+    def fail(self, error):
+        if not isinstance(error, Cancelled) and self.error is None:
+            self.error = error
+        self.cancelled.set()
+
+    def fetch_stage(self, counters=()):
+        # The pages are fetched for the run that started the pipeline
+        http_client.track(*counters)
+        pages = iter(self.pages)
+        try:
+            for data in pages:
+                self.put(self.fetched, data["data"])
+            self.put(self.fetched, DONE)
+        except BaseException as e:
+            self.fail(e)
+        finally:
+            # Stops a concurrent page fetch that is still running
+            close = getattr(pages, "close", None)
+            if close:
+                close()
+
+    def convert_stage(self):
+        try:
+            while True:
+                raw = self.get(self.fetched)
+                if raw is DONE:
+                    break
+                self.put(self.converted, [self.convert(badge) for badge in raw])
+            self.put(self.converted, DONE)
+        except BaseException as e:
+            self.fail(e)
+
+    def run(self):
+        """(badges in API order, badges grouped by issuer like `Credly.group_badges`)."""
+        stages = [
+            threading.Thread(target=self.fetch_stage, args=(http_client.tracked(),), name="pipeline-fetch", daemon=True),
+            threading.Thread(target=self.convert_stage, name="pipeline-convert", daemon=True),
+        ]
+        for stage in stages:
+            stage.start()
+
+        badges = []
+        groups = {}
+        try:
+            while True:
+                chunk = self.get(self.converted)
+                if chunk is DONE:
+                    break
+                badges.extend(chunk)
+                for badge in chunk:
+                    group = groups.get(badge["issuer"])
+                    if group is None:
+                        group = groups[badge["issuer"]] = []
+                    group.append(badge)
+        except BaseException as e:
+            self.fail(e)
+        finally:
+            for stage in stages:
+                stage.join()
+
+        if self.error is not None:
+            raise self.error
+        # Issuers first seen earlier stay first among case variants, as with a stable sort
+        grouped = {issuer: groups[issuer] for issuer in sorted(groups, key=str.lower)}
+        return badges, grouped
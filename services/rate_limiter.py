@@ -0,0 +1,34 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to pace outbound requests.
+
+    `rate` tokens are added per second up to `capacity`; every call to
+    `acquire` takes one token and sleeps until it is available.
+    """
+
+    def __init__(self, rate, capacity=1):
+        self.rate = float(rate)
+        self.capacity = max(1, int(capacity))
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        if self.rate <= 0:
+            return 0.0
+
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            # Reserve the token now and sleep outside the lock, so waiting
+            # workers are released in the order they asked.
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
@@ -0,0 +1,107 @@
+import hashlib
+import re
+
+from settings import START_COMMENT, END_COMMENT
+
+# Start marker of the default section (`badges`) and of named ones (`badges:recent`, `badges:issuer=AWS`).
+SECTION_START = re.compile(r"<!--START_SECTION:(badges(?::[^>]*?)?)-->")
+DEFAULT_SECTION = "badges"
+
+
+def git_blob_sha(content):
+    """The sha git (and the GitHub contents API) gives to a file with this text or bytes content."""
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def find_section(readme, start=START_COMMENT, end=END_COMMENT):
+    """Locate the markers with linear scans, returns (start, end) offsets or None.
+
+    Like the former `START[\\s\\S]*END` regex, the section runs from the first
+    start marker to the last end marker after it. The returned span covers
+    both markers.
+    """
+    begin = readme.find(start)
+    if begin == -1:
+        return None
+    finish = readme.rfind(end, begin + len(start))
+    if finish == -1:
+        return None
+    return begin, finish + len(end)
+
+
+def splice(readme, body, start=START_COMMENT, end=END_COMMENT):
+    """Replace the text between the markers with `body`, taken literally.
+
+    The README is rebuilt from three slices. When the current section
+    already holds the new body, the original string is returned untouched.
+    """
+    span = find_section(readme, start, end)
+    if span is None:
+        return readme
+
+    begin, finish = span
+    current = readme[begin + len(start):finish - len(end)]
+    new = f"\n{body}\n"
+    if current == new:
+        return readme
+
+    return readme[:begin] + start + new + end + readme[finish:]
+
+
+def find_sections(readme):
+    """Scan the README once for badge sections, returns [(name, start, end)] in order.
+
+    Named sections end at their first matching end marker; the default
+    section keeps the first-start-to-last-end span of `find_section`.
+    """
+    sections = []
+    position = 0
+    while True:
+        match = SECTION_START.search(readme, position)
+        if match is None:
+            return sections
+        name = match.group(1)
+        end = f"<!--END_SECTION:{name}-->"
+        if name == DEFAULT_SECTION:
+            finish = readme.rfind(end, match.end())
+        else:
+            finish = readme.find(end, match.end())
+        if finish == -1:
+            position = match.end()
+            continue
+        sections.append((name, match.start(), finish + len(end)))
+        position = finish + len(end)
+
+
+def splice_sections(readme, bodies, sections=None):
+    """Replace every section found in the README with `bodies[name]`, in a single rebuild.
+
+    `sections` are the spans from `find_sections`, scanned here when not given.
+    Sections without a body (missing or empty) are left as they are, and the
+    original string is returned when no section changed.
+    """
+    if sections is None:
+        sections = find_sections(readme)
+    parts = []
+    position = 0
+    changed = False
+    for name, begin, finish in sections:
+        body = bodies.get(name)
+        if not body:
+            continue
+        start = f"<!--START_SECTION:{name}-->"
+        end = f"<!--END_SECTION:{name}-->"
+        current = readme[begin + len(start):finish - len(end)]
+        new = f"\n{body}\n"
+        if current == new:
+            continue
+        parts.append(readme[position:begin])
+        parts.append(start + new + end)
+        position = finish
+        changed = True
+
+    if not changed:
+        return readme
+    parts.append(readme[position:])
+    return "".join(parts)
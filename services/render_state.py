@@ -0,0 +1,34 @@
+import hashlib
+import json
+import os
+
+
+class RenderState:
+    """Tiny record of what the last run published for one repository / Credly user.
+
+    Holds the names of the badge sections found in the README, the hash of
+    their rendered bodies, the blob sha of the README that was written and
+    the hash of the static site files.
+    """
+
+    def __init__(self, directory, scope):
+        os.makedirs(directory, exist_ok=True)
+        key = hashlib.sha256(scope.encode("utf-8")).hexdigest()[:32]
+        self.path = os.path.join(directory, f"{key}.json")
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self, sections, bodies_hash, readme_sha, site_hash=None):
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"sections": sections, "bodies_hash": bodies_hash, "readme_sha": readme_sha, "site_hash": site_hash}, fh)
+        os.replace(tmp, self.path)
+
+
+def bodies_hash(bodies):
+    return hashlib.sha256(json.dumps(sorted(bodies.items())).encode("utf-8")).hexdigest()
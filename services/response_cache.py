@@ -0,0 +1,64 @@
+import hashlib
+import json
+import os
+
+
+class ResponseCache:
+    """On-disk cache of page bodies and their validators (ETag / Last-Modified).
+
+    Entries are keyed by URL and page number, one JSON file per entry, so
+    concurrent page workers never write to the same file. `scope` separates
+    callers that request the same URLs with different credentials.
+    """
+
+    def __init__(self, directory, scope=""):
+        self.directory = directory
+        self.scope = scope
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, url, page):
+        key = hashlib.sha256(f"{self.scope}|{url}|{page}".encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, url, page):
+        try:
+            with open(self.path(url, page), "r", encoding="utf-8") as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return None
+
+    def validators(self, url, page):
+        """Conditional request headers for a cached entry."""
+        entry = self.get(url, page)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def entry(self, response, body=None):
+        """The cache entry of a response, or None when it has no validators.
+
+        `body` replaces the response text, e.g. for a streamed response the
+        caller already decoded.
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return None
+        return {"etag": etag, "last_modified": last_modified, "body": response.text if body is None else body}
+
+    def put(self, url, page, entry):
+        path = self.path(url, page)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(entry, fh)
+        os.replace(tmp, path)
+
+    def store(self, url, page, response):
+        entry = self.entry(response)
+        if entry:
+            self.put(url, page, entry)
@@ -0,0 +1,81 @@
+import hashlib
+import json
+import os
+
+# Bump when the markup of an issuer section changes, to invalidate cached sections.
+RENDER_VERSION = "1"
+
+# Sections kept on disk; the least recently used ones beyond this are deleted by `prune`.
+MAX_ENTRIES = 1000
+
+# Badge fields that end up in a rendered section.
+RENDERED_FIELDS = ("title", "href", "img", "issuer", "description", "criteria", "skills", "time_to_earn", "level")
+
+
+class SectionCache:
+    """On-disk cache of rendered issuer sections, keyed by a hash of their content.
+
+    The key covers the render version, the layout, the organization info and
+    the rendered fields of every badge in the group, so a section is only
+    re-rendered when something it shows has changed. Reading or writing a
+    section refreshes its mtime, which `prune` uses to evict the least
+    recently used ones, so the directory does not grow with every change.
+    """
+
+    def __init__(self, directory, max_entries=MAX_ENTRIES):
+        self.directory = directory
+        self.max_entries = max_entries
+        os.makedirs(directory, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, issuer, badges, layout, org=None):
+        payload = {
+            "version": RENDER_VERSION,
+            "layout": layout,
+            "issuer": issuer,
+            "org": list(org) if org else None,
+            "badges": [[badge.get(field) for field in RENDERED_FIELDS] for badge in badges],
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, f"{key}.md")
+
+    def get(self, key):
+        path = self.path(key)
+        try:
+            with open(path, "r", encoding="utf-8", newline="") as fh:
+                section = fh.read()
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return section
+
+    def put(self, key, section):
+        path = self.path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8", newline="") as fh:
+            fh.write(section)
+        os.replace(tmp, path)
+
+    def prune(self):
+        """Delete the least recently used sections beyond `max_entries`, returns how many were deleted."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".md"):
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    pass
+        entries.sort(reverse=True)
+        deleted = 0
+        for _, path in entries[self.max_entries:]:
+            try:
+                os.remove(path)
+                deleted += 1
+            except OSError:
+                pass
+        return deleted
@@ -0,0 +1,217 @@
+import hashlib
+import json
+
+from services.layouts import row_fields
+from services.org_info import lookup
+
+SITE_VERSION = 1
+
+
+def site_record(badge):
+    """The fields the page shows for a badge, texts already truncated like the README rows."""
+    fields = row_fields(badge)
+    return {
+        "title": fields["title"],
+        "href": fields["href"],
+        "img": fields["img"],
+        "issuer": fields["issuer"],
+        "description": fields["description"],
+        "skills": fields["skills"],
+        "level": fields["level"],
+        "issued_at": badge.get("issued_at") or "",
+    }
+
+
+def dumps(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+
+
+class StaticSite:
+    """Badges as fixed-size JSON shards, a manifest and a page that loads them lazily.
+
+    Two orderings are written, by issuer and newest first. Shard file names
+    carry a hash of their content, so browsers can cache them for good and
+    the shards that did not change are not published again; only
+    `manifest.json` and `index.html` keep a fixed path.
+    """
+
+    def __init__(self, directory="site", shard_size=100):
+        self.directory = directory.strip("/")
+        self.shard_size = max(1, int(shard_size))
+
+    def path(self, name):
+        return f"{self.directory}/{name}" if self.directory else name
+
+    def prune_patterns(self):
+        """Patterns of the shards published by this run or earlier ones; the ones a new build drops are deleted."""
+        return {self.path("data/*.json")}
+
+    def shard(self, order, index, records):
+        content = dumps(records)
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:10]
+        return f"data/{order}-{index:04d}-{digest}.json", content
+
+    def shards(self, order, records):
+        """[(name, content)] for one ordering."""
+        size = self.shard_size
+        return [self.shard(order, start // size, records[start:start + size]) for start in range(0, len(records), size)]
+
+    def build(self, badges):
+        """{repository path: content} for the whole site."""
+        records = [site_record(badge) for badge in badges]
+        by_issuer = sorted(records, key=lambda record: (record["issuer"].lower(), record["title"].lower()))
+        by_date = sorted(records, key=lambda record: record["issued_at"], reverse=True)
+
+        files = {}
+        orders = {}
+        for order, ordered in (("issuer", by_issuer), ("date", by_date)):
+            orders[order] = []
+            for name, content in self.shards(order, ordered):
+                files[self.path(name)] = content
+                orders[order].append(name)
+
+        # The issuer ordering keeps each issuer in a contiguous run of shards,
+        # filtering by issuer only loads that run.
+        issuers = {}
+        for position, record in enumerate(by_issuer):
+            entry = issuers.get(record["issuer"])
+            if entry is None:
+                org = lookup(record["issuer"])
+                entry = issuers[record["issuer"]] = {
+                    "name": record["issuer"],
+                    "logo": org.logo,
+                    "link": org.link,
+                    "count": 0,
+                    "first": position // self.shard_size,
+                }
+            entry["count"] += 1
+            entry["last"] = position // self.shard_size
+
+        manifest = {
+            "version": SITE_VERSION,
+            "total": len(records),
+            "shard_size": self.shard_size,
+            "orders": orders,
+            "issuers": list(issuers.values()),
+        }
+        files[self.path("manifest.json")] = dumps(manifest)
+        files[self.path("index.html")] = PAGE
+        return files
+
+
+PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Credly Badges</title>
+    <style>
+        body { font-family: sans-serif; margin: 0 auto; max-width: 1100px; padding: 1rem; }
+        #controls { display: flex; gap: .5rem; position: sticky; top: 0; background: #fff; padding: .5rem 0; }
+        #badges { display: grid; grid-template-columns: repeat(auto-fill, minmax(220px, 1fr)); gap: 1rem; }
+        .badge { border: 1px solid #ddd; border-radius: 6px; padding: .75rem; text-align: center; }
+        .badge img { width: 110px; height: 110px; }
+        .badge p { font-size: .85rem; color: #555; }
+        #status { text-align: center; padding: 1rem; color: #777; }
+    </style>
+</head>
+<body>
+    <h1>Credly Badges</h1>
+    <div id="controls">
+        <select id="order">
+            <option value="date">Newest first</option>
+            <option value="issuer">By issuer</option>
+        </select>
+        <select id="issuer"><option value="">All issuers</option></select>
+        <input id="search" type="search" placeholder="Filter loaded badges">
+    </div>
+    <div id="badges"></div>
+    <div id="status">Loading...</div>
+    <script>
+    (async function () {
+        const manifest = await (await fetch("manifest.json")).json();
+        const grid = document.getElementById("badges");
+        const status = document.getElementById("status");
+        const order = document.getElementById("order");
+        const issuer = document.getElementById("issuer");
+        const search = document.getElementById("search");
+        const cache = {};
+        let queue = [], generation = 0, loading = false;
+
+        for (const entry of manifest.issuers) {
+            const option = document.createElement("option");
+            option.value = entry.name;
+            option.textContent = `${entry.name} (${entry.count})`;
+            issuer.appendChild(option);
+        }
+
+        function shard(name) {
+            if (!cache[name]) cache[name] = fetch(name).then(r => r.json());
+            return cache[name];
+        }
+
+        function card(badge) {
+            const div = document.createElement("div");
+            div.className = "badge";
+            div.dataset.text = `${badge.title} ${badge.issuer} ${badge.skills}`.toLowerCase();
+            const link = document.createElement("a");
+            link.href = badge.href;
+            const img = document.createElement("img");
+            img.loading = "lazy";
+            img.src = badge.img;
+            img.alt = badge.title;
+            const title = document.createElement("h3");
+            title.textContent = badge.title;
+            link.append(img, title);
+            const about = document.createElement("p");
+            about.textContent = `${badge.issuer} \\u00b7 ${badge.description}`;
+            div.append(link, about);
+            return div;
+        }
+
+        function applySearch(node) {
+            const term = search.value.trim().toLowerCase();
+            node.hidden = term !== "" && !node.dataset.text.includes(term);
+        }
+
+        async function next() {
+            if (loading || !queue.length) return;
+            loading = true;
+            const current = generation;
+            const records = await shard(queue.shift());
+            if (current === generation) {
+                for (const badge of records) {
+                    if (issuer.value && badge.issuer !== issuer.value) continue;
+                    const node = card(badge);
+                    applySearch(node);
+                    grid.appendChild(node);
+                }
+                status.textContent = queue.length ? "Loading..." : `${manifest.total} badges`;
+            }
+            loading = false;
+            if (current === generation && status.getBoundingClientRect().top < window.innerHeight + 400) next();
+        }
+
+        function reset() {
+            generation++;
+            loading = false;
+            grid.textContent = "";
+            const selected = manifest.issuers.find(entry => entry.name === issuer.value);
+            queue = selected
+                ? manifest.orders.issuer.slice(selected.first, selected.last + 1)
+                : manifest.orders[order.value].slice();
+            next();
+        }
+
+        new IntersectionObserver(entries => {
+            if (entries.some(entry => entry.isIntersecting)) next();
+        }, { rootMargin: "400px" }).observe(status);
+        order.addEventListener("change", reset);
+        issuer.addEventListener("change", reset);
+        search.addEventListener("input", () => grid.childNodes.forEach(applySearch));
+        reset();
+    })();
+    </script>
+</body>
+</html>
+"""
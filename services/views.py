@@ -0,0 +1,107 @@
+import hashlib
+from collections import Counter
+
+from settings import NUMBER_LAST_BADGES, BADGE_SIZE, WALL_FORMAT, WALL_COLUMNS, WALL_PATH
+from services.org_info import normalize_issuer
+
+
+def parse_view(name):
+    """Split a section name like `badges:issuer=AWS` into ("issuer", "AWS")."""
+    _, _, view = name.partition(":")
+    kind, _, argument = view.partition("=")
+    return kind.strip(), argument.strip()
+
+
+def matches_issuer(issuer, wanted):
+    """Issuer match on the normalized name, or on its initials (AWS, IBM...)."""
+    key = normalize_issuer(wanted)
+    name = normalize_issuer(issuer)
+    return key == name or key.replace(" ", "") == "".join(word[0] for word in name.split())
+
+
+def newest(badges, count):
+    return sorted(
+        badges,
+        key=lambda badge: badge.get("issued_at") or badge.get("state_updated_at") or "",
+        reverse=True,
+    )[:count]
+
+
+def grouped_badges(credly, badges):
+    """Badges grouped by issuer: read from the badge store when there is one (`get_badges` synced it)."""
+    if credly.store:
+        return credly.store.grouped()
+    return credly.group_badges(badges)
+
+
+def render_recent(credly, badges, argument):
+    count = int(argument) if argument.isdigit() else (NUMBER_LAST_BADGES or 5)
+    recent = credly.store.latest(count) if credly.store else newest(badges, count)
+    return "".join(credly.layout.iter_table(recent))
+
+
+def render_issuer(credly, badges, argument):
+    grouped = {
+        issuer: group for issuer, group in grouped_badges(credly, badges).items() if matches_issuer(issuer, argument)
+    }
+    return "".join(
+        chunk for issuer, group in grouped.items() for chunk in credly.iter_issuer_section(issuer, group)
+    )
+
+
+def render_skills(credly, badges, argument):
+    counts = Counter(skill for badge in badges for skill in (badge["skills"] or []))
+    if not counts:
+        return None
+    limit = int(argument) if argument.isdigit() else None
+    rows = sorted(counts.items(), key=lambda item: (-item[1], item[0].lower()))[:limit]
+    return "| Skill | Badges |\n|-------|:---:|\n" + "".join(f"| {skill} | {count} |\n" for skill, count in rows)
+
+
+def render_wall(credly, badges, argument):
+    """One image of all badges (or the N newest); the image is added to `credly.assets`."""
+    from services.badge_wall import BadgeWall, prune_patterns
+    from services.assets import ImageMirror, cache_path
+
+    if argument.isdigit():
+        badges = newest(badges, int(argument))
+    # The images mirrored for the README, when MIRROR_IMAGES is on, are reused for the tiles
+    mirror = credly.mirror or ImageMirror(cache_path("images"), BADGE_SIZE)
+    # Batch targets and wall sections with other options share the tiles, not the wall kept between runs
+    options = f"{credly.USER}|{argument}|{WALL_FORMAT}|{WALL_COLUMNS}|{BADGE_SIZE}"
+    name = "wall-" + hashlib.sha256(options.encode("utf-8")).hexdigest()[:16]
+    wall = BadgeWall(cache_path("wall"), mirror, WALL_COLUMNS, name)
+    link = f"https://www.credly.com/users/{credly.USER}/badges" if credly.USER else None
+    snippet, files = wall.render(badges, WALL_PATH, WALL_FORMAT, link)
+    credly.assets.update(files)
+    credly.prune.update(prune_patterns(WALL_PATH))
+    return snippet
+
+
+VIEWS = {
+    "recent": render_recent,
+    "issuer": render_issuer,
+    "skills": render_skills,
+    "wall": render_wall,
+}
+
+
+def render_view(credly, name, badges):
+    """Markdown for the section `name`, all views sharing one fetched list of badges.
+
+    `badges` is the full portfolio, `badges:recent[=N]` the N newest badges,
+    `badges:issuer=<name>` the sections of matching issuers and
+    `badges:skills[=N]` a table of the most frequent skills and
+    `badges:wall[=N]` a single image of all (or the N newest) badges.
+    With a badge store, the full portfolio, the issuer and the recent views
+    are read from the store.
+    """
+    if not badges:
+        return None
+    kind, argument = parse_view(name)
+    if not kind:
+        return credly.generate_grouped_md_format(grouped_badges(credly, badges))
+    if kind not in VIEWS:
+        print(f"Unknown badge section '{name}', leaving it unchanged")
+        return None
+    return VIEWS[kind](credly, badges, argument)
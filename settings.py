@@ -7,10 +7,19 @@ REPOSITORY = os.getenv("INPUT_REPOSITORY")
 GH_TOKEN = os.getenv("INPUT_GH_TOKEN")
 GH_API_URL = os.getenv("INPUT_GH_API_URL")
 COMMIT_MESSAGE = os.getenv("INPUT_COMMIT_MESSAGE")
+# How to publish: "pygithub" (contents API through PyGithub) or "git-data" (single commit through the Git Data API).
+GH_PUBLISHER = os.getenv("INPUT_GH_PUBLISHER", "pygithub")
+# Branch to commit to with the git-data publisher, defaults to the branch the README was read from.
+GH_BRANCH = os.getenv("INPUT_GH_BRANCH", "")
 CREDLY_USER = os.getenv("INPUT_CREDLY_USER")
 CREDLY_SORT = os.getenv("INPUT_CREDLY_SORT")
 CREDLY_API_TOKEN = os.getenv("INPUT_CREDLY_API_TOKEN")
-CREDLY_BASE_URL = os.getenv("INPUT_CREDLY_BASE_URL", "https://www.credly.com")
+# Badges endpoint of the Credly API; point it at `python -m benchmarks.server` to run against a local stand-in.
+CREDLY_BASE_URL = os.getenv("INPUT_CREDLY_BASE_URL", "https://api.credly.com/v1/users/self/badges")
+# Where badges come from: "api" (needs CREDLY_API_TOKEN) or "profile" (the public profile page, no token).
+CREDLY_SOURCE = os.getenv("INPUT_CREDLY_SOURCE", "api").lower()
+# Public profile page read with CREDLY_SOURCE=profile; `{user}` is replaced with CREDLY_USER.
+CREDLY_PROFILE_URL = os.getenv("INPUT_CREDLY_PROFILE_URL", "https://www.credly.com/users/{user}/badges")
 
 BADGE_SIZE = os.getenv("INPUT_BADGE_SIZE", "110")
 try:
@@ -18,4 +27,98 @@ try:
 except:
     NUMBER_LAST_BADGES = 0
 
+# Number of pages fetched in parallel (1 keeps the sequential crawl).
+try:
+    CREDLY_CONCURRENCY = max(1, int(os.getenv("INPUT_CREDLY_CONCURRENCY", "1")))
+except:
+    CREDLY_CONCURRENCY = 1
+# Token bucket shared by the page workers: requests per second and burst size.
+try:
+    CREDLY_RATE_LIMIT = float(os.getenv("INPUT_CREDLY_RATE_LIMIT", "2"))
+except:
+    CREDLY_RATE_LIMIT = 2.0
+try:
+    CREDLY_RATE_BURST = int(os.getenv("INPUT_CREDLY_RATE_BURST", "1"))
+except:
+    CREDLY_RATE_BURST = 1
+
+# Convert and group the badges of each page while the next pages download.
+CREDLY_PIPELINE = os.getenv("INPUT_CREDLY_PIPELINE", "false").lower() == "true"
+
+# Decode badge pages entry by entry, keeping only the fields used to render badges.
+CREDLY_STREAM_PARSE = os.getenv("INPUT_CREDLY_STREAM_PARSE", "true").lower() == "true"
+
+# Shared HTTP client: retries on 429/5xx, base backoff in seconds, pool size and timeout.
+try:
+    HTTP_RETRIES = int(os.getenv("INPUT_HTTP_RETRIES", "3"))
+except:
+    HTTP_RETRIES = 3
+try:
+    HTTP_BACKOFF = float(os.getenv("INPUT_HTTP_BACKOFF", "1"))
+except:
+    HTTP_BACKOFF = 1.0
+# Longest wait honored from a Retry-After header, in seconds.
+try:
+    HTTP_MAX_RETRY_AFTER = float(os.getenv("INPUT_HTTP_MAX_RETRY_AFTER", "120"))
+except:
+    HTTP_MAX_RETRY_AFTER = 120.0
+try:
+    HTTP_POOL_SIZE = int(os.getenv("INPUT_HTTP_POOL_SIZE", "10"))
+except:
+    HTTP_POOL_SIZE = 10
+try:
+    HTTP_TIMEOUT = float(os.getenv("INPUT_HTTP_TIMEOUT", "30"))
+except:
+    HTTP_TIMEOUT = 30.0
+
+# Directory for the conditional-request response cache (empty to disable it).
+CACHE_DIR = os.getenv("INPUT_CACHE_DIR", "")
+
+# JSON file remembering the badges seen by the last run; enables the incremental,
+# newest-first fetch that stops at the first already known badge.
+INCREMENTAL_STATE = os.getenv("INPUT_INCREMENTAL_STATE", "")
+
+# SQLite file holding the normalized badges; renders read from it when set.
+BADGE_STORE = os.getenv("INPUT_BADGE_STORE", "")
+# Render from the badge store only, without calling Credly.
+CREDLY_OFFLINE = os.getenv("INPUT_CREDLY_OFFLINE", "false").lower() == "true"
+
+# Badge layout: table, grid or list (see services/layouts.py).
+BADGE_LAYOUT = os.getenv("INPUT_BADGE_LAYOUT", "table")
+
+# Batch mode: JSON file listing Credly user -> repository targets, and where to write the report.
+BATCH_CONFIG = os.getenv("INPUT_BATCH_CONFIG", "")
+BATCH_REPORT = os.getenv("INPUT_BATCH_REPORT", "batch-report.json")
+try:
+    BATCH_CONCURRENCY = max(1, int(os.getenv("INPUT_BATCH_CONCURRENCY", "4")))
+except:
+    BATCH_CONCURRENCY = 4
+
+# Mirror badge images and organization logos into the repository, resized to BADGE_SIZE.
+MIRROR_IMAGES = os.getenv("INPUT_MIRROR_IMAGES", "false").lower() == "true"
+ASSETS_DIR = os.getenv("INPUT_ASSETS_DIR", "badges/images")
+
+# Badge wall (`badges:wall` section): image format (svg or png), tiles per row and path in the repository.
+WALL_FORMAT = os.getenv("INPUT_WALL_FORMAT", "svg")
+try:
+    WALL_COLUMNS = int(os.getenv("INPUT_WALL_COLUMNS", "10"))
+except:
+    WALL_COLUMNS = 10
+WALL_PATH = os.getenv("INPUT_WALL_PATH", "badges/wall")
+
+# Static site: directory in the repository for the JSON shards, manifest and page (empty to disable).
+SITE_DIR = os.getenv("INPUT_SITE_DIR", "")
+try:
+    SITE_SHARD_SIZE = int(os.getenv("INPUT_SITE_SHARD_SIZE", "100"))
+except:
+    SITE_SHARD_SIZE = 100
+
+# Run metrics: JSON file for the per-stage timings and counters (empty to skip it),
+# and whether to add them to the GitHub Actions job summary.
+METRICS_FILE = os.getenv("INPUT_METRICS_FILE", "")
+METRICS_SUMMARY = os.getenv("INPUT_METRICS_SUMMARY", "true").lower() == "true"
+# Profile the run with "cprofile" or "tracemalloc" (empty to disable); output path without extension.
+PROFILE = os.getenv("INPUT_PROFILE", "").lower()
+PROFILE_OUTPUT = os.getenv("INPUT_PROFILE_OUTPUT", "credly-profile")
+
 LIST_REGEX = f"{START_COMMENT}[\\s\\S]*{END_COMMENT}"
@@ -0,0 +1,159 @@
+"""A tiny in-process stand-in for the parts of the GitHub REST API the publishers use."""
+import base64
+import hashlib
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def git_sha(kind, data):
+    return hashlib.sha1(f"{kind} {len(data)}\0".encode() + data).hexdigest()
+
+
+class FakeGithub:
+    def __init__(self, repository="owner/repo", branch="main", readme="# Readme\n"):
+        self.repository = repository
+        self.branch = branch
+        self.files = {"README.md": readme.encode("utf-8")}
+        self.blobs = {}
+        self.trees = {}
+        self.commits = {"c0": {"tree": "t0", "parents": [], "message": "initial"}}
+        self.trees["t0"] = dict(self.files)
+        self.refs = {branch: "c0"}
+        self.requests = []
+        self.not_modified = 0
+        # Answer recursive tree reads with a truncated listing, like GitHub does for very large trees
+        self.truncate_trees = False
+
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def reply(self, status, payload=None, headers=None):
+                body = json.dumps(payload).encode() if payload is not None else b""
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                fake.dispatch(self, "GET")
+
+            def do_POST(self):
+                fake.dispatch(self, "POST")
+
+            def do_PATCH(self):
+                fake.dispatch(self, "PATCH")
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def edit(self, path, content, message="edit"):
+        """Commit `content` to `path` on the branch, like someone pushing in between."""
+        files = dict(self.head_files())
+        files[path] = content.encode("utf-8")
+        tree = f"t{len(self.trees)}"
+        self.trees[tree] = files
+        commit = f"c{len(self.commits)}"
+        self.commits[commit] = {"tree": tree, "parents": [self.refs[self.branch]], "message": message}
+        self.refs[self.branch] = commit
+
+    def head_files(self):
+        return self.trees[self.commits[self.refs[self.branch]]["tree"]]
+
+    def dispatch(self, handler, method):
+        prefix = f"/repos/{self.repository}"
+        path = handler.path[len(prefix):] if handler.path.startswith(prefix) else None
+        length = int(handler.headers.get("Content-Length") or 0)
+        body = json.loads(handler.rfile.read(length)) if length else None
+        self.requests.append((method, path))
+
+        if method == "GET" and path is not None and path.split("?")[0] == "/readme":
+            content = self.head_files()["README.md"]
+            etag = f'"{git_sha("blob", content)}"'
+            if handler.headers.get("If-None-Match") == etag:
+                self.not_modified += 1
+                return handler.reply(304, headers={"ETag": etag})
+            return handler.reply(200, {
+                "path": "README.md",
+                "sha": git_sha("blob", content),
+                "content": base64.b64encode(content).decode(),
+                "url": f"{self.url}{prefix}/contents/README.md?ref={self.branch}",
+            }, {"ETag": etag})
+
+        match = re.fullmatch(r"/git/ref/heads/(.+)", path or "")
+        if method == "GET" and match:
+            return handler.reply(200, {"object": {"sha": self.refs[match.group(1)]}})
+
+        match = re.fullmatch(r"/git/commits/(.+)", path or "")
+        if method == "GET" and match:
+            return handler.reply(200, {"tree": {"sha": self.commits[match.group(1)]["tree"]}})
+
+        match = re.fullmatch(r"/git/trees/([^?]+)(\?.*)?", path or "")
+        if method == "GET" and match:
+            # Sub-trees are named "<tree>:<folder>"
+            tree, _, folder = match.group(1).partition(":")
+            files = self.trees[tree]
+            if "recursive=1" in (match.group(2) or ""):
+                entries = [
+                    {"path": name, "type": "blob", "sha": git_sha("blob", content)} for name, content in files.items()
+                ]
+                if self.truncate_trees:
+                    return handler.reply(200, {"tree": entries[:1], "truncated": True})
+                return handler.reply(200, {"tree": entries, "truncated": False})
+            prefix = f"{folder}/" if folder else ""
+            entries = {}
+            for name, content in files.items():
+                if not name.startswith(prefix):
+                    continue
+                child, _, rest = name[len(prefix):].partition("/")
+                if rest:
+                    entries[child] = {"path": child, "type": "tree", "sha": f"{tree}:{prefix}{child}"}
+                else:
+                    entries[child] = {"path": child, "type": "blob", "sha": git_sha("blob", content)}
+            return handler.reply(200, {"tree": list(entries.values())})
+
+        if method == "POST" and path == "/git/blobs":
+            content = base64.b64decode(body["content"])
+            sha = git_sha("blob", content)
+            self.blobs[sha] = content
+            return handler.reply(201, {"sha": sha})
+
+        if method == "POST" and path == "/git/trees":
+            files = dict(self.trees[body["base_tree"]])
+            for entry in body["tree"]:
+                if "content" not in entry and entry["sha"] is None:
+                    files.pop(entry["path"], None)
+                    continue
+                files[entry["path"]] = entry["content"].encode() if "content" in entry else self.blobs[entry["sha"]]
+            sha = f"t{len(self.trees)}"
+            self.trees[sha] = files
+            return handler.reply(201, {"sha": sha})
+
+        if method == "POST" and path == "/git/commits":
+            sha = f"c{len(self.commits)}"
+            self.commits[sha] = {"tree": body["tree"], "parents": body["parents"], "message": body["message"]}
+            return handler.reply(201, {"sha": sha})
+
+        match = re.fullmatch(r"/git/refs/heads/(.+)", path or "")
+        if method == "PATCH" and match:
+            if self.commits[body["sha"]]["parents"] != [self.refs[match.group(1)]]:
+                return handler.reply(422, {"message": "Update is not a fast forward"})
+            self.refs[match.group(1)] = body["sha"]
+            return handler.reply(200, {"object": {"sha": body["sha"]}})
+
+        handler.reply(404, {"message": "Not Found"})
@@ -1,12 +1,16 @@
 #!/usr/bin/python3
 # coding=UTF-8
-import unittest, json
+import unittest, json, tempfile, shutil, io, os, sys
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
 from services.credly import Credly
 from main import generate_new_readme
 
+# `unittest discover -s tests` loads this file as the module `tests`, so the helpers
+# next to it are imported by their own name, whichever runner collects it
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
 BASE_FOLDER="tests/"
 FOLDER_MARKDOWNS=BASE_FOLDER+"markdowns/"
 FOLDER_HTML=BASE_FOLDER+"html/"
@@ -21,6 +25,7 @@ class Tests(TestCase):
     def test_canary(self):
         self.assertTrue(True)
 
+
 class TestBadgeSize(TestCase):
     def setUp(self):
         self.maxDiff = None
@@ -38,10 +43,8 @@ class TestBadgeSize(TestCase):
     
     def test_happy_day(self):
         data = Credly(FOLDER_HTML+"happy_day.html").get_markdown()
-        self.assertEqual(
-            '[![Docker Essentials: A Developer Introduction](https://images.credly.com/size/200x200/images/08216781-93cb-4ba1-8110-8eb3401fa8ce/Docker_Essentials_-_ISDN.png)](http://www.credly.com/badges/24bcb006-58f8-494c-85e3-dfee10ea7b57 "Docker Essentials: A Developer Introduction")\n[![IBM Blockchain Essentials V2](https://images.credly.com/size/200x200/images/8e6bba9c-544d-46b0-bc7b-324fc85042ba/Blockchain_Essentials_V2.png)](http://www.credly.com/badges/47065bcc-63f9-4b1f-b403-48bcdbc78f54 "IBM Blockchain Essentials V2")\n[![Enterprise Design Thinking - Team Essentials for AI](https://images.credly.com/size/200x200/images/09f644d1-eed2-4279-bc49-1e26cddc9d3d/Team_Essentials.png)](http://www.credly.com/badges/5e280a76-446b-431a-80f0-7d2dc448a407 "Enterprise Design Thinking - Team Essentials for AI")\n[![Security and Privacy by Design Foundations](https://images.credly.com/size/200x200/images/c1ca6570-bdc6-40e9-8992-722050788418/Security-_-Privacy-by-Design-Foundational.png)](http://www.credly.com/badges/e4d08b6b-ee34-4fc9-9a1b-87c43a887233 "Security and Privacy by Design Foundations")\n[![IBM Blockchain Consulting](https://images.credly.com/size/200x200/images/28e2c951-1859-4812-807f-3b637e6403e5/Blockchain-consulting.png)](http://www.credly.com/badges/42efe367-3744-438a-8c03-59622c69c893 "IBM Blockchain Consulting")\n[![Watson Discovery Service Foundations](https://images.credly.com/size/200x200/images/edeaee50-64ff-42f0-a872-f4e2119ed463/Watson_Discovery_Service_-_Foundations.png)](http://www.credly.com/badges/06796b84-6cb6-40ea-9853-b4b8843e65da "Watson Discovery Service Foundations")\n[![Watson Discovery Foundations](https://images.credly.com/size/200x200/images/8c805fb7-b7e1-4b45-b933-7ee09385ea03/Watson_Academy_-_Discovery__-_Foundations.png)](http://www.credly.com/badges/b4f04f7d-a5dd-45bd-bfd1-1a0d29801bf8 "Watson Discovery Foundations")\n[![IBM Cloud Garage Test-Driven Development (TDD)](https://images.credly.com/size/200x200/images/71ea5682-2233-434c-a2c5-dd3f7fb8d5e9/Garage_Method_-_Test_driven_Development_V1_-__Final.png)](http://www.credly.com/badges/d9c9d869-b2e3-4cd2-a77d-7d53197b821e "IBM Cloud Garage Test-Driven Development (TDD)")\n[![Watson Discovery Service for Developers](https://images.credly.com/size/200x200/images/01774ad1-fbff-4ddc-8b28-fd7953cb7ff6/Watson_Discovery_Service_-_Developers.png)](http://www.credly.com/badges/0506d841-cd61-4c0e-aad9-83714a9920a9 "Watson Discovery Service for Developers")',
-            data,
-        )
+        self.assertEqual(return_markdown("happy_day_200.md"), data)
+
 
 class TestNumberLastBadges(TestCase):
     def setUp(self):
@@ -50,7 +53,7 @@ class TestNumberLastBadges(TestCase):
         self.mocks = {}
         self.patches = []
 
-        badge_size_patch = patch('services.credly.NUMBER_LAST_BADGES', new=1)
+        badge_size_patch = patch('services.views.NUMBER_LAST_BADGES', new=1)
         self.mocks['badge_size'] = badge_size_patch.start()
         self.patches.append(badge_size_patch)
 
@@ -59,21 +62,21 @@ class TestNumberLastBadges(TestCase):
             patch_.stop()
     
     def test_happy_day(self):
-        data = Credly(FOLDER_HTML+"happy_day.html").get_markdown()
-        self.assertEqual(
-            '[![Docker Essentials: A Developer Introduction](https://images.credly.com/size/110x110/images/08216781-93cb-4ba1-8110-8eb3401fa8ce/Docker_Essentials_-_ISDN.png)](http://www.credly.com/badges/24bcb006-58f8-494c-85e3-dfee10ea7b57 "Docker Essentials: A Developer Introduction")',
-            data,
-        )
+        from services.views import render_view
+
+        credly = Credly(FOLDER_HTML+"happy_day.html")
+        data = render_view(credly, "badges:recent", credly.get_badges())
+        self.assertEqual(return_markdown("happy_day_recent_1.md"), data)
+
+
 class TestsCredly(TestCase):
     def setUp(self):
         self.maxDiff = None
 
     def test_happy_day(self):
         data = Credly(FOLDER_HTML+"happy_day.html").get_markdown()
-        self.assertEqual(
-            '[![Docker Essentials: A Developer Introduction](https://images.credly.com/size/110x110/images/08216781-93cb-4ba1-8110-8eb3401fa8ce/Docker_Essentials_-_ISDN.png)](http://www.credly.com/badges/24bcb006-58f8-494c-85e3-dfee10ea7b57 "Docker Essentials: A Developer Introduction")\n[![IBM Blockchain Essentials V2](https://images.credly.com/size/110x110/images/8e6bba9c-544d-46b0-bc7b-324fc85042ba/Blockchain_Essentials_V2.png)](http://www.credly.com/badges/47065bcc-63f9-4b1f-b403-48bcdbc78f54 "IBM Blockchain Essentials V2")\n[![Enterprise Design Thinking - Team Essentials for AI](https://images.credly.com/size/110x110/images/09f644d1-eed2-4279-bc49-1e26cddc9d3d/Team_Essentials.png)](http://www.credly.com/badges/5e280a76-446b-431a-80f0-7d2dc448a407 "Enterprise Design Thinking - Team Essentials for AI")\n[![Security and Privacy by Design Foundations](https://images.credly.com/size/110x110/images/c1ca6570-bdc6-40e9-8992-722050788418/Security-_-Privacy-by-Design-Foundational.png)](http://www.credly.com/badges/e4d08b6b-ee34-4fc9-9a1b-87c43a887233 "Security and Privacy by Design Foundations")\n[![IBM Blockchain Consulting](https://images.credly.com/size/110x110/images/28e2c951-1859-4812-807f-3b637e6403e5/Blockchain-consulting.png)](http://www.credly.com/badges/42efe367-3744-438a-8c03-59622c69c893 "IBM Blockchain Consulting")\n[![Watson Discovery Service Foundations](https://images.credly.com/size/110x110/images/edeaee50-64ff-42f0-a872-f4e2119ed463/Watson_Discovery_Service_-_Foundations.png)](http://www.credly.com/badges/06796b84-6cb6-40ea-9853-b4b8843e65da "Watson Discovery Service Foundations")\n[![Watson Discovery Foundations](https://images.credly.com/size/110x110/images/8c805fb7-b7e1-4b45-b933-7ee09385ea03/Watson_Academy_-_Discovery__-_Foundations.png)](http://www.credly.com/badges/b4f04f7d-a5dd-45bd-bfd1-1a0d29801bf8 "Watson Discovery Foundations")\n[![IBM Cloud Garage Test-Driven Development (TDD)](https://images.credly.com/size/110x110/images/71ea5682-2233-434c-a2c5-dd3f7fb8d5e9/Garage_Method_-_Test_driven_Development_V1_-__Final.png)](http://www.credly.com/badges/d9c9d869-b2e3-4cd2-a77d-7d53197b821e "IBM Cloud Garage Test-Driven Development (TDD)")\n[![Watson Discovery Service for Developers](https://images.credly.com/size/110x110/images/01774ad1-fbff-4ddc-8b28-fd7953cb7ff6/Watson_Discovery_Service_-_Developers.png)](http://www.credly.com/badges/0506d841-cd61-4c0e-aad9-83714a9920a9 "Watson Discovery Service for Developers")',
-            data,
-        )
+        self.assertEqual(return_markdown("happy_day.md"), data)
+
 
 class testsHappyDayHTML(TestCase):
     def setUp(self):
@@ -98,10 +101,7 @@ class testsHappyDayHTML(TestCase):
 
         badges = Credly(FOLDER_HTML+"happy_day.html").get_markdown()
         new_readme = generate_new_readme(badges, with_tags_no_text_between)
-        self.assertEqual(
-            '# badge-readme\nThis is example file\n<!--START_SECTION:badges-->\n[![Docker Essentials: A Developer Introduction](https://images.credly.com/size/110x110/images/08216781-93cb-4ba1-8110-8eb3401fa8ce/Docker_Essentials_-_ISDN.png)](http://www.credly.com/badges/24bcb006-58f8-494c-85e3-dfee10ea7b57 "Docker Essentials: A Developer Introduction")\n[![IBM Blockchain Essentials V2](https://images.credly.com/size/110x110/images/8e6bba9c-544d-46b0-bc7b-324fc85042ba/Blockchain_Essentials_V2.png)](http://www.credly.com/badges/47065bcc-63f9-4b1f-b403-48bcdbc78f54 "IBM Blockchain Essentials V2")\n[![Enterprise Design Thinking - Team Essentials for AI](https://images.credly.com/size/110x110/images/09f644d1-eed2-4279-bc49-1e26cddc9d3d/Team_Essentials.png)](http://www.credly.com/badges/5e280a76-446b-431a-80f0-7d2dc448a407 "Enterprise Design Thinking - Team Essentials for AI")\n[![Security and Privacy by Design Foundations](https://images.credly.com/size/110x110/images/c1ca6570-bdc6-40e9-8992-722050788418/Security-_-Privacy-by-Design-Foundational.png)](http://www.credly.com/badges/e4d08b6b-ee34-4fc9-9a1b-87c43a887233 "Security and Privacy by Design Foundations")\n[![IBM Blockchain Consulting](https://images.credly.com/size/110x110/images/28e2c951-1859-4812-807f-3b637e6403e5/Blockchain-consulting.png)](http://www.credly.com/badges/42efe367-3744-438a-8c03-59622c69c893 "IBM Blockchain Consulting")\n[![Watson Discovery Service Foundations](https://images.credly.com/size/110x110/images/edeaee50-64ff-42f0-a872-f4e2119ed463/Watson_Discovery_Service_-_Foundations.png)](http://www.credly.com/badges/06796b84-6cb6-40ea-9853-b4b8843e65da "Watson Discovery Service Foundations")\n[![Watson Discovery Foundations](https://images.credly.com/size/110x110/images/8c805fb7-b7e1-4b45-b933-7ee09385ea03/Watson_Academy_-_Discovery__-_Foundations.png)](http://www.credly.com/badges/b4f04f7d-a5dd-45bd-bfd1-1a0d29801bf8 "Watson Discovery Foundations")\n[![IBM Cloud Garage Test-Driven Development (TDD)](https://images.credly.com/size/110x110/images/71ea5682-2233-434c-a2c5-dd3f7fb8d5e9/Garage_Method_-_Test_driven_Development_V1_-__Final.png)](http://www.credly.com/badges/d9c9d869-b2e3-4cd2-a77d-7d53197b821e "IBM Cloud Garage Test-Driven Development (TDD)")\n[![Watson Discovery Service for Developers](https://images.credly.com/size/110x110/images/01774ad1-fbff-4ddc-8b28-fd7953cb7ff6/Watson_Discovery_Service_-_Developers.png)](http://www.credly.com/badges/0506d841-cd61-4c0e-aad9-83714a9920a9 "Watson Discovery Service for Developers")\n<!--END_SECTION:badges-->',
-            new_readme,
-        )
+        self.assertEqual(return_markdown("no_changes_happy_day.md"), new_readme)
 
         self.assertNotEqual(with_tags_no_text_between, new_readme)
 
@@ -114,13 +114,11 @@ class testsHappyDayHTML(TestCase):
 
         badges = Credly(FOLDER_HTML+"happy_day.html").get_markdown()
         new_readme = generate_new_readme(badges, with_tags_text_between)
-        self.assertEqual(
-            '# badge-readme\nThis is example file\n<!--START_SECTION:badges-->\n[![Docker Essentials: A Developer Introduction](https://images.credly.com/size/110x110/images/08216781-93cb-4ba1-8110-8eb3401fa8ce/Docker_Essentials_-_ISDN.png)](http://www.credly.com/badges/24bcb006-58f8-494c-85e3-dfee10ea7b57 "Docker Essentials: A Developer Introduction")\n[![IBM Blockchain Essentials V2](https://images.credly.com/size/110x110/images/8e6bba9c-544d-46b0-bc7b-324fc85042ba/Blockchain_Essentials_V2.png)](http://www.credly.com/badges/47065bcc-63f9-4b1f-b403-48bcdbc78f54 "IBM Blockchain Essentials V2")\n[![Enterprise Design Thinking - Team Essentials for AI](https://images.credly.com/size/110x110/images/09f644d1-eed2-4279-bc49-1e26cddc9d3d/Team_Essentials.png)](http://www.credly.com/badges/5e280a76-446b-431a-80f0-7d2dc448a407 "Enterprise Design Thinking - Team Essentials for AI")\n[![Security and Privacy by Design Foundations](https://images.credly.com/size/110x110/images/c1ca6570-bdc6-40e9-8992-722050788418/Security-_-Privacy-by-Design-Foundational.png)](http://www.credly.com/badges/e4d08b6b-ee34-4fc9-9a1b-87c43a887233 "Security and Privacy by Design Foundations")\n[![IBM Blockchain Consulting](https://images.credly.com/size/110x110/images/28e2c951-1859-4812-807f-3b637e6403e5/Blockchain-consulting.png)](http://www.credly.com/badges/42efe367-3744-438a-8c03-59622c69c893 "IBM Blockchain Consulting")\n[![Watson Discovery Service Foundations](https://images.credly.com/size/110x110/images/edeaee50-64ff-42f0-a872-f4e2119ed463/Watson_Discovery_Service_-_Foundations.png)](http://www.credly.com/badges/06796b84-6cb6-40ea-9853-b4b8843e65da "Watson Discovery Service Foundations")\n[![Watson Discovery Foundations](https://images.credly.com/size/110x110/images/8c805fb7-b7e1-4b45-b933-7ee09385ea03/Watson_Academy_-_Discovery__-_Foundations.png)](http://www.credly.com/badges/b4f04f7d-a5dd-45bd-bfd1-1a0d29801bf8 "Watson Discovery Foundations")\n[![IBM Cloud Garage Test-Driven Development (TDD)](https://images.credly.com/size/110x110/images/71ea5682-2233-434c-a2c5-dd3f7fb8d5e9/Garage_Method_-_Test_driven_Development_V1_-__Final.png)](http://www.credly.com/badges/d9c9d869-b2e3-4cd2-a77d-7d53197b821e "IBM Cloud Garage Test-Driven Development (TDD)")\n[![Watson Discovery Service for Developers](https://images.credly.com/size/110x110/images/01774ad1-fbff-4ddc-8b28-fd7953cb7ff6/Watson_Discovery_Service_-_Developers.png)](http://www.credly.com/badges/0506d841-cd61-4c0e-aad9-83714a9920a9 "Watson Discovery Service for Developers")\n<!--END_SECTION:badges-->',
-            new_readme,
-        )
+        self.assertEqual(return_markdown("no_changes_happy_day.md"), new_readme)
 
         self.assertNotEqual(with_tags_text_between, new_readme)
 
+
 class testNotTagsHTML(TestCase):
     def setUp(self):
         self.maxDiff = None
@@ -167,6 +165,7 @@ class testNotTagsHTML(TestCase):
 
         self.assertEqual(with_tags_text_between, new_readme)
 
+
 class testNoChangesHTML(TestCase):
     def setUp(self):
         self.maxDiff = None
@@ -174,15 +173,1338 @@ class testNoChangesHTML(TestCase):
     def test_not_changes(self):
         no_changes = return_markdown("no_changes_happy_day.md")
         self.assertEqual(
-            '# badge-readme\nThis is example file\n<!--START_SECTION:badges-->\n[![Docker Essentials: A Developer Introduction](https://images.credly.com/size/110x110/images/08216781-93cb-4ba1-8110-8eb3401fa8ce/Docker_Essentials_-_ISDN.png)](http://www.credly.com/badges/24bcb006-58f8-494c-85e3-dfee10ea7b57 "Docker Essentials: A Developer Introduction")\n[![IBM Blockchain Essentials V2](https://images.credly.com/size/110x110/images/8e6bba9c-544d-46b0-bc7b-324fc85042ba/Blockchain_Essentials_V2.png)](http://www.credly.com/badges/47065bcc-63f9-4b1f-b403-48bcdbc78f54 "IBM Blockchain Essentials V2")\n[![Enterprise Design Thinking - Team Essentials for AI](https://images.credly.com/size/110x110/images/09f644d1-eed2-4279-bc49-1e26cddc9d3d/Team_Essentials.png)](http://www.credly.com/badges/5e280a76-446b-431a-80f0-7d2dc448a407 "Enterprise Design Thinking - Team Essentials for AI")\n[![Security and Privacy by Design Foundations](https://images.credly.com/size/110x110/images/c1ca6570-bdc6-40e9-8992-722050788418/Security-_-Privacy-by-Design-Foundational.png)](http://www.credly.com/badges/e4d08b6b-ee34-4fc9-9a1b-87c43a887233 "Security and Privacy by Design Foundations")\n[![IBM Blockchain Consulting](https://images.credly.com/size/110x110/images/28e2c951-1859-4812-807f-3b637e6403e5/Blockchain-consulting.png)](http://www.credly.com/badges/42efe367-3744-438a-8c03-59622c69c893 "IBM Blockchain Consulting")\n[![Watson Discovery Service Foundations](https://images.credly.com/size/110x110/images/edeaee50-64ff-42f0-a872-f4e2119ed463/Watson_Discovery_Service_-_Foundations.png)](http://www.credly.com/badges/06796b84-6cb6-40ea-9853-b4b8843e65da "Watson Discovery Service Foundations")\n[![Watson Discovery Foundations](https://images.credly.com/size/110x110/images/8c805fb7-b7e1-4b45-b933-7ee09385ea03/Watson_Academy_-_Discovery__-_Foundations.png)](http://www.credly.com/badges/b4f04f7d-a5dd-45bd-bfd1-1a0d29801bf8 "Watson Discovery Foundations")\n[![IBM Cloud Garage Test-Driven Development (TDD)](https://images.credly.com/size/110x110/images/71ea5682-2233-434c-a2c5-dd3f7fb8d5e9/Garage_Method_-_Test_driven_Development_V1_-__Final.png)](http://www.credly.com/badges/d9c9d869-b2e3-4cd2-a77d-7d53197b821e "IBM Cloud Garage Test-Driven Development (TDD)")\n[![Watson Discovery Service for Developers](https://images.credly.com/size/110x110/images/01774ad1-fbff-4ddc-8b28-fd7953cb7ff6/Watson_Discovery_Service_-_Developers.png)](http://www.credly.com/badges/0506d841-cd61-4c0e-aad9-83714a9920a9 "Watson Discovery Service for Developers")\n<!--END_SECTION:badges-->',
+            return_markdown("with_tags_no_text_between.md").replace("-->\n<!--END", "-->\n" + return_markdown("happy_day.md") + "\n<!--END"),
             no_changes,
         )
 
         badges = Credly(FOLDER_HTML+"happy_day.html").get_markdown()
         new_readme = generate_new_readme(badges, no_changes)
+        self.assertEqual(no_changes, new_readme)
+
+
+class TestConcurrentFetch(TestCase):
+    def page(self, number, total):
+        next_page = f"?page={number + 1}" if number < total else None
+        return {
+            "data": [{"id": f"{number}-{i}"} for i in range(2)],
+            "metadata": {"total_pages": total, "next_page_url": next_page},
+        }
+
+    def test_pages_in_order(self):
+        credly = Credly()
+        credly.CONCURRENCY = 4
+        with patch.object(credly, "fetch_page", side_effect=lambda page: self.page(page, 5)), \
+                patch('services.credly.CREDLY_RATE_LIMIT', new=0):
+            badges = credly.fetch_badges()
         self.assertEqual(
-            '# badge-readme\nThis is example file\n<!--START_SECTION:badges-->\n[![Docker Essentials: A Developer Introduction](https://images.credly.com/size/110x110/images/08216781-93cb-4ba1-8110-8eb3401fa8ce/Docker_Essentials_-_ISDN.png)](http://www.credly.com/badges/24bcb006-58f8-494c-85e3-dfee10ea7b57 "Docker Essentials: A Developer Introduction")\n[![IBM Blockchain Essentials V2](https://images.credly.com/size/110x110/images/8e6bba9c-544d-46b0-bc7b-324fc85042ba/Blockchain_Essentials_V2.png)](http://www.credly.com/badges/47065bcc-63f9-4b1f-b403-48bcdbc78f54 "IBM Blockchain Essentials V2")\n[![Enterprise Design Thinking - Team Essentials for AI](https://images.credly.com/size/110x110/images/09f644d1-eed2-4279-bc49-1e26cddc9d3d/Team_Essentials.png)](http://www.credly.com/badges/5e280a76-446b-431a-80f0-7d2dc448a407 "Enterprise Design Thinking - Team Essentials for AI")\n[![Security and Privacy by Design Foundations](https://images.credly.com/size/110x110/images/c1ca6570-bdc6-40e9-8992-722050788418/Security-_-Privacy-by-Design-Foundational.png)](http://www.credly.com/badges/e4d08b6b-ee34-4fc9-9a1b-87c43a887233 "Security and Privacy by Design Foundations")\n[![IBM Blockchain Consulting](https://images.credly.com/size/110x110/images/28e2c951-1859-4812-807f-3b637e6403e5/Blockchain-consulting.png)](http://www.credly.com/badges/42efe367-3744-438a-8c03-59622c69c893 "IBM Blockchain Consulting")\n[![Watson Discovery Service Foundations](https://images.credly.com/size/110x110/images/edeaee50-64ff-42f0-a872-f4e2119ed463/Watson_Discovery_Service_-_Foundations.png)](http://www.credly.com/badges/06796b84-6cb6-40ea-9853-b4b8843e65da "Watson Discovery Service Foundations")\n[![Watson Discovery Foundations](https://images.credly.com/size/110x110/images/8c805fb7-b7e1-4b45-b933-7ee09385ea03/Watson_Academy_-_Discovery__-_Foundations.png)](http://www.credly.com/badges/b4f04f7d-a5dd-45bd-bfd1-1a0d29801bf8 "Watson Discovery Foundations")\n[![IBM Cloud Garage Test-Driven Development (TDD)](https://images.credly.com/size/110x110/images/71ea5682-2233-434c-a2c5-dd3f7fb8d5e9/Garage_Method_-_Test_driven_Development_V1_-__Final.png)](http://www.credly.com/badges/d9c9d869-b2e3-4cd2-a77d-7d53197b821e "IBM Cloud Garage Test-Driven Development (TDD)")\n[![Watson Discovery Service for Developers](https://images.credly.com/size/110x110/images/01774ad1-fbff-4ddc-8b28-fd7953cb7ff6/Watson_Discovery_Service_-_Developers.png)](http://www.credly.com/badges/0506d841-cd61-4c0e-aad9-83714a9920a9 "Watson Discovery Service for Developers")\n<!--END_SECTION:badges-->',
-            new_readme,
+            [f"{page}-{i}" for page in range(1, 6) for i in range(2)],
+            [badge["id"] for badge in badges],
+        )
+
+    def test_stops_at_failed_page(self):
+        credly = Credly()
+        credly.CONCURRENCY = 4
+        pages = lambda page: None if page == 3 else self.page(page, 5)
+        with patch.object(credly, "fetch_page", side_effect=pages), \
+                patch('services.credly.CREDLY_RATE_LIMIT', new=0):
+            badges = credly.fetch_badges()
+        self.assertEqual(["1-0", "1-1", "2-0", "2-1"], [badge["id"] for badge in badges])
+
+    def test_token_bucket_rate_and_burst(self):
+        from services.rate_limiter import TokenBucket
+
+        clock = [100.0]
+        with patch("services.rate_limiter.time.monotonic", side_effect=lambda: clock[0]), \
+                patch("services.rate_limiter.time.sleep") as sleep:
+            bucket = TokenBucket(rate=2, capacity=3)
+            # The burst goes out at once, then one token every 1 / rate seconds
+            self.assertEqual([0.0, 0.0, 0.0, 0.5, 1.0], [bucket.acquire() for _ in range(5)])
+            self.assertEqual([0.5, 1.0], [call.args[0] for call in sleep.call_args_list])
+
+            # An idle bucket refills up to its capacity, never beyond
+            clock[0] += 60
+            self.assertEqual([0.0, 0.0, 0.0, 0.5], [bucket.acquire() for _ in range(4)])
+        self.assertEqual(0.0, TokenBucket(rate=0).acquire())
+
+
+class TestHttpClient(TestCase):
+    def response(self, status, headers=None):
+        response = MagicMock(status_code=status, headers=headers or {}, content=b"{}")
+        return response
+
+    def test_retries_honor_retry_after(self):
+        from services import http_client
+
+        session = MagicMock()
+        session.request.side_effect = [
+            self.response(429, {"Retry-After": "7"}),
+            self.response(503),
+            self.response(200),
+        ]
+        with patch.object(http_client, "get_session", return_value=session), \
+                patch.object(http_client, "backoff", return_value=0.5), \
+                patch("services.http_client.time.sleep") as sleep:
+            response = http_client.get("https://example.com/badges")
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual([((7.0,),), ((0.5,),)], sleep.call_args_list)
+
+    def test_retry_after_is_capped(self):
+        from services import http_client
+
+        with patch("services.http_client.HTTP_MAX_RETRY_AFTER", new=60.0):
+            self.assertEqual(60.0, http_client.retry_after(self.response(429, {"Retry-After": "86400"})))
+            self.assertEqual(60.0, http_client.retry_after(self.response(503, {"Retry-After": "Fri, 31 Dec 2100 23:59:59 GMT"})))
+            self.assertEqual(0.0, http_client.retry_after(self.response(429, {"Retry-After": "-5"})))
+
+    def test_gives_up_after_retries(self):
+        from services import http_client
+
+        session = MagicMock()
+        session.request.return_value = self.response(500)
+        with patch.object(http_client, "get_session", return_value=session), \
+                patch("services.http_client.HTTP_RETRIES", new=2), \
+                patch("services.http_client.time.sleep"):
+            response = http_client.get("https://example.com/badges")
+
+        self.assertEqual(500, response.status_code)
+        self.assertEqual(3, session.request.call_count)
+
+
+class TestResponseCache(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def response(self, status, body="", headers=None):
+        response = MagicMock(status_code=status, text=body, headers=headers or {})
+        response.json.side_effect = lambda: json.loads(body)
+        data = body.encode("utf-8")
+        response.iter_content.side_effect = lambda size: (data[i:i + size] for i in range(0, len(data), size))
+        return response
+
+    def test_not_modified_pages_skip_render(self):
+        body = json.dumps({"data": [], "metadata": {"next_page_url": None}})
+        with patch('services.credly.CACHE_DIR', new=self.directory):
+            credly = Credly()
+        with patch('services.credly.http_client.get', return_value=self.response(200, body, {"ETag": '"v1"'})):
+            credly.fetch_badges()
+        self.assertFalse(credly.not_modified())
+        # Until the run is published, the next one may not skip these pages
+        self.assertEqual(["sections"], os.listdir(self.directory))
+        credly.persist()
+
+        with patch('services.credly.CACHE_DIR', new=self.directory):
+            credly = Credly()
+        with patch('services.credly.http_client.get', return_value=self.response(304)) as get:
+            self.assertIsNone(credly.get_markdown())
+        self.assertEqual('"v1"', get.call_args.kwargs["headers"]["If-None-Match"])
+        self.assertTrue(credly.not_modified())
+
+    def test_render_settings_scope_the_cache(self):
+        with patch('services.credly.CACHE_DIR', new=self.directory):
+            small = Credly()
+            with patch('services.credly.BADGE_SIZE', new='200'):
+                large = Credly()
+        self.assertNotEqual(small.cache.scope, large.cache.scope)
+
+    def test_failed_publish_is_retried_next_run(self):
+        from benchmarks.payload import api_badges
+        import main
+
+        body = json.dumps({"data": api_badges(1), "metadata": {"next_page_url": None}})
+        readme = "# Me\n<!--START_SECTION:badges-->\n<!--END_SECTION:badges-->\n"
+        repo = MagicMock(sha="old")
+        repo.get_readme.return_value = readme
+        repo.save_readme.side_effect = SystemExit(1)
+        with patch('services.credly.CACHE_DIR', new=self.directory), patch('main.CACHE_DIR', new=""):
+            credly = Credly()
+            with patch('services.credly.http_client.get', return_value=self.response(200, body, {"ETag": '"v1"'})), \
+                    self.assertRaises(SystemExit):
+                main.update_readme(credly, lambda: repo, "me/me")
+
+            credly = Credly()
+            with patch('services.credly.http_client.get', return_value=self.response(200, body, {"ETag": '"v1"'})) as get:
+                repo.save_readme.side_effect = None
+                self.assertEqual("updated", main.update_readme(credly, lambda: repo, "me/me"))
+            self.assertNotIn("If-None-Match", get.call_args.kwargs["headers"])
+
+            credly = Credly()
+            with patch('services.credly.http_client.get', return_value=self.response(304)):
+                self.assertEqual("not_modified", main.update_readme(credly, lambda: repo, "me/me"))
+
+
+class TestIncrementalFetch(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.state = self.directory + "/state.json"
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def badge(self, id, updated):
+        return {"id": id, "state_updated_at": updated}
+
+    def pages(self, pages):
+        def fetch_page(page, sort=None):
+            self.assertEqual("-state_updated_at", sort)
+            next_page = f"?page={page + 1}" if page < len(pages) else None
+            return {"data": pages[page - 1], "metadata": {"next_page_url": next_page}}
+        return fetch_page
+
+    def test_stops_at_known_page_and_merges(self):
+        with patch('services.credly.INCREMENTAL_STATE', new=self.state):
+            credly = Credly()
+        first = [[self.badge("b", "2024-02"), self.badge("a", "2024-01")]]
+        with patch.object(credly, "fetch_page", side_effect=self.pages(first)):
+            self.assertEqual(["b", "a"], [b["id"] for b in credly.fetch_badges()])
+        credly.persist()
+
+        second = [
+            [self.badge("c", "2024-03"), self.badge("b", "2024-02")],
+            [self.badge("a", "2024-01")],
+        ]
+        with patch.object(credly, "fetch_page", side_effect=self.pages(second)) as fetch_page:
+            self.assertEqual(["c", "b", "a"], [b["id"] for b in credly.fetch_badges()])
+        self.assertEqual(1, fetch_page.call_count)
+        credly.persist()
+
+        with patch.object(credly, "fetch_page", side_effect=self.pages([[self.badge("c", "2024-03")]])) as fetch_page:
+            self.assertEqual(["c", "b", "a"], [b["id"] for b in credly.fetch_badges()])
+        credly.persist()
+        with open(self.state) as fh:
+            self.assertEqual(["c", "b", "a"], [b["id"] for b in json.load(fh)["badges"]])
+
+
+class TestBadgeStore(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def badge(self, id, issuer, updated):
+        return {
+            "title": f"Badge {id}", "href": f"https://www.credly.com/org/badge/{id}",
+            "img": f"https://images.credly.com/{id}.png", "issuer": issuer,
+            "description": "A badge", "time_to_earn": "Hours", "skills": ["Python"],
+            "criteria": "Pass", "level": "Foundational", "id": id, "template_id": f"t-{id}",
+            "state_updated_at": updated, "issued_at": updated,
+        }
+
+    def test_grouped_matches_python_grouping(self):
+        from services.badge_store import BadgeStore
+
+        badges = [
+            self.badge("1", "IBM", "2024-03"),
+            self.badge("2", "amazon", "2024-01"),
+            self.badge("3", "IBM", "2024-02"),
+            self.badge("4", "Cisco", "2024-04"),
+        ]
+        store = BadgeStore(self.directory + "/badges.db")
+        store.sync(badges)
+        self.assertEqual(Credly().group_badges(badges), store.grouped())
+        self.assertEqual(["4", "1"], [badge["id"] for badge in store.latest(2)])
+
+        store.sync(badges[:2])
+        self.assertEqual({"1", "2"}, store.ids())
+        store.close()
+
+    def test_badges_without_id_are_kept_apart(self):
+        from services.badge_store import BadgeStore
+
+        first, second = self.badge("1", "IBM", "2023-01"), self.badge("1", "IBM", "2024-01")
+        for badge in (first, second):
+            badge["id"] = None
+        store = BadgeStore(self.directory + "/badges.db")
+        store.sync([first, second])
+        self.assertEqual(2, store.count())
+        store.close()
+
+    def test_updater_seeds_an_empty_store_from_the_readme(self):
+        from benchmarks.payload import api_badges
+        from services.badge_store import BadgeStore
+        from services.recent import CredlyUpdater
+
+        latest = api_badges(3, issuers=1)
+        store = BadgeStore(self.directory + "/badges.db")
+        updater = CredlyUpdater("token", store=store)
+        published = [updater.convert_badge_to_dict(badge) for badge in latest[1:]]
+        readme_path = self.directory + "/README.md"
+        with open(readme_path, "w", encoding="utf-8") as fh:
+            fh.write("## Total Badges: (2)\n" + updater.generate_org_section(published[0]["issuer"], published))
+
+        with patch.object(updater, "fetch_latest_badges", return_value=latest), \
+                patch.object(updater, "update_readme_with_new_badges", return_value="") as update, \
+                patch("sys.stdout", new=io.StringIO()):
+            self.assertTrue(updater.run_update(readme_path))
+            self.assertEqual([latest[0]["id"]], [badge["id"] for badge in update.call_args.args[1]])
+            self.assertEqual(3, store.count())
+        store.close()
+
+
+class TestOrgRegistry(TestCase):
+    def test_normalized_lookup(self):
+        from services.org_info import lookup, org_links
+
+        org = lookup("amazon web services")
+        self.assertEqual("Amazon Web Services Training and Certification", org.name)
+        self.assertEqual(org_links("Amazon Web Services Training and Certification"), org.link)
+        self.assertEqual("amazon-web-services", org.anchor)
+        self.assertEqual("ibm", lookup(" IBM ").name.lower())
+
+    def test_unknown_issuer_fallback(self):
+        from services.org_info import lookup
+
+        org = lookup("Unknown Issuer")
+        self.assertEqual((None, None, "..."), (org.logo, org.link, org.description))
+        self.assertEqual("unknown-issuer", org.slug)
+
+
+class TestStreamingRender(TestCase):
+    def test_stream_matches_document(self):
+        from benchmarks.bench_render import synthetic_badges
+
+        badges = synthetic_badges(40)
+        credly = Credly()
+        markdown = credly.generate_md_format(badges)
+        self.assertEqual(markdown, "".join(credly.iter_md_format(badges)))
+
+        sink = io.StringIO()
+        self.assertEqual(len(markdown), credly.write_md_format(badges, sink))
+        self.assertEqual(markdown, sink.getvalue())
+
+
+class TestLayouts(TestCase):
+    def test_grid_layout(self):
+        from benchmarks.bench_render import synthetic_badges
+        from services.layouts import get_layout
+
+        credly = Credly()
+        credly.layout = get_layout("grid")
+        markdown = credly.generate_md_format(synthetic_badges(3, ["Cisco"]))
+        self.assertIn(
+            '<p align="left">\n'
+            '  <a href="https://www.credly.com/org/badge/badge-0" title="Badge 0 - Cisco">'
+            '<img src="https://images.credly.com/size/110x110/images/0/blob.png" width="100"></a>\n',
+            markdown,
+        )
+        self.assertNotIn("<table width=\"100%\"", markdown)
+
+    def test_updater_finds_existing_badges_in_every_layout(self):
+        from benchmarks.bench_render import synthetic_badges
+        from services.recent import CredlyUpdater
+
+        badges = synthetic_badges(5, ["Cisco", "IBM"])
+        for layout in ("table", "grid", "list"):
+            updater = CredlyUpdater("token", layout=layout)
+            readme = "".join(updater.generate_org_section(issuer, [b for b in badges if b["issuer"] == issuer])
+                             for issuer in ("Cisco", "IBM"))
+            existing, orgs = updater.parse_existing_readme(readme)
+            self.assertEqual({badge["title"] for badge in badges}, existing, layout)
+            self.assertEqual({"Cisco", "IBM"}, set(orgs), layout)
+
+            with patch("sys.stdout", new=io.StringIO()):
+                new = [badge for badge in badges if badge["title"] not in existing]
+                self.assertEqual(readme, updater.update_readme_with_new_badges(readme, new), layout)
+
+    def test_updater_sections_match_the_readme_renderer(self):
+        from benchmarks.bench_render import synthetic_badges
+        from services.layouts import get_layout
+        from services.recent import CredlyUpdater
+
+        badges = synthetic_badges(6, ["The Linux Foundation"])
+        badges[4] = dict(badges[4], title="CAPA: Certified Argo Project Associate")
+        for layout in ("table", "grid", "list"):
+            credly = Credly()
+            credly.layout = get_layout(layout)
+            updater = CredlyUpdater("token", layout=layout)
+            section = updater.generate_org_section("The Linux Foundation", badges)
+            self.assertEqual("".join(credly.iter_issuer_section("The Linux Foundation", badges)), section, layout)
+            self.assertIn("</details>\n\n", section)
+            self.assertNotIn("CAPA", section)
+
+    def test_unknown_layout_falls_back_to_table(self):
+        from services.layouts import get_layout
+
+        self.assertEqual("table", get_layout("nope").name)
+        self.assertIs(get_layout("grid"), get_layout("grid"))
+
+
+class TestSectionCache(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_only_changed_issuers_are_rendered(self):
+        from benchmarks.bench_render import synthetic_badges
+
+        badges = synthetic_badges(30, ["Cisco", "IBM", "Red Hat"])
+        with patch('services.credly.CACHE_DIR', new=self.directory):
+            credly = Credly()
+        markdown = credly.generate_md_format(badges)
+        self.assertEqual(3, credly.section_cache.misses)
+
+        badges[0] = dict(badges[0], title="Renamed badge")
+        with patch.object(credly, "iter_issuer_section", wraps=credly.iter_issuer_section) as render:
+            changed = credly.generate_md_format(badges)
+        self.assertEqual([badges[0]["issuer"]], [call.args[0] for call in render.call_args_list])
+        self.assertEqual(2, credly.section_cache.hits)
+        self.assertEqual(markdown.replace("Badge 0 -", "Renamed badge -"), changed)
+
+    def test_prune_keeps_the_most_recently_used_sections(self):
+        from services.section_cache import SectionCache
+
+        cache = SectionCache(self.directory, max_entries=2)
+        for i, key in enumerate(("a", "b", "c")):
+            cache.put(key, key)
+            os.utime(cache.path(key), (1000 + i, 1000 + i))
+        # Reading "a" marks it as used by this run
+        self.assertEqual("a", cache.get("a"))
+        self.assertEqual(1, cache.prune())
+        self.assertEqual(["a.md", "c.md"], sorted(os.listdir(self.directory)))
+
+
+class TestReadmeSplice(TestCase):
+    def test_body_is_taken_literally(self):
+        readme = return_markdown("with_tags_no_text_between.md") + "\nFooter"
+        body = "Badge \\1 with \\g<0> backslashes"
+        self.assertEqual(
+            "# badge-readme\nThis is example file\n<!--START_SECTION:badges-->\n"
+            + body + "\n<!--END_SECTION:badges-->\nFooter",
+            generate_new_readme(body, readme),
+        )
+
+    def test_unchanged_section_returns_same_readme(self):
+        readme = "Intro\n<!--START_SECTION:badges-->\nsame\n<!--END_SECTION:badges-->\n"
+        self.assertIs(readme, generate_new_readme("same", readme))
+
+    def test_spans_first_start_to_last_end(self):
+        from services.readme_splice import find_section
+
+        readme = "a<!--END_SECTION:badges--><!--START_SECTION:badges-->x<!--END_SECTION:badges-->y<!--END_SECTION:badges-->z"
+        begin, finish = find_section(readme)
+        self.assertEqual("a<!--END_SECTION:badges-->", readme[:begin])
+        self.assertEqual("z", readme[finish:])
+        self.assertIsNone(find_section("<!--END_SECTION:badges--><!--START_SECTION:badges-->"))
+
+
+class TestNamedSections(TestCase):
+    def test_all_sections_rendered_in_one_pass(self):
+        from benchmarks.bench_render import synthetic_badges
+        from main import generate_new_readme_sections
+
+        badges = synthetic_badges(6, ["Amazon Web Services Training and Certification", "Cisco"])
+        for i, badge in enumerate(badges):
+            badge["issued_at"] = f"2024-01-0{i + 1}"
+        readme = (
+            "# Me\n"
+            "<!--START_SECTION:badges:recent=2-->\n<!--END_SECTION:badges:recent=2-->\n"
+            "<!--START_SECTION:badges:issuer=AWS-->\nold\n<!--END_SECTION:badges:issuer=AWS-->\n"
+            "<!--START_SECTION:badges:skills-->\n<!--END_SECTION:badges:skills-->\n"
+            "<!--START_SECTION:badges:unknown-->\nkept\n<!--END_SECTION:badges:unknown-->\n"
+            "<!--START_SECTION:badges-->\n<!--END_SECTION:badges-->\n"
+        )
+        credly = Credly()
+        new_readme = generate_new_readme_sections(credly, badges, readme)
+
+        recent = new_readme.split("<!--START_SECTION:badges:recent=2-->")[1].split("<!--END_SECTION")[0]
+        self.assertIn("Badge 5 -", recent)
+        self.assertIn("Badge 4 -", recent)
+        self.assertNotIn("Badge 3 -", recent)
+
+        aws = new_readme.split("<!--START_SECTION:badges:issuer=AWS-->")[1].split("<!--END_SECTION")[0]
+        self.assertIn("### Amazon Web Services Training and Certification (3)", aws)
+        self.assertNotIn("Cisco", aws)
+
+        self.assertIn("| cloud | 5 |", new_readme)
+        self.assertIn("<!--START_SECTION:badges:unknown-->\nkept\n", new_readme)
+        self.assertIn(credly.generate_md_format(badges), new_readme)
+        self.assertIs(new_readme, generate_new_readme_sections(credly, badges, new_readme))
+
+    def test_views_read_from_the_badge_store(self):
+        from benchmarks.bench_render import synthetic_badges
+        from services.views import render_view
+
+        fetched = synthetic_badges(2, ["Cisco"])
+        stored = synthetic_badges(4, ["Amazon Web Services Training and Certification", "IBM"])
+        credly = Credly()
+        credly.store = MagicMock()
+        credly.store.grouped.return_value = credly.group_badges(stored)
+        credly.store.latest.return_value = stored[:2]
+
+        self.assertEqual(credly.generate_md_format(stored), render_view(credly, "badges", fetched))
+        aws = render_view(credly, "badges:issuer=AWS", fetched)
+        self.assertIn("### Amazon Web Services Training and Certification (2)", aws)
+        self.assertEqual("".join(credly.layout.iter_table(stored[:2])), render_view(credly, "badges:recent=2", fetched))
+        credly.store.latest.assert_called_once_with(2)
+        self.assertNotIn("Cisco", render_view(credly, "badges", fetched))
+
+
+class TestBatch(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_report_per_target(self):
+        import batch
+
+        config = self.directory + "/batch.json"
+        report = self.directory + "/report.json"
+        with open(config, "w") as fh:
+            json.dump({"concurrency": 2, "targets": [
+                {"credly_user": "alice", "repository": "alice/alice", "credly_api_token_env": "ALICE_TOKEN"},
+                {"credly_user": "bob", "repository": "bob/bob"},
+            ]}, fh)
+
+        def update_readme(credly, repo_factory, repository):
+            if credly.USER == "bob":
+                raise SystemExit(1)
+            self.assertEqual("secret", credly.API_TOKEN)
+            return "updated"
+
+        with patch.dict("os.environ", {"ALICE_TOKEN": "secret"}), \
+                patch("batch.update_readme", side_effect=update_readme), \
+                patch("github.Github"):
+            self.assertEqual(1, batch.run_batch(config, report))
+
+        with open(report) as fh:
+            results = json.load(fh)
+        self.assertEqual(1, results["failed"])
+        self.assertEqual(["updated", "error"], [result["status"] for result in results["results"]])
+        self.assertIn("no Credly token", results["results"][1]["error"])
+
+    def test_state_and_store_per_target(self):
+        import batch
+
+        config = self.directory + "/batch.json"
+        report = self.directory + "/report.json"
+        with open(config, "w") as fh:
+            json.dump({"targets": [
+                {"credly_user": "alice", "repository": "alice/alice", "credly_api_token_env": "ALICE_TOKEN"},
+                {"credly_user": "bob", "repository": "bob/bob", "credly_api_token_env": "BOB_TOKEN"},
+                {"credly_user": "carol", "repository": "carol/carol", "credly_api_token_env": "CAROL_TOKEN",
+                 "badge_store": self.directory + "/badges-bob.db"},
+            ]}, fh)
+
+        paths = {}
+
+        def update_readme(credly, repo_factory, repository):
+            paths[credly.USER] = (credly.INCREMENTAL_STATE, credly.store.path)
+            return "updated"
+
+        tokens = {"ALICE_TOKEN": "a", "BOB_TOKEN": "b", "CAROL_TOKEN": "c"}
+        with patch.dict("os.environ", tokens), \
+                patch("batch.INCREMENTAL_STATE", new=self.directory + "/state.json"), \
+                patch("batch.BADGE_STORE", new=self.directory + "/badges.db"), \
+                patch("batch.update_readme", side_effect=update_readme), \
+                patch("github.Github"):
+            self.assertEqual(1, batch.run_batch(config, report))
+
+        self.assertEqual((self.directory + "/state-alice.json", self.directory + "/badges-alice.db"), paths["alice"])
+        with open(report) as fh:
+            results = json.load(fh)["results"]
+        # bob's derived store is carol's explicit one, neither of them may write it
+        self.assertEqual(["updated", "error", "error"], [result["status"] for result in results])
+        self.assertIn("more than one target", results[2]["error"])
+
+
+class TestGithubPublisher(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_single_commit_with_assets(self):
+        from fake_github import FakeGithub
+        from services.githubPublisher import GithubPublisher
+
+        with FakeGithub(readme="# Me\n") as github, patch("services.githubPublisher.CACHE_DIR", new=self.directory):
+            publisher = GithubPublisher("owner/repo", token="t", api_url=github.url, commit_message="Update")
+            self.assertEqual("# Me\n", publisher.get_readme())
+            self.assertNotIn(("GET", ""), github.requests)
+
+            publisher.save_readme("# Me\nbadges\n", {"badges/badges.json": "[]", "badges/wall.png": b"\x89PNG"})
+            files = github.head_files()
+            self.assertEqual(b"# Me\nbadges\n", files["README.md"])
+            self.assertEqual(b"\x89PNG", files["badges/wall.png"])
+            self.assertEqual(1, sum(method == "PATCH" for method, _ in github.requests))
+            self.assertEqual("Update", github.commits[github.refs["main"]]["message"])
+
+            GithubPublisher("owner/repo", token="t", api_url=github.url)
+            cached = GithubPublisher("owner/repo", token="t", api_url=github.url)
+            self.assertEqual(1, github.not_modified)
+            self.assertEqual("# Me\nbadges\n", cached.get_readme())
+
+    def test_readme_edited_since_read_is_not_overwritten(self):
+        from fake_github import FakeGithub
+        from services.githubPublisher import GithubPublisher
+
+        with FakeGithub(readme="# Me\n") as github:
+            publisher = GithubPublisher("owner/repo", token="t", api_url=github.url)
+            github.edit("README.md", "# Me, edited by hand\n")
+            github.edit("notes.md", "unrelated\n")
+            with patch("sys.stdout", new=io.StringIO()), self.assertRaises(SystemExit):
+                publisher.save_readme("# Me\nbadges\n")
+            self.assertEqual(b"# Me, edited by hand\n", github.head_files()["README.md"])
+
+            # Other files changing in between is fine, the commit goes on top of them
+            publisher = GithubPublisher("owner/repo", token="t", api_url=github.url)
+            github.edit("notes.md", "more notes\n")
+            publisher.save_readme("# Me\nbadges\n")
+            self.assertEqual(b"# Me\nbadges\n", github.head_files()["README.md"])
+            self.assertEqual(b"more notes\n", github.head_files()["notes.md"])
+
+    def test_stale_generated_files_are_deleted(self):
+        from fake_github import FakeGithub
+        from services.githubPublisher import GithubPublisher
+
+        with FakeGithub(readme="# Me\n") as github:
+            github.edit("badges/wall-old.svg", "<svg/>")
+            github.edit("site/data/date-0000-old.json", "[]")
+            github.edit("badges/logo.svg", "<svg/>")
+            publisher = GithubPublisher("owner/repo", token="t", api_url=github.url)
+            publisher.save_readme(
+                "# Me\nwall\n", {"badges/wall-new.svg": "<svg/>", "site/data/date-0000-new.json": "[]"},
+                {"badges/wall-*.svg", "badges/wall-*.png", "site/data/*.json"},
+            )
+            files = github.head_files()
+            self.assertIn("badges/wall-new.svg", files)
+            self.assertIn("site/data/date-0000-new.json", files)
+            self.assertIn("badges/logo.svg", files)
+            self.assertNotIn("badges/wall-old.svg", files)
+            self.assertNotIn("site/data/date-0000-old.json", files)
+
+    def test_truncated_tree_is_read_by_folder(self):
+        from fake_github import FakeGithub
+        from services.githubPublisher import GithubPublisher
+
+        with FakeGithub(readme="# Me\n") as github:
+            github.edit("badges/wall-old.svg", "<svg/>")
+            github.edit("badges/images/kept.png", "png")
+            github.edit("docs/notes.md", "notes")
+            github.truncate_trees = True
+            publisher = GithubPublisher("owner/repo", token="t", api_url=github.url)
+            with patch("sys.stdout", new=io.StringIO()):
+                publisher.save_readme(
+                    "# Me\nwall\n", {"badges/wall-new.svg": "<svg/>", "badges/images/kept.png": b"png"},
+                    {"badges/wall-*.svg"},
+                )
+            files = github.head_files()
+            self.assertEqual(
+                ["README.md", "badges/images/kept.png", "badges/wall-new.svg", "docs/notes.md"], sorted(files),
+            )
+            # The unchanged image was found in its folder and not uploaded again
+            self.assertEqual(0, sum(path == "/git/blobs" for _, path in github.requests))
+
+    def test_pygithub_publisher_commits_assets_at_once(self):
+        import base64
+        from fake_github import FakeGithub
+        from services.githubRepo import GithubRepo
+        from services.readme_splice import git_blob_sha
+
+        with FakeGithub(readme="# Me\n") as github, patch("services.githubPublisher.GH_API_URL", new=github.url):
+            client = MagicMock()
+            repo = client.get_repo.return_value
+            repo.full_name = "owner/repo"
+            repo.get_readme.return_value = MagicMock(
+                path="README.md", sha=git_blob_sha("# Me\n"), content=base64.b64encode(b"# Me\n"),
+            )
+            commits = len(github.commits)
+            GithubRepo("owner/repo", client).save_readme(
+                "# Me\nbadges\n", {f"badges/images/{i}.png": b"\x89PNG" + bytes([i]) for i in range(20)},
+            )
+            self.assertEqual(commits + 1, len(github.commits))
+            self.assertEqual(b"# Me\nbadges\n", github.head_files()["README.md"])
+            self.assertEqual(21, len(github.head_files()))
+            repo.create_file.assert_not_called()
+            repo.update_file.assert_not_called()
+
+
+class TestNoOpDetection(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def repo(self, readme):
+        from services.readme_splice import git_blob_sha
+
+        repo = MagicMock(sha=git_blob_sha(readme))
+        repo.get_readme.return_value = readme
+        return repo
+
+    def test_state_skips_github_when_sections_unchanged(self):
+        from benchmarks.bench_render import synthetic_badges
+        import main
+
+        credly = Credly()
+        badges = synthetic_badges(5)
+        readme = "# Me\n<!--START_SECTION:badges-->\n<!--END_SECTION:badges-->\n"
+        repo = self.repo(readme)
+        with patch.object(credly, "get_badges", return_value=badges), \
+                patch("main.CACHE_DIR", new=self.directory):
+            self.assertEqual("updated", main.update_readme(credly, lambda: repo, "me/me"))
+            written = repo.save_readme.call_args.args[0]
+
+            # Same README on GitHub: the blob sha matches, nothing is written
+            same = self.repo(written)
+            shutil.rmtree(self.directory + "/state")
+            self.assertEqual("unchanged", main.update_readme(credly, lambda: same, "me/me"))
+            same.save_readme.assert_not_called()
+
+            # Same rendered sections and README: only the README sha is asked for
+            factory = MagicMock()
+            sha = MagicMock(return_value=same.sha)
+            self.assertEqual("unchanged", main.update_readme(credly, factory, "me/me", sha))
+            factory.assert_not_called()
+            sha.assert_called_once_with("me/me")
+
+            # README edited by hand since (here: the badges removed): it is repaired
+            edited = self.repo(readme)
+            self.assertEqual("updated", main.update_readme(credly, lambda: edited, "me/me", lambda repository: edited.sha))
+            self.assertEqual(written, edited.save_readme.call_args.args[0])
+
+    def test_readme_sha_network_error_falls_through(self):
+        import requests
+        import main
+
+        with patch("services.githubPublisher.http_client.request", side_effect=requests.ConnectionError("down")), \
+                patch("sys.stdout", new=io.StringIO()):
+            self.assertIsNone(main.remote_readme_sha("me/me"))
+
+    def test_git_blob_sha(self):
+        from services.readme_splice import git_blob_sha
+
+        # `printf 'hello\n' | git hash-object --stdin`
+        self.assertEqual("ce013625030ba8dba906f756967f9e9ca394464a", git_blob_sha("hello\n"))
+
+
+class TestImageMirror(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_downloads_once_and_rewrites_links(self):
+        from services.assets import ImageMirror
+
+        markdown = (
+            '<img src="https://images.credly.com/size/110x110/images/a/blob.png" width="100">\n'
+            "<img src='https://images.credly.com/size/400x400/images/logo/blob.png' height='100' />\n"
+            '<img src="https://images.credly.com/size/110x110/images/a/blob.png" width="100">\n'
+            '<img src="https://example.com/other.png">\n'
+        )
+        response = MagicMock(status_code=200, content=b"image-bytes")
+        with patch("services.assets.http_client.get", return_value=response) as get, \
+                patch("services.assets.resize", side_effect=lambda data, size: (data + b"-small", True)):
+            mirror = ImageMirror(self.directory, 110, "badges/images")
+            rewritten = mirror.rewrite(markdown)
+            self.assertEqual(2, get.call_count)
+
+            again = ImageMirror(self.directory, 110, "badges/images")
+            self.assertEqual(rewritten, again.rewrite(markdown))
+            self.assertEqual(2, get.call_count)
+
+        self.assertNotIn("images.credly.com", rewritten)
+        self.assertIn('<img src="https://example.com/other.png">', rewritten)
+        # Both URLs served the same bytes: one content-addressed file
+        self.assertEqual([b"image-bytes-small"], list(again.assets.values()))
+        path = list(again.assets)[0]
+        self.assertTrue(path.startswith("badges/images/") and path.endswith("-110.png"))
+        self.assertIn(f"src='{path}'", rewritten)
+
+    def test_undecodable_and_failed_images_do_not_abort(self):
+        import requests
+        from services.assets import ImageMirror
+
+        svg = b'<svg xmlns="http://www.w3.org/2000/svg"/>'
+        markdown = (
+            '<img src="https://images.credly.com/images/a/logo.svg">\n'
+            '<img src="https://images.credly.com/images/b/down.png">\n'
         )
 
-        self.assertEqual(no_changes, new_readme)
\ No newline at end of file
+        def get(url, *args, **kwargs):
+            if url.endswith("down.png"):
+                raise requests.ConnectionError("unreachable")
+            return MagicMock(status_code=200, content=svg)
+
+        with patch("services.assets.http_client.get", side_effect=get), patch("sys.stdout", new=io.StringIO()):
+            mirror = ImageMirror(self.directory, 110, "badges/images")
+            rewritten = mirror.rewrite(markdown)
+
+        # The SVG cannot be resized: published as is, with its extension
+        self.assertEqual([svg], list(mirror.assets.values()))
+        self.assertTrue(list(mirror.assets)[0].endswith(".svg"))
+        self.assertIn('<img src="https://images.credly.com/images/b/down.png">', rewritten)
+
+
+class TestBadgeWall(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def png(self, color):
+        from PIL import Image
+
+        out = io.BytesIO()
+        Image.new("RGBA", (20, 20), color).save(out, format="PNG")
+        return out.getvalue()
+
+    def wall(self, images):
+        from services.assets import ImageMirror
+        from services.badge_wall import BadgeWall
+
+        mirror = ImageMirror(self.directory + "/images", 20)
+        responses = lambda url: MagicMock(status_code=200, content=images[url])
+        with patch("services.assets.http_client.get", side_effect=responses):
+            mirror.mirror(list(images))
+        return BadgeWall(self.directory + "/wall", mirror, columns=2)
+
+    def test_svg_links_and_incremental_tiles(self):
+        from benchmarks.bench_render import synthetic_badges
+
+        badges = synthetic_badges(3)
+        images = {badge["img"]: self.png((i * 80, 0, 0, 255)) for i, badge in enumerate(badges)}
+        wall = self.wall(images)
+        snippet, files = wall.render(badges, "badges/wall", "svg", "https://www.credly.com/users/me/badges")
+        (path, data), = files.items()
+        self.assertEqual(f"[![Credly badges]({path})](https://www.credly.com/users/me/badges)", snippet)
+        self.assertEqual(3, data.decode().count('<a href="https://www.credly.com/org/badge/badge-'))
+        self.assertEqual(3, wall.repainted)
+
+        badges[1] = dict(badges[1], title="Renamed")
+        wall = self.wall(images)
+        wall.render(badges, "badges/wall", "svg")
+        self.assertEqual(1, wall.repainted)
+
+    def test_png_repaints_changed_tiles(self):
+        from benchmarks.bench_render import synthetic_badges
+
+        badges = synthetic_badges(4)
+        images = {badge["img"]: self.png((0, i * 60, 0, 255)) for i, badge in enumerate(badges)}
+        self.wall(images).render(badges, "badges/wall", "png")
+
+        badges[3] = dict(badges[3], title="Renamed")
+        wall = self.wall(images)
+        snippet, files = wall.render(badges, "badges/wall", "png")
+        self.assertEqual(1, wall.repainted)
+        self.assertTrue(list(files)[0].endswith(".png"))
+
+    def test_render_wall_reuses_the_run_mirror(self):
+        from benchmarks.bench_render import synthetic_badges
+        from services.assets import ImageMirror
+        from services.views import render_wall
+
+        badges = synthetic_badges(2)
+        images = {badge["img"]: self.png((0, 0, i * 90, 255)) for i, badge in enumerate(badges)}
+        responses = lambda url: MagicMock(status_code=200, content=images[url])
+        walls = []
+        with patch("services.assets.http_client.get", side_effect=responses) as get, \
+                patch("services.assets.CACHE_DIR", new=self.directory), \
+                patch("services.views.WALL_FORMAT", new="png"):
+            mirror = ImageMirror(self.directory + "/images", 20, "badges/images")
+            mirror.mirror(list(images))
+            for user, argument in (("alice", ""), ("bob", ""), ("alice", "1")):
+                credly = Credly()
+                credly.USER = user
+                credly.mirror = mirror
+                render_wall(credly, badges, argument)
+                walls.append(credly.prune)
+        self.assertEqual(2, get.call_count)
+        self.assertEqual({"badges/wall-*.svg", "badges/wall-*.png"}, walls[0])
+        # Each target, and each wall section of a target, keeps its own wall between runs
+        self.assertEqual(3, len([name for name in os.listdir(self.directory + "/wall") if name.endswith(".png")]))
+
+
+class TestStaticSite(TestCase):
+    def test_shards_manifest_and_issuer_ranges(self):
+        from benchmarks.bench_render import synthetic_badges
+        from services.static_site import StaticSite
+
+        badges = synthetic_badges(25)
+        for i, badge in enumerate(badges):
+            badge["issued_at"] = f"2024-01-{i + 1:02d}T00:00:00.000Z"
+        files = StaticSite("site", shard_size=10).build(badges)
+        manifest = json.loads(files["site/manifest.json"])
+        self.assertEqual(25, manifest["total"])
+        self.assertIn("site/index.html", files)
+
+        newest = json.loads(files["site/" + manifest["orders"]["date"][0]])
+        self.assertEqual(10, len(newest))
+        self.assertEqual("2024-01-25T00:00:00.000Z", newest[0]["issued_at"])
+
+        by_issuer = [record for name in manifest["orders"]["issuer"] for record in json.loads(files["site/" + name])]
+        self.assertEqual(25, len(by_issuer))
+        for entry in manifest["issuers"]:
+            shards = manifest["orders"]["issuer"][entry["first"]:entry["last"] + 1]
+            records = [r for name in shards for r in json.loads(files["site/" + name]) if r["issuer"] == entry["name"]]
+            self.assertEqual(entry["count"], len(records))
+
+    def test_unchanged_shards_keep_their_names(self):
+        from benchmarks.bench_render import synthetic_badges
+        from services.static_site import StaticSite
+
+        site = StaticSite("", shard_size=5)
+        badges = synthetic_badges(12)
+        before = site.build(badges)
+        badges[-1] = dict(badges[-1], title="zzz Renamed")
+        after = site.build(badges)
+        self.assertTrue(set(before) & set(after) - {"manifest.json", "index.html"})
+        self.assertNotEqual(before["manifest.json"], after["manifest.json"])
+
+
+class TestBadgeRecord(TestCase):
+    def api_badge(self, id, description="Learn things"):
+        return {
+            "id": id,
+            "state_updated_at": "2024-01-01",
+            "issued_at": "2024-01-01",
+            "issuer": {"entities": [{"entity": {"name": "".join(["Acme ", "Corp"])}}]},
+            "badge_template": {
+                "id": "tpl-1",
+                "name": "Acme Badge",
+                "url": "https://www.credly.com/org/acme/badge/acme-badge",
+                "image_url": "https://images.credly.com/images/acme/blob.png",
+                "description": description,
+                "time_to_earn": "Hours",
+                "skills": ["a", "b"],
+                "level": "Foundational",
+                "badge_template_activities": [{"title": "Pass the exam"}],
+            },
+        }
+
+    def test_users_share_templates(self):
+        from services.badge import badge_from_api
+
+        first = badge_from_api(self.api_badge("1"), 110)
+        second = badge_from_api(self.api_badge("2"), 110)
+        self.assertIs(first.template, second.template)
+        self.assertIs(first["issuer"], second["issuer"])
+        self.assertEqual("https://images.credly.com/size/110x110/images/acme/blob.png", first["img"])
+        self.assertEqual("Pass the exam", first["criteria"])
+        self.assertEqual("2", second["id"])
+
+        changed = badge_from_api(self.api_badge("3", "New description"), 110)
+        self.assertIsNot(first.template, changed.template)
+        self.assertEqual("New description", changed["description"])
+
+    def test_reads_and_renders_like_a_dict(self):
+        from services.badge import badge_from_api, badge_from_fields
+        from services.layouts import get_layout
+
+        badge = badge_from_api(self.api_badge("1", " ".join(["word"] * 30)), 110)
+        fields = dict(badge)
+        self.assertEqual(fields, badge)
+        self.assertIsNone(badge.get("missing"))
+        self.assertEqual(fields, dict(badge_from_fields(fields)))
+        layout = get_layout("table")
+        self.assertEqual("".join(layout.iter_table([fields])), "".join(layout.iter_table([badge])))
+        self.assertEqual("".join(layout.iter_table([fields], True)), "".join(layout.iter_table([badge], True)))
+
+
+class TestPageParser(TestCase):
+    def page(self, count):
+        badge = TestBadgeRecord().api_badge
+        badges = []
+        for i in range(count):
+            raw = badge(str(i), f"Description {i}")
+            raw["image"] = {"url": "https://images.credly.com/x.png"}
+            raw["badge_template"]["owner"] = {"name": "unused", "vanity_slug": "acme"}
+            raw["badge_template"]["badge_template_activities"].append("not a dict")
+            badges.append(raw)
+        return {"data": badges, "metadata": {"count": count, "next_page_url": None}}
+
+    def test_slim_page_converts_like_the_full_page(self):
+        from services.badge import badge_from_api
+        from services.page_parser import parse_page
+
+        full = self.page(3)
+        text = json.dumps(full, indent=2)
+        slim = parse_page(text)
+        self.assertEqual(full["metadata"], slim["metadata"])
+        self.assertNotIn("image", slim["data"][0])
+        self.assertNotIn("owner", slim["data"][0]["badge_template"])
+        self.assertEqual(
+            [dict(badge_from_api(badge, 110)) for badge in full["data"]],
+            [dict(badge_from_api(badge, 110)) for badge in slim["data"]],
+        )
+
+    def test_edge_shapes(self):
+        from services.page_parser import parse_page
+
+        self.assertEqual({}, parse_page(" {} "))
+        self.assertEqual({"data": [], "metadata": {}}, parse_page('{"data": [ ], "metadata": {}}'))
+        with self.assertRaises(ValueError):
+            parse_page('{"data": [{"id": 1} {"id": 2}]}')
+
+    def test_chunks_decode_like_the_whole_page(self):
+        from services.page_parser import parse_page
+
+        full = self.page(4)
+        full["data"][0]["badge_template"]["description"] = "Prüfung für Fortgeschrittene"
+        full["metadata"]["total_count"] = 123456
+        body = json.dumps(full, ensure_ascii=False).encode("utf-8")
+        expected = parse_page(body.decode("utf-8"))
+        for size in (1, 5, 64):
+            self.assertEqual(expected, parse_page(body[i:i + size] for i in range(0, len(body), size)))
+        with self.assertRaises(ValueError):
+            parse_page([body[:-10]])
+
+    def test_fetched_page_is_not_buffered(self):
+        from unittest.mock import PropertyMock
+
+        body = json.dumps(self.page(3)).encode("utf-8")
+        response = MagicMock(status_code=200, headers={})
+        type(response).text = PropertyMock(side_effect=AssertionError("the body was buffered"))
+        response.iter_content.side_effect = lambda size: (body[i:i + size] for i in range(0, len(body), size))
+        with patch("services.credly.http_client.get", return_value=response) as get, \
+                patch("sys.stdout", new=io.StringIO()):
+            data = Credly().fetch_page(1)
+        self.assertTrue(get.call_args.kwargs["stream"])
+        self.assertEqual(3, len(data["data"]))
+
+
+class TestPipeline(TestCase):
+    def pages(self, count, fail_at=None):
+        for number in range(1, count + 1):
+            if number == fail_at:
+                raise ConnectionError("page failed")
+            yield {"data": [{"id": f"{number}-{i}", "issuer": ["b", "A", "a"][(number + i) % 3]} for i in range(3)]}
+
+    def test_groups_like_group_badges(self):
+        from services.pipeline import Pipeline
+
+        badges, grouped = Pipeline(self.pages(6), dict, depth=1).run()
+        self.assertEqual([f"{n}-{i}" for n in range(1, 7) for i in range(3)], [b["id"] for b in badges])
+        expected = Credly().group_badges(badges)
+        self.assertEqual(list(expected), list(grouped))
+        self.assertEqual(expected, grouped)
+
+    def test_fetch_error_cancels_every_stage(self):
+        import threading
+        from services.pipeline import Pipeline
+
+        pipeline = Pipeline(self.pages(50, fail_at=5), dict, depth=1)
+        with self.assertRaises(ConnectionError):
+            pipeline.run()
+        self.assertFalse([t for t in threading.enumerate() if t.name.startswith("pipeline-")])
+
+    def test_backpressure(self):
+        import time
+        from services.pipeline import Pipeline
+
+        produced = []
+
+        def pages():
+            for number in range(20):
+                produced.append(number)
+                yield {"data": [{"id": number, "issuer": "x"}]}
+
+        def slow(badge):
+            # The fetch stage can be at most two queues and one page ahead
+            self.assertLessEqual(len(produced) - badge["id"], 5)
+            time.sleep(0.005)
+            return badge
+
+        badges, _ = Pipeline(pages(), slow, depth=1).run()
+        self.assertEqual(20, len(badges))
+
+    def test_credly_reuses_pipeline_groups(self):
+        credly = Credly()
+        credly.PIPELINE = True
+        raw = [TestBadgeRecord().api_badge(str(i)) for i in range(3)]
+        with patch.object(credly, "iter_pages", return_value=iter([{"data": raw}])):
+            badges = credly.get_badges()
+        self.assertEqual(3, len(badges))
+        self.assertIs(credly.grouped[1], credly.group_badges(badges))
+        self.assertIsNot(credly.grouped[1], credly.group_badges(list(badges)))
+
+
+class TestBenchmarkSuite(TestCase):
+    def test_report_and_regression_check(self):
+        from benchmarks import suite
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        output = directory + "/bench.json"
+        with patch("sys.stdout", new=io.StringIO()):
+            self.assertEqual(0, suite.main(["--badges", "60", "--issuers", "3", "--repeat", "1", "--output", output]))
+        with open(output) as fh:
+            report = json.load(fh)
+        self.assertEqual(list(suite.STAGES), [result["stage"] for result in report["results"]])
+        self.assertTrue(all(result["seconds"] > 0 and result["peak_bytes"] > 0 for result in report["results"]))
+
+        slower = {"results": [dict(result, seconds=result["seconds"] + 1) for result in report["results"]]}
+        self.assertEqual(len(suite.STAGES), len(suite.regressions(slower, report, 0.25)))
+        self.assertEqual([], suite.regressions(report, slower, 0.25))
+
+
+class TestLocalCredlyServer(TestCase):
+    def server(self, per_page=50, **options):
+        from benchmarks.payload import api_badges
+        from benchmarks.server import BadgeServer
+
+        return BadgeServer(api_badges(120, 5), per_page=per_page, **options)
+
+    def credly(self, url, cache_dir="", token="secret"):
+        with patch('services.credly.CACHE_DIR', new=cache_dir):
+            credly = Credly(api_token=token)
+        credly.BASE_URL = url
+        credly.CONCURRENCY = 3
+        return credly
+
+    def test_fetch_through_injected_faults(self):
+        with self.server(per_page=10, rate_limit_rate=0.3, error_rate=0.2, retry_after=0, seed=3) as server, \
+                patch('services.credly.CREDLY_RATE_LIMIT', new=0), \
+                patch('services.http_client.HTTP_RETRIES', new=20), \
+                patch('services.http_client.HTTP_BACKOFF', new=0):
+            badges = self.credly(server.url).fetch_badges()
+        self.assertEqual([f"badge-{i:06d}" for i in range(120)], [badge["id"] for badge in badges])
+        self.assertEqual(12, server.statuses[200])
+        self.assertTrue(server.statuses[429] and server.statuses[503])
+
+    def test_etag_revalidation_and_recent_updater(self):
+        from services.recent import CredlyUpdater
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        with self.server(token="secret") as server, patch('services.credly.CREDLY_RATE_LIMIT', new=0):
+            self.assertEqual([], self.credly(server.url, directory, token="wrong").get_badges())
+            credly = self.credly(server.url, directory)
+            self.assertEqual(120, len(credly.get_badges()))
+            credly.persist()
+            credly = self.credly(server.url, directory)
+            self.assertIsNone(credly.get_badges())
+            self.assertTrue(credly.not_modified())
+
+            updater = CredlyUpdater("secret")
+            updater.base_url = server.url
+            self.assertEqual(50, len(updater.fetch_latest_badges()))
+        self.assertEqual({200: 4, 304: 3, 401: 1}, dict(server.statuses))
+
+
+class TestRunMetrics(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_wall_time_and_explicit_tracking(self):
+        from services import http_client
+        from services.metrics import RunMetrics
+
+        metrics = RunMetrics()
+        self.assertNotIn(metrics.http, http_client.tracked())
+        with patch("services.metrics.time.perf_counter", side_effect=[10.0, 11.0, 12.0, 20.0]):
+            metrics.start()
+            self.assertEqual((metrics.http,), http_client.tracked())
+            with metrics.stage("fetch"):
+                pass
+            metrics.stop()
+        report = metrics.report()
+        self.assertEqual(10.0, report["seconds"])
+        self.assertEqual({"fetch": 1.0}, report["stages"])
+        self.assertEqual((), http_client.tracked())
+
+    def test_http_counters_are_per_run(self):
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        from services import http_client
+        from services.metrics import RunMetrics
+
+        session = MagicMock()
+        session.request.return_value = MagicMock(status_code=200, content=b"12345")
+        reports = {}
+
+        def run(name, requests):
+            metrics = RunMetrics()
+            metrics.start()
+            # Half of the requests from a worker of the run, like the concurrent page fetch
+            with ThreadPoolExecutor(2, initializer=http_client.track, initargs=http_client.tracked()) as executor:
+                list(executor.map(lambda _: http_client.get("https://example.com"), range(requests // 2)))
+            for _ in range(requests - requests // 2):
+                http_client.get("https://example.com")
+            reports[name] = metrics.report()["counters"]
+
+        with patch("services.http_client.get_session", return_value=session), patch("sys.stdout", new=io.StringIO()):
+            threads = [threading.Thread(target=run, args=args) for args in (("a", 3), ("b", 8))]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual({"requests": 3, "bytes": 15, "retries": 0}, reports["a"])
+        self.assertEqual({"requests": 8, "bytes": 40, "retries": 0}, reports["b"])
+
+    def test_stages_counters_and_summary(self):
+        from benchmarks.payload import api_badges
+        from benchmarks.server import BadgeServer
+        from services.metrics import write_step_summary
+        from services.readme_splice import git_blob_sha
+        import main
+
+        readme = "# Me\n<!--START_SECTION:badges-->\n<!--END_SECTION:badges-->\n"
+        repo = MagicMock(sha=git_blob_sha(readme))
+        repo.get_readme.return_value = readme
+        with BadgeServer(api_badges(30, 4), per_page=10) as server, \
+                patch('services.credly.CREDLY_RATE_LIMIT', new=0):
+            credly = Credly()
+            credly.BASE_URL = server.url
+            credly.CONCURRENCY = 2
+            credly.metrics.start()
+            status = main.update_readme(credly, lambda: repo, "me/me")
+            credly.metrics.stop()
+        report = credly.metrics_report(status)
+
+        self.assertEqual("updated", report["status"])
+        self.assertEqual(["fetch", "convert", "group", "render", "splice", "publish"], list(report["stages"]))
+        self.assertEqual(3, report["counters"]["pages"])
+        self.assertEqual(3, report["counters"]["requests"])
+        self.assertEqual(30, report["counters"]["badges"])
+        self.assertEqual(4, report["counters"]["issuers"])
+        # Wall time of the whole run, which covers every stage
+        self.assertGreaterEqual(report["seconds"], max(report["stages"].values()))
+
+        summary = self.directory + "/summary.md"
+        self.assertTrue(write_step_summary(report, summary))
+        with open(summary) as fh:
+            text = fh.read()
+        self.assertIn("| fetch |", text)
+        self.assertIn("| badges | 30 |", text)
+
+    def test_profiled_writes_output(self):
+        from services.metrics import profiled
+
+        for mode, files in (("cprofile", ["run.prof", "run.txt"]), ("tracemalloc", ["run.txt"])):
+            output = f"{self.directory}/{mode}/run"
+            with patch("sys.stdout", new=io.StringIO()), profiled(mode, output):
+                sorted(range(1000), key=str)
+            self.assertEqual(files, sorted(os.listdir(os.path.dirname(output))))
+
+
+class TestImportBudget(TestCase):
+    # Seconds `import main` may add to a bare interpreter startup; about 60 ms today.
+    # Slow machines get up to BUDGET_FACTOR times their own bare startup instead.
+    BUDGET = 0.25
+    BUDGET_FACTOR = 5
+    LAZY = ("requests", "github", "PIL", "lxml", "bs4", "cProfile", "tracemalloc")
+
+    def startup(self, code, root):
+        """Fastest of three wall times of `python -c code`, and the last run's output."""
+        import subprocess, sys, time
+
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            output = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+            timings.append(time.perf_counter() - start)
+        return min(timings), output.stdout
+
+    def test_main_imports_fast_and_lazily(self):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        bare, _ = self.startup("pass", root)
+        seconds, output = self.startup(
+            f"import sys, json, main; print(json.dumps([m for m in {self.LAZY!r} if m in sys.modules]))", root,
+        )
+        self.assertEqual([], json.loads(output.strip().splitlines()[-1]))
+        self.assertLess(seconds - bare, max(self.BUDGET, self.BUDGET_FACTOR * bare))
+
+
+class TestProfileParser(TestCase):
+    def test_file_gives_badge_records(self):
+        badges = Credly(FOLDER_HTML + "happy_day.html").get_badges()
+
+        self.assertEqual(9, len(badges))
+        first = badges[0]
+        self.assertEqual("Docker Essentials: A Developer Introduction", first["title"])
+        self.assertEqual("IBM", first["issuer"])
+        self.assertEqual("https://www.credly.com/badges/24bcb006-58f8-494c-85e3-dfee10ea7b57", first["href"])
+        self.assertEqual("24bcb006-58f8-494c-85e3-dfee10ea7b57", first["id"])
+        self.assertEqual(
+            "https://images.credly.com/size/110x110/images/08216781-93cb-4ba1-8110-8eb3401fa8ce/Docker_Essentials_-_ISDN.png",
+            first["img"],
+        )
+        self.assertEqual([], Credly(FOLDER_HTML + "no_badges.html").get_badges())
+
+    def test_small_chunks_and_badge_size(self):
+        from services.profile_parser import parse_profile, read_chunks
+
+        whole = parse_profile(read_chunks(FOLDER_HTML + "happy_day.html"), "110")
+        chunked = parse_profile(read_chunks(FOLDER_HTML + "happy_day.html", 97), "110")
+        self.assertEqual([dict(badge) for badge in whole], [dict(badge) for badge in chunked])
+
+        resized = parse_profile(read_chunks(FOLDER_HTML + "happy_day.html"), "200")
+        self.assertTrue(all("/size/200x200/images/" in badge["img"] for badge in resized))
+
+    def test_profile_url_without_token(self):
+        with open(FOLDER_HTML + "happy_day.html", "rb") as fh:
+            page = fh.read()
+        response = MagicMock(status_code=200)
+        response.iter_content.side_effect = lambda size: (page[i:i + size] for i in range(0, len(page), size))
+
+        with patch("services.credly.CREDLY_SOURCE", new="profile"), \
+                patch("services.credly.http_client.get", return_value=response) as get:
+            credly = Credly(user="someone")
+            badges = credly.get_badges()
+
+        self.assertEqual("https://www.credly.com/users/someone/badges", get.call_args[0][0])
+        self.assertNotIn("Authorization", get.call_args[1]["headers"])
+        self.assertEqual(9, len(badges))
+        self.assertEqual(["IBM"], list(credly.grouped[1]))
+
+    def test_profile_url_is_streamed(self):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        import threading
+        from services import http_client, profile_parser
+
+        with open(FOLDER_HTML + "happy_day.html", "rb") as fh:
+            page = fh.read()
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html")
+                self.send_header("Content-Length", str(len(page)))
+                self.end_headers()
+                self.wfile.write(page)
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        responses = []
+        get = http_client.get
+
+        def parse(chunks, size):
+            # Nothing of the body may have been read before the parser pulls it
+            self.assertFalse(responses[0]._content_consumed)
+            return profile_parser.parse_profile(chunks, size)
+
+        try:
+            with patch("services.credly.CREDLY_SOURCE", new="profile"), \
+                    patch("services.credly.http_client.get", side_effect=lambda *a, **k: responses.append(get(*a, **k)) or responses[-1]), \
+                    patch("services.credly.parse_profile", side_effect=parse):
+                credly = Credly(user="someone")
+                credly.PROFILE_URL = f"http://127.0.0.1:{server.server_port}/users/someone/badges"
+                before = http_client.stats["bytes"]
+                badges = credly.get_badges()
+                read = http_client.stats["bytes"] - before
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(9, len(badges))
+        self.assertEqual(len(page), read)